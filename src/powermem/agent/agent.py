@@ -479,7 +479,8 @@ class AgentMemory:
         self,
         user_id: Optional[str] = None,
         agent_id: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        offset: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Get all memories with optional filtering.
@@ -488,6 +489,7 @@ class AgentMemory:
             user_id: Optional user ID filter
             agent_id: Optional agent ID filter
             limit: Maximum number of results
+            offset: Number of results to skip
             
         Returns:
             List of all memory dictionaries
@@ -507,7 +509,7 @@ class AgentMemory:
                     filters=filters
                 )
                 
-                return results[:limit]
+                return results[offset:offset + limit]
             else:
                 # Fallback to base memory
                 # Use agent manager for get_all
@@ -523,6 +525,48 @@ class AgentMemory:
             logger.error(f"Failed to get all memories: {e}")
             raise
     
+    def get_by_ids(
+        self,
+        agent_id: str,
+        memory_ids: List[Union[int, str]],
+        user_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get an agent's memories with the given IDs.
+        
+        IDs are compared as strings, so int and str IDs match interchangeably.
+        
+        Args:
+            agent_id: Agent ID
+            memory_ids: IDs of the memories to return
+            user_id: Optional user ID filter
+            
+        Returns:
+            List of matching memory dictionaries, in storage order
+        """
+        if not self._initialized:
+            raise RuntimeError("AgentMemory not initialized")
+        
+        if not memory_ids:
+            return []
+        
+        if not hasattr(self._agent_manager, 'get_memories'):
+            raise RuntimeError("Get by IDs not supported by current manager")
+        
+        try:
+            wanted = {str(memory_id) for memory_id in memory_ids}
+            results = self._agent_manager.get_memories(
+                agent_id=agent_id,
+                filters={'user_id': user_id} if user_id else {}
+            )
+            return [
+                memory for memory in results
+                if str(memory.get('id') or memory.get('memory_id')) in wanted
+            ]
+        except Exception as e:
+            logger.error(f"Failed to get memories by IDs: {e}")
+            raise
+    
     def update(
         self,
         memory_id: str,
@@ -768,6 +812,52 @@ class AgentMemory:
         else:
             raise RuntimeError("Memory sharing not supported by current manager")
     
+    def share_memories(self, memory_ids: List[str], from_agent: str, to_agents: List[str], permissions: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Share several memories between agents in one call (multi-agent mode only).
+        
+        Memories that cannot be shared (not found, missing permission, or an
+        unsuccessful result) are reported in 'failed' instead of aborting the batch.
+        
+        Args:
+            memory_ids: IDs of the memories to share
+            from_agent: ID of the agent sharing the memories
+            to_agents: List of agent IDs to share with
+            permissions: Optional list of permissions to grant
+            
+        Returns:
+            Dictionary containing 'shared_count', 'shared' and 'failed' memory ID lists
+        """
+        if self.mode not in ['multi_agent', 'hybrid']:
+            raise RuntimeError(f"share_memories() not supported in {self.mode} mode")
+        
+        if not hasattr(self._agent_manager, 'share_memory'):
+            raise RuntimeError("Memory sharing not supported by current manager")
+        
+        share_memory = self._agent_manager.share_memory
+        shared = []
+        failed = []
+        for memory_id in memory_ids:
+            # One bad memory must not abort the batch: anything that goes wrong
+            # (including an unexpected result) marks just this memory as failed
+            try:
+                result = share_memory(memory_id, from_agent, to_agents, permissions)
+                succeeded = result.get('success', False)
+            except Exception as e:
+                logger.warning(f"Could not share memory {memory_id}: {e}")
+                succeeded = False
+            if succeeded:
+                shared.append(memory_id)
+            else:
+                failed.append(memory_id)
+        
+        return {
+            'success': not failed,
+            'shared_count': len(shared),
+            'shared': shared,
+            'failed': failed,
+        }
+    
     # Statistics and monitoring
     
     def get_statistics(self) -> Dict[str, Any]:
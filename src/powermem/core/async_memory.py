@@ -1318,6 +1318,7 @@ class AsyncMemory(MemoryBase):
         filters: Optional[Dict[str, Any]] = None,
         sort_by: Optional[str] = None,
         order: str = "desc",
+        after_id: Optional[int] = None,
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Get all memories with optional filtering and sorting asynchronously.
         
@@ -1332,6 +1333,9 @@ class AsyncMemory(MemoryBase):
                      "updated_at" (update time), "id" (memory ID). If None, results are returned
                      in their original order (typically by ID).
             order: Sort order. "desc" for descending (default), "asc" for ascending
+            after_id: Optional keyset cursor (the last ID of the previous page). When set,
+                      memories with greater IDs are returned in ascending ID order and
+                      offset/sort_by are ignored, so deep pages cost the same as the first.
         
         Returns:
             Dict[str, List[Dict[str, Any]]]: A dictionary containing all memories with the following structure:
@@ -1349,7 +1353,7 @@ class AsyncMemory(MemoryBase):
         try:
             results = await self.storage.get_all_memories_async(
                 user_id, agent_id, run_id, limit, offset,
-                sort_by=sort_by, order=order, filters=filters
+                sort_by=sort_by, order=order, filters=filters, after_id=after_id
             )
             
             await self.audit.log_event_async("memory.get_all", {
@@ -1358,6 +1362,7 @@ class AsyncMemory(MemoryBase):
                 "run_id": run_id,
                 "limit": limit,
                 "offset": offset,
+                "after_id": after_id,
                 "results_count": len(results)
             }, user_id=user_id, agent_id=agent_id)
 
@@ -50,6 +50,9 @@ logger = logging.getLogger(__name__)
 # Global background thread pool for async memory operations
 _BACKGROUND_EXECUTOR = ThreadPoolExecutor(max_workers=3)
 
+# Concurrent storage writes per add_batch() call in simple mode
+_ADD_BATCH_MAX_WORKERS = 8
+
 
 def _auto_convert_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -620,28 +623,7 @@ class Memory(MemoryBase):
                     - "added_entities" (List): List of added graph entities
         """
         try:
-            # Handle messages parameter
-            if messages is None:
-                raise ValueError("messages must be provided (str, dict, or list[dict])")
-            
-            # Normalize input format
-            if isinstance(messages, str):
-                messages = [{"role": "user", "content": messages}]
-            elif isinstance(messages, dict):
-                messages = [messages]
-            elif not isinstance(messages, list):
-                raise ValueError("messages must be str, dict, or list[dict]")
-            
-            # Vision-aware message processing
-            llm_cfg = {}
-            try:
-                llm_cfg = (self.config or {}).get("llm", {}).get("config", {})
-            except Exception:
-                llm_cfg = {}
-            if llm_cfg.get("enable_vision"):
-                messages = parse_vision_messages(messages, self.llm, llm_cfg.get("vision_details"), self.audio_llm)
-            else:
-                messages = parse_vision_messages(messages, None, None, self.audio_llm)
+            messages = self._normalize_messages(messages)
             
             # Use self.agent_id as fallback if agent_id is not provided
             agent_id = agent_id or self.agent_id
@@ -661,6 +643,150 @@ class Memory(MemoryBase):
             self.telemetry.capture_event("memory.add.error", {"error": str(e)})
             raise
     
+    def _normalize_messages(self, messages) -> List[Dict[str, Any]]:
+        """Normalize add() input to a list of message dicts, with vision/audio parsing applied."""
+        # Handle messages parameter
+        if messages is None:
+            raise ValueError("messages must be provided (str, dict, or list[dict])")
+        
+        # Normalize input format
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        elif isinstance(messages, dict):
+            messages = [messages]
+        elif not isinstance(messages, list):
+            raise ValueError("messages must be str, dict, or list[dict]")
+        
+        # Vision-aware message processing
+        llm_cfg = {}
+        try:
+            llm_cfg = (self.config or {}).get("llm", {}).get("config", {})
+        except Exception:
+            llm_cfg = {}
+        if llm_cfg.get("enable_vision"):
+            return parse_vision_messages(messages, self.llm, llm_cfg.get("vision_details"), self.audio_llm)
+        return parse_vision_messages(messages, None, None, self.audio_llm)
+    
+    @staticmethod
+    def _content_from_messages(messages) -> str:
+        """Join message contents into the text stored by simple add mode."""
+        if isinstance(messages, str):
+            return messages
+        if isinstance(messages, dict):
+            return messages.get("content", "")
+        if isinstance(messages, list):
+            return "\n".join([msg.get("content", "") for msg in messages if isinstance(msg, dict) and msg.get("content")])
+        raise ValueError("messages must be str, dict, or list[dict]")
+    
+    def add_batch(
+        self,
+        memories: List[Dict[str, Any]],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        infer: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Add several memories in one call.
+        
+        In simple mode (infer=False) all contents routed to the same embedding
+        service are embedded with a single embed_batch() request and then stored
+        concurrently. With infer=True items go through add() one at a time, so
+        each item's dedup/merge decisions see the memories added before it.
+        
+        Args:
+            memories: Items with "messages" (or "content") and optional "metadata",
+                "filters", "scope", "memory_type" and "prompt" keys
+            user_id, agent_id, run_id: Shared by all items
+            infer: Enable intelligent processing
+        
+        Returns:
+            List[Dict[str, Any]]: One entry per input item, in order. Successful items
+            have the add() result shape; failed items are {"results": [], "error": str}.
+        """
+        if infer:
+            outcomes = []
+            for item in memories:
+                try:
+                    outcomes.append(self.add(
+                        item.get("messages", item.get("content")),
+                        user_id=user_id,
+                        agent_id=agent_id,
+                        run_id=run_id,
+                        metadata=item.get("metadata"),
+                        filters=item.get("filters"),
+                        scope=item.get("scope"),
+                        memory_type=item.get("memory_type"),
+                        prompt=item.get("prompt"),
+                        infer=True,
+                    ))
+                except Exception as e:
+                    outcomes.append({"results": [], "error": str(e)})
+            return outcomes
+        
+        agent_id = agent_id or self.agent_id
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * len(memories)
+        prepared = []
+        # Group item indexes by embedding service so each service gets one request
+        groups: Dict[int, Any] = {}
+        for idx, item in enumerate(memories):
+            try:
+                messages = self._normalize_messages(item.get("messages", item.get("content")))
+                content = self._content_from_messages(messages)
+                if not content or not content.strip():
+                    raise ValueError(f"Cannot create memory with empty content. Original messages: {messages}")
+            except Exception as e:
+                outcomes[idx] = {"results": [], "error": str(e)}
+                continue
+            service = self._get_embedding_service(item.get("metadata"))
+            groups.setdefault(id(service), (service, []))[1].append(len(prepared))
+            prepared.append([idx, item, messages, content, None])
+        
+        for service, positions in groups.values():
+            try:
+                vectors = service.embed_batch([prepared[pos][3] for pos in positions], memory_action="add")
+            except Exception as e:
+                # Leave embeddings unset; _simple_add embeds those items one by one
+                logger.warning("Batch embedding failed, embedding items individually: %s", e)
+                continue
+            for pos, vector in zip(positions, vectors):
+                prepared[pos][4] = vector
+        
+        def store(entry) -> None:
+            idx, item, messages, _content, embedding = entry
+            try:
+                outcomes[idx] = self._simple_add(
+                    messages,
+                    user_id,
+                    agent_id,
+                    run_id,
+                    item.get("metadata"),
+                    item.get("filters"),
+                    item.get("scope"),
+                    item.get("memory_type"),
+                    item.get("prompt"),
+                    embedding=embedding,
+                )
+            except Exception as e:
+                logger.error("Failed to add memory: %s", e)
+                self.telemetry.capture_event("memory.add.error", {"error": str(e)})
+                outcomes[idx] = {"results": [], "error": str(e)}
+        
+        # Simple-mode writes are independent, so overlap their storage I/O as far
+        # as the store's connection pool allows
+        max_workers = min(_ADD_BATCH_MAX_WORKERS, self._storage_concurrency(), len(prepared))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(store, prepared))
+        else:
+            for entry in prepared:
+                store(entry)
+        
+        return outcomes
+    
+    def _storage_concurrency(self) -> int:
+        """Storage calls the configured store can serve at once (1 if it does not say)."""
+        return max(1, getattr(self.storage, "max_concurrency", 1))
+    
     def _simple_add(
         self,
         messages,
@@ -672,6 +798,7 @@ class Memory(MemoryBase):
         scope: Optional[str] = None,
         memory_type: Optional[str] = None,
         prompt: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
     ) -> Dict[str, Any]:
         """Simple add mode: direct storage without intelligence.
         
@@ -691,25 +818,18 @@ class Memory(MemoryBase):
                     - "added_entities" (List): List of added graph entities
         """
         # Parse messages into content
-        if isinstance(messages, str):
-            content = messages
-        elif isinstance(messages, dict):
-            content = messages.get("content", "")
-        elif isinstance(messages, list):
-            content = "\n".join([msg.get("content", "") for msg in messages if isinstance(msg, dict) and msg.get("content")])
-        else:
-            raise ValueError("messages must be str, dict, or list[dict]")
+        content = self._content_from_messages(messages)
         
         # Validate content is not empty
         if not content or not content.strip():
             logger.error(f"Cannot store empty content. Messages: {messages}")
             raise ValueError(f"Cannot create memory with empty content. Original messages: {messages}")
         
-        # Select embedding service based on metadata (for sub-store routing)
-        embedding_service = self._get_embedding_service(metadata)
-
-        # Generate embedding
-        embedding = embedding_service.embed(content, memory_action="add")
+        # Generate embedding unless add_batch already did
+        if embedding is None:
+            # Select embedding service based on metadata (for sub-store routing)
+            embedding_service = self._get_embedding_service(metadata)
+            embedding = embedding_service.embed(content, memory_action="add")
         
         # Disabled LLM-based importance evaluation to save tokens
         # Process with intelligence manager
@@ -1433,6 +1553,31 @@ class Memory(MemoryBase):
             logger.error(f"Failed to get memory {memory_id}: {e}")
             raise
     
+    def get_many(
+        self,
+        memory_ids: List[int],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Look up several memories by ID in one storage query.
+        
+        Unlike get(), this is a plain lookup: it does not run the intelligence
+        plugin's on_get hook, update access counts or write audit events, so it
+        suits existence checks ahead of batch updates and deletes.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Memories keyed by str(memory_id), in the same
+                shape as get(). IDs that are missing or not accessible to the given
+                user_id/agent_id are omitted.
+        """
+        if not memory_ids:
+            return {}
+        try:
+            return self.storage.get_memories(memory_ids, user_id, agent_id)
+        except Exception as e:
+            logger.error(f"Failed to get {len(memory_ids)} memories: {e}")
+            raise
+    
     def update(
         self,
         memory_id: int,
@@ -1528,6 +1673,46 @@ class Memory(MemoryBase):
             logger.error(f"Failed to update memory {memory_id}: {e}")
             raise
     
+    def update_metadata(
+        self,
+        memory_id: int,
+        metadata: Dict[str, Any],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Merge metadata into an existing memory without touching its content.
+        
+        Keys in ``metadata`` overwrite existing keys; other keys are kept. The
+        content, embedding and hash are unchanged, so unlike update() no new
+        embedding is generated.
+        
+        Returns:
+            Optional[Dict[str, Any]]: The updated memory data in the same shape as
+                update(), or None if the memory is not found or access is denied.
+        """
+        try:
+            patch = dict(metadata or {})
+            update_data: Dict[str, Any] = {"updated_at": get_current_datetime()}
+            # Category is stored in its own field, as in add() and update()
+            if "category" in patch:
+                update_data["category"] = patch.pop("category")
+            update_data["metadata"] = patch
+            
+            result = self.storage.update_memory(memory_id, update_data, user_id, agent_id)
+            
+            if result is not None:
+                self.audit.log_event("memory.update", {
+                    "memory_id": memory_id,
+                    "user_id": user_id,
+                    "agent_id": agent_id
+                }, user_id=user_id, agent_id=agent_id)
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Failed to update metadata for memory {memory_id}: {e}")
+            raise
+    
     def delete(
         self,
         memory_id: int,
@@ -1552,6 +1737,34 @@ class Memory(MemoryBase):
             logger.error(f"Failed to delete memory {memory_id}: {e}")
             raise
     
+    def delete_many(
+        self,
+        memory_ids: List[int],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> List[int]:
+        """Delete several memories with one access check and one delete statement.
+        
+        Returns:
+            List[int]: IDs that were deleted, in input order. IDs that do not exist
+                or are not accessible to user_id/agent_id are omitted.
+        """
+        try:
+            deleted = self.storage.delete_memories(memory_ids, user_id, agent_id)
+            
+            for memory_id in deleted:
+                self.audit.log_event("memory.delete", {
+                    "memory_id": memory_id,
+                    "user_id": user_id,
+                    "agent_id": agent_id
+                }, user_id=user_id, agent_id=agent_id)
+            
+            return deleted
+            
+        except Exception as e:
+            logger.error(f"Failed to delete {len(memory_ids)} memories: {e}")
+            raise
+    
     def delete_all(
         self,
         user_id: Optional[str] = None,
@@ -1595,6 +1808,7 @@ class Memory(MemoryBase):
         filters: Optional[Dict[str, Any]] = None,
         sort_by: Optional[str] = None,
         order: str = "desc",
+        after_id: Optional[int] = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """Get all memories with optional filtering and sorting.
         
@@ -1609,6 +1823,9 @@ class Memory(MemoryBase):
                      "updated_at" (update time), "id" (memory ID). If None, results are returned
                      in their original order (typically by ID).
             order: Sort order. "desc" for descending (default), "asc" for ascending
+            after_id: Optional keyset cursor (the last ID of the previous page). When set,
+                      memories with greater IDs are returned in ascending ID order and
+                      offset/sort_by are ignored, so deep pages cost the same as the first.
         
         Returns:
             dict[str, list[dict[str, Any]]]: A dictionary containing all memories with the following structure:
@@ -1626,7 +1843,7 @@ class Memory(MemoryBase):
         try:
             results = self.storage.get_all_memories(
                 user_id, agent_id, run_id, limit, offset,
-                sort_by=sort_by, order=order, filters=filters
+                sort_by=sort_by, order=order, filters=filters, after_id=after_id
             )
             
             self.audit.log_event("memory.get_all", {
@@ -1635,6 +1852,7 @@ class Memory(MemoryBase):
                 "run_id": run_id,
                 "limit": limit,
                 "offset": offset,
+                "after_id": after_id,
                 "results_count": len(results)
             }, user_id=user_id, agent_id=agent_id)
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from powermem.integrations.embeddings.config.base import BaseEmbedderConfig
 
@@ -29,3 +29,18 @@ class EmbeddingBase(ABC):
             list: The embedding vector.
         """
         pass
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get embeddings for several texts.
+
+        Providers whose API accepts multiple inputs should override this to
+        send a single request; the default embeds the texts one by one.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in input order.
+        """
+        return [self.embed(text, memory_action) for text in texts]
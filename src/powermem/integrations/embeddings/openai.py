@@ -1,12 +1,15 @@
 import os
 import warnings
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from openai import OpenAI
 
 from powermem.integrations.embeddings.base import EmbeddingBase
 from powermem.integrations.embeddings.config.base import BaseEmbedderConfig
 
+# The embeddings endpoint accepts at most this many inputs per request
+_MAX_BATCH_INPUTS = 2048
+
 
 class OpenAIEmbedding(EmbeddingBase):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
@@ -47,3 +50,23 @@ class OpenAIEmbedding(EmbeddingBase):
         if pass_dims:
             kwargs["dimensions"] = self.config.embedding_dims
         return self.client.embeddings.create(**kwargs).data[0].embedding
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get embeddings for several texts using one OpenAI request per 2048 inputs.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in input order.
+        """
+        kwargs = {"model": self.config.model}
+        if getattr(self.config, "pass_dimensions", True):
+            kwargs["dimensions"] = self.config.embedding_dims
+        vectors = []
+        for start in range(0, len(texts), _MAX_BATCH_INPUTS):
+            chunk = [text.replace("\n", " ") for text in texts[start:start + _MAX_BATCH_INPUTS]]
+            data = self.client.embeddings.create(input=chunk, **kwargs).data
+            vectors.extend(item.embedding for item in sorted(data, key=lambda item: item.index))
+        return vectors
@@ -8,7 +8,7 @@ with the interface expected by the Memory class.
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from powermem.storage.base import VectorStoreBase
 from powermem.utils.utils import serialize_datetime, get_current_datetime
@@ -276,6 +276,21 @@ class StorageAdapter:
         # Vector store already applied limit, no need to slice again
         return memories
     
+    @staticmethod
+    def _result_to_memory(result) -> Dict[str, Any]:
+        """Convert a vector store result into the memory dict returned by get_memory."""
+        payload = result.payload
+        return {
+            "id": result.id,
+            "content": payload.get("data") or payload.get("content") or "",
+            "user_id": payload.get("user_id"),
+            "agent_id": payload.get("agent_id"),
+            "run_id": payload.get("run_id"),
+            "metadata": payload.get("metadata", {}),
+            "created_at": payload.get("created_at"),
+            "updated_at": payload.get("updated_at"),
+        }
+
     def get_memory(
         self,
         memory_id: int,
@@ -286,17 +301,7 @@ class StorageAdapter:
         result = self.vector_store.get(memory_id)
         
         if result and result.payload:
-            content = result.payload.get("data") or result.payload.get("content") or ""
-            memory = {
-                "id": result.id,
-                "content": content,
-                "user_id": result.payload.get("user_id"),
-                "agent_id": result.payload.get("agent_id"),
-                "run_id": result.payload.get("run_id"),
-                "metadata": result.payload.get("metadata", {}),
-                "created_at": result.payload.get("created_at"),
-                "updated_at": result.payload.get("updated_at"),
-            }
+            memory = self._result_to_memory(result)
             
             # Check access control
             if user_id and memory.get("user_id") != user_id:
@@ -312,17 +317,7 @@ class StorageAdapter:
                 try:
                     result = sub_config.vector_store.get(memory_id)
                     if result and result.payload:
-                        content = result.payload.get("data") or result.payload.get("content") or ""
-                        memory = {
-                            "id": result.id,
-                             "content": content,
-                            "user_id": result.payload.get("user_id"),
-                            "agent_id": result.payload.get("agent_id"),
-                            "run_id": result.payload.get("run_id"),
-                            "metadata": result.payload.get("metadata", {}),
-                            "created_at": result.payload.get("created_at"),
-                            "updated_at": result.payload.get("updated_at"),
-                        }
+                        memory = self._result_to_memory(result)
 
                         # Check access control
                         if user_id and memory.get("user_id") != user_id:
@@ -337,6 +332,67 @@ class StorageAdapter:
 
         return None
     
+    def get_memories(
+        self,
+        memory_ids: List[int],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several memories by ID with one get_many() query per store.
+
+        Returns a dict keyed by str(memory_id). Memories that do not exist or
+        fail the user/agent access check are omitted, as with get_memory.
+        """
+        return {
+            str(result.id): self._result_to_memory(result)
+            for _name, _store, results in self._locate_memories(memory_ids, user_id, agent_id)
+            for result in results
+        }
+
+    def _locate_memories(
+        self,
+        memory_ids: List[int],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> List[Tuple[Optional[str], VectorStoreBase, List[Any]]]:
+        """
+        Find memories with one get_many() per store: the main store first, then
+        each sub store for the IDs no earlier store held.
+
+        Returns (sub store name or None for the main store, store, results) for
+        every store queried, keeping only results that pass the user/agent access
+        check. A failing lookup is raised rather than treated as "not found".
+        """
+        stores = [(None, self.vector_store)]
+        stores.extend((sub_config.name, sub_config.vector_store) for sub_config in self.sub_stores.values())
+
+        found = set()
+        located = []
+        for name, store in stores:
+            remaining = [memory_id for memory_id in memory_ids if str(memory_id) not in found]
+            if not remaining:
+                break
+            try:
+                results = store.get_many(remaining)
+            except Exception:
+                if name is not None:
+                    logger.warning("Error reading memories from sub store %s", name, exc_info=True)
+                raise
+            accessible = []
+            for result in results:
+                if not result.payload:
+                    continue
+                found.add(str(result.id))
+                payload = result.payload
+                if user_id and payload.get("user_id") != user_id:
+                    continue
+                if agent_id and payload.get("agent_id") != agent_id:
+                    continue
+                accessible.append(result)
+            located.append((name, store, accessible))
+        return located
+
     def update_memory(
         self,
         memory_id: int,
@@ -466,6 +522,38 @@ class StorageAdapter:
         logger.warning(f"Failed to delete memory {memory_id}")
         return False
     
+    def delete_memories(
+        self,
+        memory_ids: List[int],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> List[int]:
+        """
+        Delete several memories, checking access for all of them with one query.
+
+        Memories are removed with one delete_many() call per store that holds
+        them: the main store first, then each sub store for the IDs still missing.
+
+        Returns the IDs that were deleted. Memories that do not exist or fail
+        the user/agent access check are skipped, as with delete_memory.
+        """
+        # Every store is checked before anything is deleted, so a failing
+        # lookup aborts the batch instead of leaving it half deleted
+        deleted = set()
+        for name, store, results in self._locate_memories(memory_ids, user_id, agent_id):
+            if not results:
+                continue
+            store_ids = [result.id for result in results]
+            try:
+                store.delete_many(store_ids)
+            except Exception:
+                if name is not None:
+                    logger.warning("Error deleting memories from sub store %s", name, exc_info=True)
+                raise
+            deleted.update(str(memory_id) for memory_id in store_ids)
+
+        return [memory_id for memory_id in memory_ids if str(memory_id) in deleted]
+    
     def get_all_memories(
         self,
         user_id: Optional[str] = None,
@@ -476,8 +564,13 @@ class StorageAdapter:
         sort_by: Optional[str] = None,
         order: str = "desc",
         filters: Optional[Dict[str, Any]] = None,
+        after_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Get all memories with optional filtering and sorting."""
+        """Get all memories with optional filtering and sorting.
+        
+        When after_id is given, memories with IDs greater than it are returned in
+        ascending ID order (keyset pagination); offset and sort_by are ignored.
+        """
         # Build filters for database-level filtering (only scope keys; backends use payload top-level)
         db_filters: Dict[str, Any] = {}
         if user_id:
@@ -487,12 +580,17 @@ class StorageAdapter:
         if run_id:
             db_filters["run_id"] = run_id
         # Pass only scope to DB; extra filters (e.g. metadata.name) applied in-memory below
+        list_kwargs: Dict[str, Any] = {}
+        if after_id is not None:
+            # Only pass the cursor when used so stores without keyset support still work
+            list_kwargs["after_id"] = after_id
         results = self.vector_store.list(
             filters=db_filters if db_filters else None,
             limit=limit,
             offset=offset,
             order_by=sort_by,
-            order=order
+            order=order,
+            **list_kwargs
         )
         
         # OceanBase returns [memories], SQLite/PGVector return memories directly
@@ -620,6 +718,12 @@ class StorageAdapter:
         if run_id:
             filters["run_id"] = run_id
         
+        # Stores that support it delete everything with one statement
+        if filters and hasattr(self.vector_store, "delete_by_filters"):
+            deleted_count = self.vector_store.delete_by_filters(filters)
+            logger.info(f"Deleted {deleted_count} memories with filters: {filters}")
+            return True
+        
         # Use batch processing to avoid timeout
         batch_size = 1000
         deleted_count = 0
@@ -658,11 +762,13 @@ class StorageAdapter:
         sort_by: Optional[str] = None,
         order: str = "desc",
         filters: Optional[Dict[str, Any]] = None,
+        after_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get all memories with optional filtering and sorting asynchronously."""
         import asyncio
         return await asyncio.to_thread(
-            self.get_all_memories, user_id, agent_id, run_id, limit, offset, sort_by, order, filters
+            self.get_all_memories, user_id, agent_id, run_id, limit, offset, sort_by, order, filters,
+            after_id
         )
     
     async def clear_memories_async(
@@ -766,6 +872,12 @@ class StorageAdapter:
         logger.debug("Routing to main store")
         return self.vector_store
 
+    @property
+    def max_concurrency(self) -> int:
+        """Storage calls that may run at once, bounded by the most limited store."""
+        stores = [self.vector_store] + [sub_config.vector_store for sub_config in self.sub_stores.values()]
+        return min(max(1, getattr(store, "max_concurrency", 1)) for store in stores)
+
     def get_target_store_name(self, filters_or_metadata: Optional[Dict] = None) -> str:
         """
         Get target store name for given filters/metadata.
@@ -22,6 +22,10 @@ class VectorStoreBase(ABC):
     This class defines the interface that all storage backends must implement.
     """
 
+    # Storage calls callers may run against this store at once. Stores whose
+    # connection pool blocks when exhausted raise this to their pool size.
+    max_concurrency = 1
+
     @abstractmethod
     def create_col(self, name, vector_size, distance):
         """Create a new collection."""
@@ -52,6 +56,28 @@ class VectorStoreBase(ABC):
         """Retrieve a vector by ID."""
         pass
 
+    def delete_many(self, vector_ids):
+        """Delete several vectors by ID.
+
+        Stores that can delete a list of primary keys in one statement should
+        override this; the default calls delete() per ID.
+        """
+        for vector_id in vector_ids:
+            self.delete(vector_id)
+
+    def get_many(self, vector_ids):
+        """Retrieve several vectors by ID, omitting IDs that do not exist.
+
+        Stores that can fetch a list of primary keys in one query should
+        override this; the default calls get() per ID.
+        """
+        results = []
+        for vector_id in vector_ids:
+            result = self.get(vector_id)
+            if result is not None:
+                results.append(result)
+        return results
+
     @abstractmethod
     def list_cols(self):
         """List all collections."""
@@ -68,7 +94,7 @@ class VectorStoreBase(ABC):
         pass
 
     @abstractmethod
-    def list(self, filters=None, limit=None, offset=None, order_by=None, order="desc"):
+    def list(self, filters=None, limit=None, offset=None, order_by=None, order="desc", after_id=None):
         """List all memories with optional filtering, pagination and sorting.
         
         Args:
@@ -77,6 +103,8 @@ class VectorStoreBase(ABC):
             offset: Number of results to skip
             order_by: Field to sort by (e.g., "created_at", "updated_at", "id")
             order: Sort order, "desc" for descending or "asc" for ascending
+            after_id: Keyset cursor. When set, only IDs greater than it are returned,
+                in ascending ID order; offset and order_by are ignored.
         """
         pass
 
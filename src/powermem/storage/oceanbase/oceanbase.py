@@ -28,7 +28,7 @@ try:
 )
     from pyobvector.schema import ReplaceStmt
     from sqlalchemy import JSON, Column, String, Table, func, ColumnElement, BigInteger
-    from sqlalchemy import text, and_, or_, not_, select, bindparam, literal_column
+    from sqlalchemy import text, and_, or_, not_, select, delete, bindparam, literal_column
     from sqlalchemy.dialects.mysql import LONGTEXT
 except ImportError as e:
     raise ImportError(
@@ -204,6 +204,9 @@ class OceanBaseVectorStore(VectorStoreBase):
                 db_name=db_name,
                 **kwargs,
             )
+            # SQLAlchemy's pool waits for a free connection instead of failing;
+            # stay below its default size plus overflow
+            self.max_concurrency = 8
         else:
             ob_path = self.connection_args.get("ob_path", "./seekdb_data")
             OceanBaseUtil.ensure_embedded_database_exists(ob_path, db_name)
@@ -1285,21 +1288,21 @@ class OceanBaseVectorStore(VectorStoreBase):
 
             # 7. Convert to OutputData objects
             output_list = []
-            for doc in parsed_results:
+            for hit in parsed_results:
                 metadata = {
-                    "user_id": doc["user_id"],
-                    "agent_id": doc["agent_id"],
-                    "run_id": doc["run_id"],
-                    "actor_id": doc["actor_id"],
-                    "hash": doc["hash"],
-                    "created_at": doc["created_at"],
-                    "updated_at": doc["updated_at"],
-                    "category": doc["category"],
-                    "metadata": OceanBaseUtil.parse_metadata(doc["metadata_json"])
+                    "user_id": hit.user_id,
+                    "agent_id": hit.agent_id,
+                    "run_id": hit.run_id,
+                    "actor_id": hit.actor_id,
+                    "hash": hit.hash,
+                    "created_at": hit.created_at,
+                    "updated_at": hit.updated_at,
+                    "category": hit.category,
+                    "metadata": OceanBaseUtil.parse_metadata(hit.metadata_json)
                 }
 
                 output_list.append(
-                    self._create_output_data(doc["vector_id"], doc["text_content"], doc["score"], metadata)
+                    self._create_output_data(hit.vector_id, hit.text_content, hit.score, metadata)
                 )
 
             logger.debug(f"Native hybrid search returned {len(output_list)} results")
@@ -1879,7 +1882,45 @@ class OceanBaseVectorStore(VectorStoreBase):
             logger.error(f"Failed to delete vector with ID {vector_id} from collection '{self.collection_name}': {e}", exc_info=True)
             raise
 
+    def delete_many(self, vector_ids: List[int]):
+        """Delete several vectors by ID in one statement."""
+        if not vector_ids:
+            return
+        try:
+            self.obvector.delete(
+                table_name=self.collection_name,
+                ids=list(vector_ids),
+            )
+            logger.debug(f"Successfully deleted {len(vector_ids)} vectors from collection '{self.collection_name}'")
+        except Exception as e:
+            logger.error(f"Failed to delete {len(vector_ids)} vectors from collection '{self.collection_name}': {e}", exc_info=True)
+            raise
+
+    def delete_by_filters(self, filters: Dict) -> int:
+        """Delete every vector matching the filters with a single DELETE statement.
+
+        Returns:
+            int: Number of deleted rows
+        """
+        if not filters:
+            raise ValueError("delete_by_filters requires at least one filter")
+        try:
+            table = Table(self.collection_name, self.obvector.metadata_obj, autoload_with=self.obvector.engine)
+            where_clause = self._generate_where_clause(filters, table=table)
+            stmt = delete(table).where(*where_clause)
+            with self.obvector.engine.connect() as conn:
+                with conn.begin():
+                    deleted = conn.execute(stmt).rowcount
+            logger.debug(f"Deleted {deleted} vectors matching {filters} from collection '{self.collection_name}'")
+            return deleted
+        except Exception as e:
+            logger.error(f"Failed to delete vectors matching {filters} from collection '{self.collection_name}': {e}", exc_info=True)
+            raise
+
     def _get_records_by_id(self, vector_id, output_columns: List[str]) -> list:
+        return self._get_records_by_ids([vector_id], output_columns)
+
+    def _get_records_by_ids(self, vector_ids: List, output_columns: List[str]) -> list:
         """Fetch rows by primary key while keeping the connection open during fetchall.
 
         pyobvector.get() returns the cursor *after* committing the transaction via
@@ -1890,7 +1931,7 @@ class OceanBaseVectorStore(VectorStoreBase):
         """
         table = Table(self.collection_name, self.obvector.metadata_obj, autoload_with=self.obvector.engine)
         cols = [table.c[col] for col in output_columns if col in table.c]
-        stmt = select(*cols).where(table.c[self.primary_field].in_([vector_id]))
+        stmt = select(*cols).where(table.c[self.primary_field].in_(vector_ids))
         with self.obvector.engine.connect() as conn:
             result = conn.execute(stmt)
             return OceanBaseUtil.safe_fetchall(result)
@@ -1987,6 +2028,27 @@ class OceanBaseVectorStore(VectorStoreBase):
             logger.error(f"Failed to get vector with ID {vector_id} from collection '{self.collection_name}': {e}", exc_info=True)
             raise
 
+    def get_many(self, vector_ids: List[int]):
+        """Retrieve several vectors by ID in one query."""
+        if not vector_ids:
+            return []
+        try:
+            output_columns = self._get_standard_column_names(include_vector_field=True)
+            rows = self._get_records_by_ids(list(vector_ids), output_columns)
+            results = []
+            for row in rows:
+                parsed = self._parse_row_to_dict(row, include_vector=True, extract_score=False)
+                results.append(self._create_output_data(
+                    parsed["vector_id"],
+                    parsed["text_content"],
+                    0.0,
+                    parsed["metadata"]
+                ))
+            return results
+        except Exception as e:
+            logger.error(f"Failed to get {len(vector_ids)} vectors from collection '{self.collection_name}': {e}", exc_info=True)
+            raise
+
     def list_cols(self):
         """List all collections."""
         try:
@@ -2061,7 +2123,8 @@ class OceanBaseVectorStore(VectorStoreBase):
             raise
 
     def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None,
-             offset: Optional[int] = None, order_by: Optional[str] = None, order: str = "desc"):
+             offset: Optional[int] = None, order_by: Optional[str] = None, order: str = "desc",
+             after_id: Optional[int] = None):
         """List all memories."""
         try:
             table = Table(self.collection_name, self.obvector.metadata_obj, autoload_with=self.obvector.engine)
@@ -2069,6 +2132,11 @@ class OceanBaseVectorStore(VectorStoreBase):
             # Build where clause from filters using the same table object
             where_clause = self._generate_where_clause(filters, table=table)
 
+            # Keyset pagination: seek past the cursor instead of skipping rows
+            if after_id is not None:
+                where_clause = where_clause + [table.c[self.primary_field] > after_id]
+                order_by, order, offset = self.primary_field, "asc", None
+
             # Build output column name list
             output_columns_names = self._get_standard_column_names(include_vector_field=True)
             
@@ -28,6 +28,21 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Payload keys that list/get/delete filters use most, indexed in _create_payload_indexes()
+_INDEXED_PAYLOAD_KEYS = ("user_id", "agent_id", "run_id")
+
+
+def _payload_condition(key: str, value: Any):
+    """Build a `payload->>key = value` condition and its parameters.
+
+    For indexed keys the key is written into the SQL so the planner can match
+    the expression indexes even with server-side parameter binding.
+    """
+    if key in _INDEXED_PAYLOAD_KEYS:
+        return f"payload->>'{key}' = %s", [str(value)]
+    return "payload->>%s = %s", [key, str(value)]
+
+
 class PGVectorStore(VectorStoreBase):
     def __init__(
         self,
@@ -75,6 +90,9 @@ class PGVectorStore(VectorStoreBase):
         if connection_pool is not None:
             # Use provided connection pool
             self.connection_pool = connection_pool
+            # psycopg2 pools expose maxconn, psycopg3 pools max_size
+            pool_size = getattr(connection_pool, "maxconn", None) or getattr(connection_pool, "max_size", None)
+            maxconn = pool_size if isinstance(pool_size, int) else 1
         elif connection_string:
             if sslmode:
                 # Append sslmode to connection string if provided
@@ -90,6 +108,9 @@ class PGVectorStore(VectorStoreBase):
             if sslmode:
                 connection_string = f"{connection_string} sslmode={sslmode}"
         
+        # psycopg2's ThreadedConnectionPool raises instead of waiting once all
+        # connections are checked out, so callers must not exceed the pool size
+        self.max_concurrency = max(1, maxconn or 1)
         if self.connection_pool is None:
             if PSYCOPG_VERSION == 3:
                 # psycopg3 ConnectionPool
@@ -101,6 +122,10 @@ class PGVectorStore(VectorStoreBase):
         collections = self.list_cols()
         if collection_name not in collections:
             self.create_col()
+        else:
+            # Tables created before the payload indexes existed get them on startup
+            with self._get_cursor(commit=True) as cur:
+                self._create_payload_indexes(cur)
 
     @contextmanager
     def _get_cursor(self, commit: bool = False):
@@ -136,6 +161,22 @@ class PGVectorStore(VectorStoreBase):
                 cur.close()
                 self.connection_pool.putconn(conn)
 
+    def _create_payload_indexes(self, cur) -> None:
+        """Create the expression indexes so user/agent/run filters avoid a full table scan."""
+        for key in _INDEXED_PAYLOAD_KEYS:
+            cur.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS {self.collection_name}_{key}_idx
+                ON {self.collection_name} ((payload->>'{key}'))
+                """
+            )
+        cur.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS {self.collection_name}_user_id_agent_id_idx
+            ON {self.collection_name} ((payload->>'user_id'), (payload->>'agent_id'))
+            """
+        )
+
     def create_col(self, name=None, vector_size=None, distance=None) -> None:
         """
         Create a new collection (table in PostgreSQL).
@@ -167,6 +208,8 @@ class PGVectorStore(VectorStoreBase):
                 """
             )
 
+            self._create_payload_indexes(cur)
+
             if self.use_diskann and self.embedding_model_dims < 2000:
                 cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
                 if cur.fetchone():
@@ -253,8 +296,9 @@ class PGVectorStore(VectorStoreBase):
 
         if filters:
             for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+                condition, params = _payload_condition(k, v)
+                filter_conditions.append(condition)
+                filter_params.extend(params)
 
         filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
 
@@ -283,6 +327,18 @@ class PGVectorStore(VectorStoreBase):
         with self._get_cursor(commit=True) as cur:
             cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
 
+    def delete_many(self, vector_ids: List[int]) -> None:
+        """
+        Delete several vectors by ID in one statement and commit.
+
+        Args:
+            vector_ids (List[int]): IDs of the vectors to delete.
+        """
+        if not vector_ids:
+            return
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(f"DELETE FROM {self.collection_name} WHERE id = ANY(%s)", (list(vector_ids),))
+
     def update(
         self,
         vector_id: int,
@@ -383,7 +439,8 @@ class PGVectorStore(VectorStoreBase):
         limit: Optional[int] = 100,
         offset: Optional[int] = None,
         order_by: Optional[str] = None,
-        order: str = "desc"
+        order: str = "desc",
+        after_id: Optional[int] = None,
     ) -> List[OutputData]:
         """
         List all vectors in a collection.
@@ -394,6 +451,8 @@ class PGVectorStore(VectorStoreBase):
             offset (int, optional): Number of results to skip.
             order_by (str, optional): Field to sort by (e.g., "created_at", "updated_at", "id").
             order (str, optional): Sort order, "desc" for descending or "asc" for ascending.
+            after_id (int, optional): Keyset cursor; return IDs greater than it in ascending
+                order. Overrides offset and order_by.
 
         Returns:
             List[OutputData]: List of vectors.
@@ -403,8 +462,15 @@ class PGVectorStore(VectorStoreBase):
 
         if filters:
             for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+                condition, params = _payload_condition(k, v)
+                filter_conditions.append(condition)
+                filter_params.extend(params)
+
+        # Keyset pagination: seek past the cursor instead of skipping rows
+        if after_id is not None:
+            filter_conditions.append("id > %s")
+            filter_params.append(after_id)
+            order_by, order, offset = "id", "asc", None
 
         filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
         
@@ -457,8 +523,9 @@ class PGVectorStore(VectorStoreBase):
 
         if filters:
             for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+                condition, params = _payload_condition(k, v)
+                filter_conditions.append(condition)
+                filter_params.extend(params)
 
         filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
         
@@ -514,8 +581,9 @@ class PGVectorStore(VectorStoreBase):
 
         if filters:
             for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+                condition, params = _payload_condition(k, v)
+                filter_conditions.append(condition)
+                filter_params.extend(params)
 
         filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
 
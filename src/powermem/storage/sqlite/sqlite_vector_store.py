@@ -35,6 +35,23 @@ def _json_path_for_key(key: str) -> str:
     return path
 
 
+# Payload keys that list/get/delete filters use most, indexed in create_col()
+_INDEXED_PAYLOAD_KEYS = ("user_id", "agent_id", "run_id")
+
+
+def _payload_condition(key: str, value: Any):
+    """
+    Build a `json_extract(payload, ...) = ?` condition and its parameters.
+
+    For indexed keys the path is written into the SQL so the planner can match
+    the expression indexes; SQLite cannot use them for a bound path parameter.
+    Other keys keep the parameterized path.
+    """
+    if key in _INDEXED_PAYLOAD_KEYS:
+        return f"(json_extract(payload, '{_json_path_for_key(key)}') = ?)", [value]
+    return "(json_extract(payload, ?) = ?)", [_json_path_for_key(key), value]
+
+
 class SQLiteVectorStore(VectorStoreBase):
     """Simple SQLite-based vector store implementation."""
     
@@ -87,6 +104,18 @@ class SQLiteVectorStore(VectorStoreBase):
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            # Expression indexes so user/agent/run filters avoid a full table scan
+            for key in _INDEXED_PAYLOAD_KEYS:
+                self.connection.execute(f"""
+                    CREATE INDEX IF NOT EXISTS ix_{table_name}_{key}
+                    ON {table_name} (json_extract(payload, '{_json_path_for_key(key)}'))
+                """)
+            user_path = _json_path_for_key("user_id")
+            agent_path = _json_path_for_key("agent_id")
+            self.connection.execute(f"""
+                CREATE INDEX IF NOT EXISTS ix_{table_name}_user_id_agent_id
+                ON {table_name} (json_extract(payload, '{user_path}'), json_extract(payload, '{agent_path}'))
+            """)
             self.connection.commit()
     
     def insert(self, vectors: List[List[float]], payloads=None, ids=None) -> List[int]:
@@ -141,8 +170,9 @@ class SQLiteVectorStore(VectorStoreBase):
             conditions = []
             for key, value in filters.items():
                 # Filter by JSON field in payload
-                conditions.append("(json_extract(payload, ?) = ?)")
-                query_params.extend([_json_path_for_key(key), value])
+                condition, params = _payload_condition(key, value)
+                conditions.append(condition)
+                query_params.extend(params)
             
             if conditions:
                 query_sql += " WHERE " + " AND ".join(conditions)
@@ -186,6 +216,40 @@ class SQLiteVectorStore(VectorStoreBase):
             """, (vector_id,))
             self.connection.commit()
     
+    def delete_many(self, vector_ids: List[int]) -> None:
+        """Delete several vectors by ID in one statement and commit."""
+        if not vector_ids:
+            return
+        placeholders = ", ".join("?" * len(vector_ids))
+        with self._lock:
+            self.connection.execute(f"""
+                DELETE FROM {self.collection_name} WHERE id IN ({placeholders})
+            """, tuple(vector_ids))
+            self.connection.commit()
+    
+    def delete_by_filters(self, filters: Dict[str, Any]) -> int:
+        """Delete every vector whose payload matches the filters in one statement.
+        
+        Returns:
+            int: Number of deleted rows
+        """
+        if not filters:
+            raise ValueError("delete_by_filters requires at least one filter")
+        conditions = []
+        query_params = []
+        for key, value in filters.items():
+            condition, params = _payload_condition(key, value)
+            conditions.append(condition)
+            query_params.extend(params)
+        
+        with self._lock:
+            cursor = self.connection.execute(
+                f"DELETE FROM {self.collection_name} WHERE " + " AND ".join(conditions),
+                query_params,
+            )
+            self.connection.commit()
+            return cursor.rowcount
+    
     def update(self, vector_id: int, vector=None, payload=None) -> None:
         """Update a vector and its payload."""
         updates = []
@@ -230,6 +294,22 @@ class SQLiteVectorStore(VectorStoreBase):
         
         return None
     
+    def get_many(self, vector_ids: List[int]) -> List[OutputData]:
+        """Retrieve several vectors by ID in one query."""
+        if not vector_ids:
+            return []
+        placeholders = ", ".join("?" * len(vector_ids))
+        with self._lock:
+            cursor = self.connection.execute(f"""
+                SELECT id, payload FROM {self.collection_name} WHERE id IN ({placeholders})
+            """, tuple(vector_ids))
+            rows = cursor.fetchall()
+        
+        return [
+            OutputData(id=vector_id, score=1.0, payload=json.loads(payload_str))
+            for vector_id, payload_str in rows
+        ]
+    
     def list_cols(self) -> List[str]:
         """List all collections (tables)."""
         with self._lock:
@@ -258,21 +338,29 @@ class SQLiteVectorStore(VectorStoreBase):
                 "db_path": self.db_path
             }
     
-    def list(self, filters=None, limit=None, offset=None, order_by=None, order="desc") -> List[OutputData]:
+    def list(self, filters=None, limit=None, offset=None, order_by=None, order="desc",
+             after_id=None) -> List[OutputData]:
         """List all memories with optional filtering, pagination and sorting."""
         query = f"SELECT id, vector, payload FROM {self.collection_name}"
         query_params = []
+        conditions = []
         
         # Apply filters if provided
         if filters:
-            conditions = []
             for key, value in filters.items():
                 # Filter by JSON field in payload
-                conditions.append("(json_extract(payload, ?) = ?)")
-                query_params.extend([_json_path_for_key(key), value])
-            
-            if conditions:
-                query += " WHERE " + " AND ".join(conditions)
+                condition, params = _payload_condition(key, value)
+                conditions.append(condition)
+                query_params.extend(params)
+        
+        # Keyset pagination: seek past the cursor instead of skipping rows
+        if after_id is not None:
+            conditions.append("id > ?")
+            query_params.append(after_id)
+            order_by, order, offset = "id", "asc", None
+        
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
         
         # Add ORDER BY clause for sorting
         if order_by:
@@ -330,8 +418,9 @@ class SQLiteVectorStore(VectorStoreBase):
             conditions = []
             for key, value in filters.items():
                 # Filter by JSON field in payload
-                conditions.append("(json_extract(payload, ?) = ?)")
-                query_params.extend([_json_path_for_key(key), value])
+                condition, params = _payload_condition(key, value)
+                conditions.append(condition)
+                query_params.extend(params)
             
             if conditions:
                 query += " WHERE " + " AND ".join(conditions)
@@ -361,8 +450,9 @@ class SQLiteVectorStore(VectorStoreBase):
         if filters:
             conditions = []
             for key, value in filters.items():
-                conditions.append("(json_extract(payload, ?) = ?)")
-                query_params.extend([_json_path_for_key(key), value])
+                condition, params = _payload_condition(key, value)
+                conditions.append(condition)
+                query_params.extend(params)
             if conditions:
                 query += " WHERE " + " AND ".join(conditions)
 
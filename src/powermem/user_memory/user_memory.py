@@ -648,13 +648,14 @@ class UserMemory:
         limit: int = 100,
         offset: int = 0,
         filters: Optional[Dict[str, Any]] = None,
+        after_id: Optional[int] = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """
         Get all memories with optional filtering.
         
         See memory.get_all() for details.
         """
-        return self.memory.get_all(user_id, agent_id, run_id, limit, offset, filters)
+        return self.memory.get_all(user_id, agent_id, run_id, limit, offset, filters, after_id=after_id)
 
     def reset(self):
         """
@@ -6,10 +6,13 @@ This module provides utility functions for checking OceanBase database informati
 import json
 import logging
 import re
-from typing import Dict, Optional, List
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, List, Tuple, Union
 
 try:
-    from sqlalchemy import text
+    from sqlalchemy import bindparam, text
     from sqlalchemy.schema import CreateTable
     from pyobvector import FtsParser
     from pyobvector.schema import ObTable, VectorIndex, FtsIndex
@@ -21,38 +24,277 @@ except ImportError as e:
         f"Required dependencies not found: {e}. Please install sqlalchemy and pyobvector."
     )
 
+try:
+    # orjson is optional; it parses large hybrid search payloads much faster
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # msgspec is optional; it decodes hybrid search rows straight into structs
+    import msgspec
+except ImportError:
+    msgspec = None
+
 logger = logging.getLogger(__name__)
 
+_LOGICAL_OPS = ("AND", "OR")
+_RANGE_OPS = ("gte", "gt", "lte", "lt")
+_ORGANIZATION_RE = re.compile(r"ORGANIZATION\s+(INDEX|HEAP)", re.IGNORECASE)
+
+_OCEANBASE_VERSION_RE = re.compile(r'OceanBase[^v]*[vV]?(\d+)\.(\d+)\.(\d+)')
+_GENERIC_VERSION_RE = re.compile(r'[vV]?(\d+)\.(\d+)\.(\d+)')
+
+# Minimum OceanBase versions for optional features
+_SPARSE_VECTOR_MIN_VERSION = (4, 5, 0)
+_NATIVE_HYBRID_MIN_VERSION = (4, 4, 1)
+
+# Raw version strings keyed by engine, so version probes hit the database once
+_VERSION_CACHE = weakref.WeakKeyDictionary()
+
+_FTS_PARSER_MAP = {
+    'ik': FtsParser.IK,
+    'ngram': FtsParser.NGRAM,
+    'ngram2': FtsParser.NGRAM2,
+    'beng': FtsParser.BASIC_ENGLISH,
+    'space': None,
+    'jieba': FtsParser.JIEBA,
+}
+_FTS_SUPPORTED_PARSERS = ', '.join(_FTS_PARSER_MAP)
+
+# Precomputed string forms of common sparse vector token ids
+_TOKEN_ID_STRS = tuple(str(i) for i in range(4096))
+
+# Statements are built once so SQLAlchemy can reuse their compiled form
+_TABLE_EXISTS_SQL = text(
+    "SELECT 1 FROM information_schema.TABLES "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name LIMIT 1"
+)
+_COLUMN_EXISTS_SQL = text(
+    "SELECT 1 FROM information_schema.COLUMNS "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name "
+    "AND COLUMN_NAME = :column_name LIMIT 1"
+)
+_INDEX_EXISTS_SQL = text(
+    "SELECT 1 FROM information_schema.STATISTICS "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name "
+    "AND INDEX_NAME = :index_name LIMIT 1"
+)
+_FULLTEXT_INDEX_EXISTS_SQL = text(
+    "SELECT 1 FROM information_schema.STATISTICS "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name "
+    "AND INDEX_TYPE = 'FULLTEXT' AND COLUMN_NAME = :column_name LIMIT 1"
+)
+_TABLES_EXIST_SQL = text(
+    "SELECT TABLE_NAME FROM information_schema.TABLES "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :names"
+).bindparams(bindparam("names", expanding=True))
+_COLUMNS_EXIST_SQL = text(
+    "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name "
+    "AND COLUMN_NAME IN :names"
+).bindparams(bindparam("names", expanding=True))
+_INDEXES_EXIST_SQL = text(
+    "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name "
+    "AND INDEX_NAME IN :names"
+).bindparams(bindparam("names", expanding=True))
+_VERSION_SQL = text("SELECT VERSION()")
+_VERSION_VARIABLE_SQL = text("SHOW VARIABLES LIKE 'version'")
+
+# MySQL/OceanBase error code for "Table doesn't exist"
+_ER_NO_SUCH_TABLE = 1146
+
+
+@lru_cache(maxsize=32)
+def _get_table_columns(model_class) -> frozenset:
+    """Return the column names of an ORM model, cached per model class."""
+    return frozenset(model_class.__table__.c.keys())
+
+
+@contextmanager
+def _connection(obvector, conn=None):
+    """Yield the given connection, or acquire one from the engine pool."""
+    if conn is not None:
+        yield conn
+        return
+    with obvector.engine.connect() as new_conn:
+        yield new_conn
+
+
+@lru_cache(maxsize=8)
+def _parse_version(version_str: str) -> Optional[Tuple[int, int, int]]:
+    """Parse a database version string into a (major, minor, patch) tuple."""
+    # For OceanBase, prioritize the actual OceanBase version (e.g., "5.7.25-OceanBase_CE-v4.3.5.5" -> 4.3.5)
+    # First try to match OceanBase version pattern
+    version_match = _OCEANBASE_VERSION_RE.search(version_str)
+    if not version_match:
+        version_match = _GENERIC_VERSION_RE.search(version_str)
+    if version_match is None:
+        return None
+    return int(version_match.group(1)), int(version_match.group(2)), int(version_match.group(3))
+
+
+def _is_table_not_found_error(error: Exception) -> bool:
+    """Check whether a driver error means the queried table does not exist."""
+    orig = getattr(error, "orig", error)
+    args = getattr(orig, "args", ())
+    if args and args[0] == _ER_NO_SUCH_TABLE:
+        return True
+    return "doesn't exist" in str(error).lower()
+
+
+def _eq_filter(field_name: str, value) -> Dict:
+    return {"term": {field_name: value}}
+
+
+def _ne_filter(field_name: str, value) -> Dict:
+    return {"bool": {"must_not": [{"term": {field_name: value}}]}}
+
+
+def _any_term(field_name: str, values: List) -> Dict:
+    """Build a bool.should of term queries matching any of the values."""
+    return {"bool": {"should": [{"term": {field_name: v}} for v in values]}}
+
+
+def _in_filter(field_name: str, values) -> Optional[Dict]:
+    if not isinstance(values, list) or not values:
+        return None
+    return _any_term(field_name, values)
+
+
+def _nin_filter(field_name: str, values) -> Optional[Dict]:
+    if not isinstance(values, list) or not values:
+        return None
+    return {"bool": {"must_not": [_any_term(field_name, values)]}}
+
+
+def _like_filter(field_name: str, pattern) -> Optional[Dict]:
+    query_str = str(pattern).replace("%", "").replace("_", " ").strip()
+    if query_str:
+        return {"match": {field_name: {"query": query_str}}}
+    return None
+
+
+# Native SEARCH builders for non-range filter operators, in precedence order
+_FILTER_OP_HANDLERS = {
+    "eq": _eq_filter,
+    "ne": _ne_filter,
+    "in": _in_filter,
+    "nin": _nin_filter,
+    "like": _like_filter,
+    "ilike": _like_filter,
+}
+
+
+class HybridHit:
+    """One row parsed from a native DBMS_HYBRID_SEARCH.SEARCH result."""
+
+    __slots__ = (
+        "vector_id", "text_content", "score", "user_id", "agent_id", "run_id",
+        "actor_id", "hash", "created_at", "updated_at", "category", "metadata_json",
+    )
+
+    def __init__(self, vector_id, text_content, score, user_id, agent_id, run_id,
+                 actor_id, hash, created_at, updated_at, category, metadata_json):
+        self.vector_id = vector_id
+        self.text_content = text_content
+        self.score = score
+        self.user_id = user_id
+        self.agent_id = agent_id
+        self.run_id = run_id
+        self.actor_id = actor_id
+        self.hash = hash
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.category = category
+        self.metadata_json = metadata_json
+
+    def __getitem__(self, key: str):
+        # Keep dict-style access working for callers written against the old dicts
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def _asdict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"HybridHit(vector_id={self.vector_id!r}, score={self.score!r})"
+
+
+if msgspec is not None:
+    class _HybridHitStruct(msgspec.Struct, gc=False):
+        """Base for msgspec-decoded hits; mirrors the HybridHit interface."""
+
+        def __getitem__(self, key: str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+
+        def _asdict(self) -> Dict:
+            return {name: getattr(self, name) for name in self.__struct_fields__}
+
+
+@lru_cache(maxsize=32)
+def _hybrid_hit_decoder(primary_field: str, text_field: str, metadata_field: str):
+    """Build a msgspec decoder for hybrid search rows with the given field names."""
+    hit_type = msgspec.defstruct(
+        "HybridHit",
+        [
+            ("vector_id", Any, None),
+            ("text_content", Any, ""),
+            ("score", Any, 0.0),
+            ("user_id", Any, ""),
+            ("agent_id", Any, ""),
+            ("run_id", Any, ""),
+            ("actor_id", Any, ""),
+            ("hash", Any, ""),
+            ("created_at", Any, ""),
+            ("updated_at", Any, ""),
+            ("category", Any, ""),
+            ("metadata_json", Any, {}),
+        ],
+        bases=(_HybridHitStruct,),
+        rename={
+            "vector_id": primary_field,
+            "text_content": text_field,
+            "score": "_score",
+            "metadata_json": metadata_field,
+        },
+    )
+    return msgspec.json.Decoder(List[hit_type])
+
 
 class OceanBaseUtil:
     """Utility class for OceanBase database checks and information retrieval."""
 
     @staticmethod
-    def check_table_exists(obvector, table_name: str) -> bool:
+    def check_table_exists(obvector, table_name: str, conn=None) -> bool:
         """
         Check if a table exists.
 
         Args:
             obvector: The ObVecClient instance.
             table_name: The name of the table.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             True if the table exists, False otherwise.
         """
         try:
-            with obvector.engine.connect() as conn:
-                result = conn.execute(text(
-                    f"SELECT COUNT(*) FROM information_schema.TABLES "
-                    f"WHERE TABLE_SCHEMA = DATABASE() "
-                    f"AND TABLE_NAME = '{table_name}'"
-                ))
-                return result.scalar() > 0
+            with _connection(obvector, conn) as conn:
+                result = conn.execute(_TABLE_EXISTS_SQL, {"table_name": table_name})
+                return result.first() is not None
         except Exception as e:
             logger.error(f"An error occurred while checking if table exists: {e}")
             return False
 
     @staticmethod
-    def check_column_exists(obvector, table_name: str, column_name: str) -> bool:
+    def check_column_exists(obvector, table_name: str, column_name: str, conn=None) -> bool:
         """
         Check if a column exists in a table.
 
@@ -60,26 +302,24 @@ class OceanBaseUtil:
             obvector: The ObVecClient instance.
             table_name: The name of the table.
             column_name: The name of the column.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             True if the column exists, False otherwise.
         """
         try:
-            with obvector.engine.connect() as conn:
-                result = conn.execute(text(
-                    f"SELECT COUNT(*) FROM information_schema.COLUMNS "
-                    f"WHERE TABLE_SCHEMA = DATABASE() "
-                    f"AND TABLE_NAME = '{table_name}' "
-                    f"AND COLUMN_NAME = '{column_name}'"
-                ))
-                return result.scalar() > 0
+            with _connection(obvector, conn) as conn:
+                result = conn.execute(
+                    _COLUMN_EXISTS_SQL, {"table_name": table_name, "column_name": column_name}
+                )
+                return result.first() is not None
         except Exception as e:
             logger.error(f"An error occurred while checking if column exists: {e}")
             return False
 
     @staticmethod
     def check_sparse_vector_column_exists(
-        obvector, collection_name: str, sparse_vector_field: str
+        obvector, collection_name: str, sparse_vector_field: str, conn=None
     ) -> bool:
         """
         Check if the sparse vector column exists.
@@ -88,15 +328,16 @@ class OceanBaseUtil:
             obvector: The ObVecClient instance.
             collection_name: The name of the collection/table.
             sparse_vector_field: The name of the sparse vector field.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             True if the sparse vector column exists, False otherwise.
         """
         # Use the generic check_column_exists method
-        return OceanBaseUtil.check_column_exists(obvector, collection_name, sparse_vector_field)
+        return OceanBaseUtil.check_column_exists(obvector, collection_name, sparse_vector_field, conn)
 
     @staticmethod
-    def check_index_exists(obvector, table_name: str, index_name: str) -> bool:
+    def check_index_exists(obvector, table_name: str, index_name: str, conn=None) -> bool:
         """
         Check if an index exists on a table (generic index check method).
 
@@ -104,40 +345,141 @@ class OceanBaseUtil:
             obvector: The ObVecClient instance.
             table_name: The name of the table.
             index_name: The name of the index.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             True if the index exists, False otherwise.
         """
         try:
-            with obvector.engine.connect() as conn:
-                result = conn.execute(text(
-                    f"SELECT COUNT(*) FROM information_schema.STATISTICS "
-                    f"WHERE TABLE_SCHEMA = DATABASE() "
-                    f"AND TABLE_NAME = '{table_name}' "
-                    f"AND INDEX_NAME = '{index_name}'"
-                ))
-                return result.scalar() > 0
+            with _connection(obvector, conn) as conn:
+                result = conn.execute(
+                    _INDEX_EXISTS_SQL, {"table_name": table_name, "index_name": index_name}
+                )
+                return result.first() is not None
         except Exception as e:
             logger.error(f"An error occurred while checking if index exists: {e}")
             return False
 
     @staticmethod
-    def check_sparse_vector_index_exists(obvector, collection_name: str) -> bool:
+    def _fetch_existing_names(obvector, stmt, params: Dict, names: List[str], conn=None) -> set:
+        """Run an information_schema lookup with an expanding IN (:names) clause."""
+        with _connection(obvector, conn) as conn:
+            result = conn.execute(stmt, {**params, "names": names})
+            return {row[0] for row in result}
+
+    @staticmethod
+    def check_tables_exist(obvector, table_names: Iterable[str], conn=None) -> Dict[str, bool]:
+        """
+        Check whether several tables exist with a single query.
+
+        Args:
+            obvector: The ObVecClient instance.
+            table_names: The names of the tables.
+            conn: Optional open connection to reuse instead of acquiring one.
+
+        Returns:
+            Dictionary mapping each table name to True if it exists, False otherwise.
+        """
+        table_names = list(table_names)
+        if not table_names:
+            return {}
+        try:
+            existing = OceanBaseUtil._fetch_existing_names(
+                obvector,
+                _TABLES_EXIST_SQL,
+                {},
+                table_names,
+                conn,
+            )
+        except Exception as e:
+            logger.error(f"An error occurred while checking if tables exist: {e}")
+            existing = set()
+        return {name: name in existing for name in table_names}
+
+    @staticmethod
+    def check_columns_exist(
+        obvector, table_name: str, column_names: Iterable[str], conn=None
+    ) -> Dict[str, bool]:
+        """
+        Check whether several columns exist in a table with a single query.
+
+        Args:
+            obvector: The ObVecClient instance.
+            table_name: The name of the table.
+            column_names: The names of the columns.
+            conn: Optional open connection to reuse instead of acquiring one.
+
+        Returns:
+            Dictionary mapping each column name to True if it exists, False otherwise.
+        """
+        column_names = list(column_names)
+        if not column_names:
+            return {}
+        try:
+            existing = OceanBaseUtil._fetch_existing_names(
+                obvector,
+                _COLUMNS_EXIST_SQL,
+                {"table_name": table_name},
+                column_names,
+                conn,
+            )
+        except Exception as e:
+            logger.error(f"An error occurred while checking if columns exist: {e}")
+            existing = set()
+        return {name: name in existing for name in column_names}
+
+    @staticmethod
+    def check_indexes_exist(
+        obvector, table_name: str, index_names: Iterable[str], conn=None
+    ) -> Dict[str, bool]:
+        """
+        Check whether several indexes exist on a table with a single query.
+
+        Args:
+            obvector: The ObVecClient instance.
+            table_name: The name of the table.
+            index_names: The names of the indexes.
+            conn: Optional open connection to reuse instead of acquiring one.
+
+        Returns:
+            Dictionary mapping each index name to True if it exists, False otherwise.
+        """
+        index_names = list(index_names)
+        if not index_names:
+            return {}
+        try:
+            existing = OceanBaseUtil._fetch_existing_names(
+                obvector,
+                _INDEXES_EXIST_SQL,
+                {"table_name": table_name},
+                index_names,
+                conn,
+            )
+        except Exception as e:
+            logger.error(f"An error occurred while checking if indexes exist: {e}")
+            existing = set()
+        return {name: name in existing for name in index_names}
+
+    @staticmethod
+    def check_sparse_vector_index_exists(obvector, collection_name: str, conn=None) -> bool:
         """
         Check if the sparse vector index exists.
 
         Args:
             obvector: The ObVecClient instance.
             collection_name: The name of the collection/table.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             True if the sparse vector index exists, False otherwise.
         """
         # Use the generic check_index_exists method
-        return OceanBaseUtil.check_index_exists(obvector, collection_name, "sparse_embedding_idx")
+        return OceanBaseUtil.check_index_exists(obvector, collection_name, "sparse_embedding_idx", conn)
 
     @staticmethod
-    def check_fulltext_index_exists(obvector, collection_name: str, fulltext_field: str) -> bool:
+    def check_fulltext_index_exists(
+        obvector, collection_name: str, fulltext_field: str, conn=None
+    ) -> bool:
         """
         Check if the full-text index of the specified table exists.
 
@@ -145,142 +487,146 @@ class OceanBaseUtil:
             obvector: The ObVecClient instance.
             collection_name: The name of the collection/table.
             fulltext_field: The name of the fulltext field.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             True if the full-text index exists, False otherwise.
         """
         try:
-            with obvector.engine.connect() as conn:
-                result = conn.execute(text(f"SHOW INDEX FROM {collection_name}"))
-                indexes = result.fetchall()
-
-                for index in indexes:
-                    # Index [2] is the index name, index [4] is the column name, and index [10] is the index type
-                    if len(index) > 10 and index[10] == 'FULLTEXT':
-                        if fulltext_field in str(index[4]):
-                            return True
-
-                return False
+            with _connection(obvector, conn) as conn:
+                # Let the server filter the index metadata down to a single row
+                result = conn.execute(
+                    _FULLTEXT_INDEX_EXISTS_SQL,
+                    {"table_name": collection_name, "column_name": fulltext_field},
+                )
+                return result.first() is not None
 
         except Exception as e:
             logger.error(f"An error occurred while checking the full-text index: {e}")
             return False
 
     @staticmethod
-    def is_seekdb(obvector) -> bool:
+    def _get_version_string(obvector, conn=None) -> Optional[str]:
         """
-        Check if the database is seekdb.
+        Get the raw database version string, cached per engine.
+
+        Runs SELECT VERSION() (falling back to SHOW VARIABLES LIKE 'version')
+        at most once per engine, so repeated version checks cost no round-trip.
 
         Args:
             obvector: The ObVecClient instance.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
-            True if database is seekdb, False otherwise.
+            The stripped version string, or None if it cannot be determined.
         """
+        engine = obvector.engine
         try:
-            with obvector.engine.connect() as conn:
-                # Try to get version information
+            cached = _VERSION_CACHE.get(engine)
+        except TypeError:
+            # Engine is not weak-referenceable; skip caching
+            cached = None
+        if cached is not None:
+            return cached
+
+        try:
+            with _connection(obvector, conn) as conn:
                 # OceanBase uses SELECT VERSION() or SHOW VARIABLES LIKE 'version'
                 try:
-                    result = conn.execute(text("SELECT VERSION()"))
+                    result = conn.execute(_VERSION_SQL)
                     version_str = result.fetchone()[0]
                 except Exception:
                     # Fallback to SHOW VARIABLES
                     try:
-                        result = conn.execute(text("SHOW VARIABLES LIKE 'version'"))
+                        result = conn.execute(_VERSION_VARIABLE_SQL)
                         row = result.fetchone()
                         version_str = row[1] if row else ""
                     except Exception:
-                        return False
+                        return None
+        except Exception as e:
+            logger.warning(f"Error getting database version: {e}")
+            return None
 
-                if not version_str:
-                    return False
+        if not version_str:
+            return None
 
-                version_str = str(version_str).strip().lower()
-                return "seekdb" in version_str
+        version_str = str(version_str).strip()
+        try:
+            _VERSION_CACHE[engine] = version_str
+        except TypeError:
+            pass
+        return version_str
 
-        except Exception as e:
-            logger.warning(f"Error checking if database is seekdb: {e}")
+    @staticmethod
+    def is_seekdb(obvector, conn=None) -> bool:
+        """
+        Check if the database is seekdb.
+
+        Args:
+            obvector: The ObVecClient instance.
+            conn: Optional open connection to reuse instead of acquiring one.
+
+        Returns:
+            True if database is seekdb, False otherwise.
+        """
+        version_str = OceanBaseUtil._get_version_string(obvector, conn)
+        if not version_str:
             return False
+        return "seekdb" in version_str.lower()
 
     @staticmethod
-    def get_version_number(obvector) -> Optional[Dict[str, int]]:
+    def get_version_number(obvector, conn=None) -> Optional[Dict[str, int]]:
         """
         Get the database version number.
 
         Args:
             obvector: The ObVecClient instance.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             Dictionary with keys "major", "minor", "patch" and int values, e.g., {"major": 4, "minor": 5, "patch": 0}.
             Returns None if version cannot be determined.
         """
-        try:
-            with obvector.engine.connect() as conn:
-                # Try to get version information
-                # OceanBase uses SELECT VERSION() or SHOW VARIABLES LIKE 'version'
-                try:
-                    result = conn.execute(text("SELECT VERSION()"))
-                    version_str = result.fetchone()[0]
-                except Exception:
-                    # Fallback to SHOW VARIABLES
-                    try:
-                        result = conn.execute(text("SHOW VARIABLES LIKE 'version'"))
-                        row = result.fetchone()
-                        version_str = row[1] if row else ""
-                    except Exception:
-                        return None
-
-                if not version_str:
-                    return None
-
-                version_str = str(version_str).strip()
-                # Parse version string
-                # For OceanBase, prioritize the actual OceanBase version (e.g., "5.7.25-OceanBase_CE-v4.3.5.5" -> 4.3.5)
-                # First try to match OceanBase version pattern
-                version_match = re.search(r'OceanBase[^v]*[vV]?(\d+)\.(\d+)\.(\d+)', version_str)
-                if not version_match:
-                    version_match = re.search(r'[vV]?(\d+)\.(\d+)\.(\d+)', version_str)
-                
-                if version_match:
-                    major = int(version_match.group(1))
-                    minor = int(version_match.group(2))
-                    patch = int(version_match.group(3))
-                    return {"major": major, "minor": minor, "patch": patch}
-                else:
-                    return None
+        version = OceanBaseUtil._get_version_tuple(obvector, conn)
+        if version is None:
+            return None
+        major, minor, patch = version
+        return {"major": major, "minor": minor, "patch": patch}
 
-        except Exception as e:
-            logger.warning(f"Error getting database version number: {e}")
+    @staticmethod
+    def _get_version_tuple(obvector, conn=None) -> Optional[Tuple[int, int, int]]:
+        """Get the database version as a comparable (major, minor, patch) tuple."""
+        version_str = OceanBaseUtil._get_version_string(obvector, conn)
+        if not version_str:
             return None
+        return _parse_version(version_str)
 
     @staticmethod
-    def check_sparse_vector_version_support(obvector) -> bool:
+    def check_sparse_vector_version_support(obvector, conn=None) -> bool:
         """
         Check if the database version supports sparse vector.
 
         Args:
             obvector: The ObVecClient instance.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             True if version is seekdb or OceanBase >= 4.5.0, False otherwise.
         """
         # Check if it's seekdb
-        if OceanBaseUtil.is_seekdb(obvector):
+        if OceanBaseUtil.is_seekdb(obvector, conn):
             logger.info("Detected seekdb, sparse vector is supported")
             return True
 
         # Check if it's OceanBase and version >= 4.5.0
-        version_dict = OceanBaseUtil.get_version_number(obvector)
-        if version_dict is None:
+        version = OceanBaseUtil._get_version_tuple(obvector, conn)
+        if version is None:
             logger.warning("Could not determine database version, assuming sparse vector not supported")
             return False
 
-        major = version_dict["major"]
-        minor = version_dict["minor"]
-        patch = version_dict["patch"]
+        major, minor, patch = version
 
-        if major > 4 or (major == 4 and minor >= 5):
+        if version >= _SPARSE_VECTOR_MIN_VERSION:
             logger.info(f"Detected OceanBase version {major}.{minor}.{patch}, sparse vector is supported")
             return True
         else:
@@ -291,23 +637,33 @@ class OceanBaseUtil:
             return False
 
     @staticmethod
-    def check_native_hybrid_version_support(obvector, table_name: str) -> bool:
+    def check_native_hybrid_version_support(obvector, table_name: str, conn=None) -> bool:
         """
         Check if the database version and table type support native hybrid search (DBMS_HYBRID_SEARCH.SEARCH).
 
         Args:
             obvector: The ObVecClient instance.
             table_name: The name of the table.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             True if version is seekdb or OceanBase >= 4.4.1, and table is heap table or doesn't exist.
             False otherwise.
         """
+        if conn is None:
+            # Run the version probe and the table check over one pooled connection
+            try:
+                with obvector.engine.connect() as conn:
+                    return OceanBaseUtil.check_native_hybrid_version_support(obvector, table_name, conn)
+            except Exception as e:
+                logger.warning(f"Error checking native hybrid search support: {e}")
+                return False
+
         # Check if it's seekdb
-        if OceanBaseUtil.is_seekdb(obvector):
+        if OceanBaseUtil.is_seekdb(obvector, conn):
             logger.info("Detected seekdb, native hybrid search is supported")
             # Also check if table is heap table (or doesn't exist)
-            if not OceanBaseUtil.check_table_is_heap_or_not_exists(obvector, table_name):
+            if not OceanBaseUtil.check_table_is_heap_or_not_exists(obvector, table_name, conn):
                 logger.warning(
                     f"Table '{table_name}' is not a heap table (ORGANIZATION HEAP). "
                     "Native hybrid search requires heap table."
@@ -316,20 +672,17 @@ class OceanBaseUtil:
             return True
 
         # Check if it's OceanBase and version >= 4.4.1
-        version_dict = OceanBaseUtil.get_version_number(obvector)
-        if version_dict is None:
+        version = OceanBaseUtil._get_version_tuple(obvector, conn)
+        if version is None:
             logger.warning("Could not determine database version, assuming native hybrid search not supported")
             return False
 
-        major = version_dict["major"]
-        minor = version_dict["minor"]
-        patch = version_dict["patch"]
+        major, minor, patch = version
 
-        # Check version >= 4.4.1
-        if major > 4 or (major == 4 and (minor > 4 or (minor == 4 and patch >= 1))):
+        if version >= _NATIVE_HYBRID_MIN_VERSION:
             logger.info(f"Detected OceanBase version {major}.{minor}.{patch}, native hybrid search is supported")
             # Also check if table is heap table (or doesn't exist)
-            if not OceanBaseUtil.check_table_is_heap_or_not_exists(obvector, table_name):
+            if not OceanBaseUtil.check_table_is_heap_or_not_exists(obvector, table_name, conn):
                 logger.warning(
                     f"Table '{table_name}' is not a heap table (ORGANIZATION HEAP). "
                     "Native hybrid search requires heap table."
@@ -344,7 +697,7 @@ class OceanBaseUtil:
             return False
 
     @staticmethod
-    def check_table_is_heap_or_not_exists(obvector, table_name: str) -> bool:
+    def check_table_is_heap_or_not_exists(obvector, table_name: str, conn=None) -> bool:
         """
         Check if the table is a heap table (ORGANIZATION HEAP) or doesn't exist.
 
@@ -353,40 +706,37 @@ class OceanBaseUtil:
         Args:
             obvector: The ObVecClient instance.
             table_name: The name of the table.
+            conn: Optional open connection to reuse instead of acquiring one.
 
         Returns:
             True if table is heap table or doesn't exist, False if it's index-organized table.
         """
         try:
-            with obvector.engine.connect() as conn:
-                # Check if table exists first
-                result = conn.execute(text(
-                    f"SELECT COUNT(*) FROM information_schema.TABLES "
-                    f"WHERE TABLE_SCHEMA = DATABASE() "
-                    f"AND TABLE_NAME = '{table_name}'"
-                ))
-                if result.scalar() == 0:
+            with _connection(obvector, conn) as conn:
+                # A single SHOW CREATE TABLE doubles as the existence probe
+                try:
+                    result = conn.execute(text(f"SHOW CREATE TABLE `{table_name}`"))
+                except Exception as e:
+                    if not _is_table_not_found_error(e):
+                        raise
                     # Table doesn't exist, will be created as heap table
                     logger.debug(f"Table '{table_name}' doesn't exist, will be created as heap table")
                     return True
 
-                # Check table organization type using SHOW CREATE TABLE
-                result = conn.execute(text(f"SHOW CREATE TABLE `{table_name}`"))
                 row = result.fetchone()
                 if row and len(row) >= 2:
-                    create_statement = row[1]
                     # Check for ORGANIZATION keyword
-                    if "ORGANIZATION INDEX" in create_statement.upper():
-                        logger.debug(f"Table '{table_name}' is an index-organized table")
-                        return False
-                    elif "ORGANIZATION HEAP" in create_statement.upper():
-                        logger.debug(f"Table '{table_name}' is a heap table")
-                        return True
-                    else:
+                    match = _ORGANIZATION_RE.search(row[1])
+                    if match is None:
                         # No ORGANIZATION keyword, default is index-organized in OceanBase
                         # when table has primary key
                         logger.debug(f"Table '{table_name}' has no explicit ORGANIZATION, assuming index-organized")
                         return False
+                    if match.group(1).upper() == "HEAP":
+                        logger.debug(f"Table '{table_name}' is a heap table")
+                        return True
+                    logger.debug(f"Table '{table_name}' is an index-organized table")
+                    return False
                 return False
         except Exception as e:
             logger.error(f"An error occurred while checking table organization type: {e}")
@@ -405,7 +755,14 @@ class OceanBaseUtil:
         """
         if not sparse_dict:
             return "{}"
-        formatted = "{" + ", ".join(f"{k}:{v}" for k, v in sparse_dict.items()) + "}"
+        # Token ids from vocab-mapped tokenizers are mostly small ints, whose
+        # string forms are precomputed; weights keep their exact str() form
+        int_strs = _TOKEN_ID_STRS
+        limit = len(int_strs)
+        formatted = "{" + ", ".join(
+            (int_strs[k] if 0 <= k < limit else str(k)) + ":" + str(v)
+            for k, v in sparse_dict.items()
+        ) + "}"
         return formatted
 
     @staticmethod
@@ -432,24 +789,13 @@ class OceanBaseUtil:
         Raises:
             ValueError: If parser name is not supported
         """
-        parser_mapping = {
-            'ik': FtsParser.IK,
-            'ngram': FtsParser.NGRAM,
-            'ngram2': FtsParser.NGRAM2,
-            'beng': FtsParser.BASIC_ENGLISH,
-            'space': None,
-            'jieba': FtsParser.JIEBA,
-        }
-        
-        parser_lower = parser_name.lower()
-        if parser_lower not in parser_mapping:
-            supported = ', '.join(parser_mapping.keys())
+        try:
+            return _FTS_PARSER_MAP[parser_name.lower()]
+        except KeyError:
             raise ValueError(
                 f"Unsupported fulltext parser: {parser_name}. "
-                f"Supported parsers are: {supported}"
-            )
-        
-        return parser_mapping[parser_lower]
+                f"Supported parsers are: {_FTS_SUPPORTED_PARSERS}"
+            ) from None
 
     @staticmethod
     def parse_metadata(metadata_json):
@@ -464,18 +810,15 @@ class OceanBaseUtil:
             return metadata_json
         elif isinstance(metadata_json, str):
             # Legacy compatibility: handle manually serialized strings
+            if not metadata_json or metadata_json == "{}":
+                return {}
             try:
-                # First attempt to parse
-                metadata = json.loads(metadata_json)
-                # Check if it's still a string (double encoded - legacy bug)
-                if isinstance(metadata, str):
-                    try:
-                        # Second attempt to parse
-                        metadata = json.loads(metadata)
-                    except json.JSONDecodeError:
-                        metadata = {}
+                metadata = _json_loads(metadata_json)
+                # Only a JSON string literal can be double encoded (legacy bug)
+                if metadata_json[0] == '"' and isinstance(metadata, str):
+                    metadata = _json_loads(metadata)
                 return metadata
-            except json.JSONDecodeError:
+            except ValueError:
                 return {}
         else:
             return {}
@@ -500,8 +843,23 @@ class OceanBaseUtil:
         Returns:
             bool: True if sparse vector is fully supported, False otherwise.
         """
+        try:
+            # Run all checks over one pooled connection
+            with obvector.engine.connect() as conn:
+                return OceanBaseUtil._check_sparse_vector_ready(
+                    obvector, collection_name, sparse_vector_field, conn
+                )
+        except Exception as e:
+            logger.warning(f"Sparse vector support disabled: error checking database: {e}")
+            return False
+
+    @staticmethod
+    def _check_sparse_vector_ready(
+        obvector, collection_name: str, sparse_vector_field: str, conn
+    ) -> bool:
+        """Run the check_sparse_vector_ready checks on an open connection."""
         # Check if database version supports sparse vector
-        if not OceanBaseUtil.check_sparse_vector_version_support(obvector):
+        if not OceanBaseUtil.check_sparse_vector_version_support(obvector, conn):
             logger.warning(
                 "Sparse vector support disabled: Database version does not support sparse vector. "
                 "Sparse vector requires seekdb or OceanBase >= 4.5.0. "
@@ -510,7 +868,7 @@ class OceanBaseUtil:
             return False
 
         # Check if sparse_embedding column exists
-        if not OceanBaseUtil.check_sparse_vector_column_exists(obvector, collection_name, sparse_vector_field):
+        if not OceanBaseUtil.check_sparse_vector_column_exists(obvector, collection_name, sparse_vector_field, conn):
             logger.warning(
                 f"Sparse vector support disabled: Table '{collection_name}' does not have sparse_embedding column. "
                 f"Please run the upgrade script to enable sparse vector support:\n"
@@ -522,7 +880,7 @@ class OceanBaseUtil:
             return False
 
         # Check if sparse_embedding_idx index exists
-        if not OceanBaseUtil.check_sparse_vector_index_exists(obvector, collection_name):
+        if not OceanBaseUtil.check_sparse_vector_index_exists(obvector, collection_name, conn):
             logger.warning(
                 f"Sparse vector support disabled: Table '{collection_name}' does not have sparse_embedding_idx index. "
                 f"Please run the upgrade script to enable sparse vector support:\n"
@@ -557,28 +915,24 @@ class OceanBaseUtil:
 
         # Get column names from model_class
         try:
-            table_columns = set(model_class.__table__.c.keys())
+            table_columns = _get_table_columns(model_class)
         except AttributeError:
             logger.warning("model_class does not have __table__ attribute, native hybrid search disabled")
             return False
 
-        def check_filter_keys(filter_dict: Dict) -> bool:
-            """Recursively check if all keys are in table columns."""
+        # Walk nested AND/OR groups with an explicit stack instead of recursion
+        stack = [filters]
+        while stack:
+            filter_dict = stack.pop()
             for key, value in filter_dict.items():
                 # Handle AND/OR logic
-                if key in ["AND", "OR"]:
+                if key in _LOGICAL_OPS:
                     if isinstance(value, list):
-                        for sub_filter in value:
-                            if not check_filter_keys(sub_filter):
-                                return False
-                else:
-                    # Check if this key is a table column
-                    if key not in table_columns:
-                        logger.debug(f"Filter field '{key}' not in table columns, native hybrid search disabled")
-                        return False
-            return True
-
-        return check_filter_keys(filters)
+                        stack.extend(value)
+                elif key not in table_columns:
+                    logger.debug(f"Filter field '{key}' not in table columns, native hybrid search disabled")
+                    return False
+        return True
 
     @staticmethod
     def convert_filters_to_native_format(
@@ -608,10 +962,10 @@ class OceanBaseUtil:
 
         # Get column names from model_class
         try:
-            table_columns = set(model_class.__table__.c.keys())
+            table_columns = _get_table_columns(model_class)
         except AttributeError:
             logger.warning("model_class does not have __table__ attribute")
-            table_columns = set()
+            table_columns = frozenset()
 
         def get_field_name(key: str) -> Optional[str]:
             """Get the field name for filter."""
@@ -630,53 +984,28 @@ class OceanBaseUtil:
 
             # List values -> IN query -> bool.should with multiple term queries
             if isinstance(value, list):
-                if not value:
-                    return None
-                return {
-                    "bool": {
-                        "should": [{"term": {field_name: v}} for v in value]
-                    }
-                }
+                return _in_filter(field_name, value)
 
             # Dict values -> May be range query or other operators
             if isinstance(value, dict):
-                range_ops = {"gte", "gt", "lte", "lt"}
-                if any(op in value for op in range_ops):
-                    range_params = {op: value[op] for op in range_ops if op in value}
+                if not value.keys().isdisjoint(_RANGE_OPS):
+                    range_params = {}
+                    for op in _RANGE_OPS:
+                        if op in value:
+                            range_params[op] = value[op]
                     return {"range": {field_name: range_params}}
 
-                if "eq" in value:
-                    return {"term": {field_name: value["eq"]}}
-
-                if "ne" in value:
-                    return {"bool": {"must_not": [{"term": {field_name: value["ne"]}}]}}
-
-                if "in" in value:
-                    if not isinstance(value["in"], list) or not value["in"]:
-                        return None
-                    return {
-                        "bool": {
-                            "should": [{"term": {field_name: v}} for v in value["in"]]
-                        }
-                    }
-
-                if "nin" in value:
-                    if not isinstance(value["nin"], list) or not value["nin"]:
-                        return None
-                    return {
-                        "bool": {
-                            "must_not": [
-                                {"bool": {"should": [{"term": {field_name: v}} for v in value["nin"]]}}
-                            ]
-                        }
-                    }
-
-                if "like" in value or "ilike" in value:
-                    query_str = value.get("like") or value.get("ilike")
-                    query_str = str(query_str).replace("%", "").replace("_", " ").strip()
-                    if query_str:
-                        return {"match": {field_name: {"query": query_str}}}
-                    return None
+                if len(value) == 1:
+                    # Common case: a single operator, resolved with one lookup
+                    op, operand = next(iter(value.items()))
+                    handler = _FILTER_OP_HANDLERS.get(op)
+                    if handler is not None:
+                        return handler(field_name, operand)
+                else:
+                    # Several operators: the first one in handler order wins
+                    for op, handler in _FILTER_OP_HANDLERS.items():
+                        if op in value:
+                            return handler(field_name, value[op])
 
             # None values -> Not supported, skip
             if value is None:
@@ -686,56 +1015,56 @@ class OceanBaseUtil:
             # Simple values -> term query
             return {"term": {field_name: value}}
 
-        def process_complex_filter(filters_dict: Dict) -> List[Dict]:
-            """Process complex filters with AND/OR logic."""
-            if "AND" in filters_dict:
-                conditions = []
-                for sub_filter in filters_dict["AND"]:
-                    result = process_complex_filter(sub_filter)
-                    if result:
-                        conditions.extend(result)
-                if conditions:
-                    return [{"bool": {"filter": conditions}}]
-                return []
-
-            if "OR" in filters_dict:
-                conditions = []
-                for sub_filter in filters_dict["OR"]:
-                    result = process_complex_filter(sub_filter)
-                    if result:
-                        conditions.extend(result)
-                if conditions:
-                    return [{"bool": {"should": conditions}}]
-                return []
+        # Process AND/OR groups with an explicit work stack. Each entry is either
+        # a filter dict to expand into an output list, or a pending bool clause
+        # that is emitted into its parent once all of its children are done.
+        output: List[Dict] = []
+        stack = [(filters, output, None)]
+        while stack:
+            node, out, clause = stack.pop()
+
+            if clause is not None:
+                if node:
+                    out.append({"bool": {clause: node}})
+                continue
+
+            if "AND" in node or "OR" in node:
+                if "AND" in node:
+                    sub_filters, clause = node["AND"], "filter"
+                else:
+                    sub_filters, clause = node["OR"], "should"
+                conditions: List[Dict] = []
+                stack.append((conditions, out, clause))
+                for sub_filter in reversed(sub_filters):
+                    stack.append((sub_filter, conditions, None))
+                continue
 
-            results = []
-            for k, v in filters_dict.items():
-                if k not in ["AND", "OR"]:
-                    result = process_single_filter(k, v)
-                    if result:
-                        results.append(result)
-            return results
+            for k, v in node.items():
+                result = process_single_filter(k, v)
+                if result:
+                    out.append(result)
 
-        return process_complex_filter(filters)
+        return output
 
     @staticmethod
     def parse_native_hybrid_results(
-        result_json_str: str,
+        result_json_str: Union[str, bytes],
         primary_field: str = "id",
         text_field: str = "document",
         metadata_field: str = "metadata"
-    ) -> List[Dict]:
+    ) -> List[HybridHit]:
         """
         Parse the JSON results from OceanBase native DBMS_HYBRID_SEARCH.SEARCH.
 
         Args:
-            result_json_str: JSON string returned from DBMS_HYBRID_SEARCH.SEARCH
+            result_json_str: JSON string (or bytes) returned from DBMS_HYBRID_SEARCH.SEARCH
             primary_field: Name of the primary key field
             text_field: Name of the text content field
             metadata_field: Name of the metadata field
 
         Returns:
-            List[Dict]: List of parsed result dictionaries, each containing:
+            List[HybridHit]: List of parsed results (msgspec structs with the same
+            attributes when msgspec is installed), each with attributes:
                 - vector_id: Primary key value
                 - text_content: Text content
                 - score: Relevance score from _score field
@@ -743,39 +1072,57 @@ class OceanBaseUtil:
                 - hash, created_at, updated_at, category: Standard fields
                 - metadata_json: Raw metadata JSON
         """
+        if not result_json_str:
+            return []
+
+        if msgspec is not None:
+            try:
+                hits = _hybrid_hit_decoder(primary_field, text_field, metadata_field).decode(result_json_str)
+            except msgspec.DecodeError:
+                # Malformed or unexpected payload: let the generic path report it
+                pass
+            else:
+                output_list = [hit for hit in hits if hit.vector_id]
+                skipped = len(hits) - len(output_list)
+                if skipped and logger.isEnabledFor(logging.WARNING):
+                    logger.warning(f"{skipped} document(s) missing primary key '{primary_field}', skipping")
+                logger.debug("Parsed %d results from native hybrid search", len(output_list))
+                return output_list
+
         try:
-            result_data = json.loads(result_json_str)
+            # orjson accepts bytes directly, so driver results need no decoding
+            result_data = _json_loads(result_json_str)
 
             if not isinstance(result_data, list):
                 logger.warning(f"Unexpected result format: {type(result_data)}, expected list")
                 return []
 
-            output_list = []
-
-            for doc in result_data:
-                vector_id = doc.get(primary_field)
-                score = doc.get("_score", 0.0)
-
-                if not vector_id:
-                    logger.warning(f"Document missing primary key '{primary_field}', skipping")
-                    continue
-
-                output_list.append({
-                    "vector_id": vector_id,
-                    "text_content": doc.get(text_field, ""),
-                    "score": score,
-                    "user_id": doc.get("user_id", ""),
-                    "agent_id": doc.get("agent_id", ""),
-                    "run_id": doc.get("run_id", ""),
-                    "actor_id": doc.get("actor_id", ""),
-                    "hash": doc.get("hash", ""),
-                    "created_at": doc.get("created_at", ""),
-                    "updated_at": doc.get("updated_at", ""),
-                    "category": doc.get("category", ""),
-                    "metadata_json": doc.get(metadata_field, {}),
-                })
-
-            logger.debug(f"Parsed {len(output_list)} results from native hybrid search")
+            _get = dict.get
+            output_list = [
+                HybridHit(
+                    vector_id,
+                    _get(doc, text_field, ""),
+                    _get(doc, "_score", 0.0),
+                    _get(doc, "user_id", ""),
+                    _get(doc, "agent_id", ""),
+                    _get(doc, "run_id", ""),
+                    _get(doc, "actor_id", ""),
+                    _get(doc, "hash", ""),
+                    _get(doc, "created_at", ""),
+                    _get(doc, "updated_at", ""),
+                    _get(doc, "category", ""),
+                    _get(doc, metadata_field, {}),
+                )
+                for doc in result_data
+                if (vector_id := _get(doc, primary_field))
+            ]
+
+            # Report documents without a primary key once, not per document
+            skipped = len(result_data) - len(output_list)
+            if skipped and logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"{skipped} document(s) missing primary key '{primary_field}', skipping")
+
+            logger.debug("Parsed %d results from native hybrid search", len(output_list))
             return output_list
 
         except json.JSONDecodeError as e:
@@ -2,6 +2,7 @@
 Agent memory API routes
 """
 
+import asyncio
 from typing import Optional
 from fastapi import APIRouter, Depends, Query, Request
 from slowapi import Limiter
@@ -45,7 +46,8 @@ async def get_agent_memories(
     service: AgentService = Depends(get_agent_service),
 ):
     """Get all memories for an agent"""
-    memories = service.get_agent_memories(
+    memories = await asyncio.to_thread(
+        service.get_agent_memories,
         agent_id=agent_id,
         limit=limit,
         offset=offset,
@@ -82,7 +84,8 @@ async def create_agent_memory(
     service: AgentService = Depends(get_agent_service),
 ):
     """Create a memory for an agent"""
-    result = service.create_agent_memory(
+    result = await asyncio.to_thread(
+        service.create_agent_memory,
         agent_id=agent_id,
         content=body.content,
         user_id=body.user_id,
@@ -113,7 +116,8 @@ async def share_agent_memories(
     service: AgentService = Depends(get_agent_service),
 ):
     """Share memories between agents"""
-    result = service.share_memories(
+    result = await asyncio.to_thread(
+        service.share_memories,
         agent_id=agent_id,
         target_agent_id=body.target_agent_id,
         memory_ids=body.memory_ids,
@@ -142,7 +146,8 @@ async def get_shared_memories(
     service: AgentService = Depends(get_agent_service),
 ):
     """Get shared memories for an agent"""
-    memories = service.get_shared_memories(
+    memories = await asyncio.to_thread(
+        service.get_shared_memories,
         agent_id=agent_id,
         limit=limit,
         offset=offset,
@@ -2,6 +2,7 @@
 Memory management API routes
 """
 
+import asyncio
 import logging
 from typing import List, Optional
 from datetime import datetime, timedelta, timezone
@@ -24,7 +25,7 @@ from ...models.response import (
 from ...services.memory_service import MemoryService
 from ...middleware.auth import verify_api_key
 from ...middleware.rate_limit import limiter, get_rate_limit_string
-from ...utils.converters import memory_dict_to_response
+from ...utils.converters import memory_dict_to_response, next_cursor
 
 logger = logging.getLogger("server")
 
@@ -116,7 +117,9 @@ async def batch_create_memories(
         for item in body.memories
     ]
     
-    result = service.batch_create_memories(
+    # Embedding and storage calls block, so run them off the event loop
+    result = await asyncio.to_thread(
+        service.batch_create_memories,
         memories=memories_data,
         user_id=body.user_id,
         agent_id=body.agent_id,
@@ -125,22 +128,26 @@ async def batch_create_memories(
     )
     
     # Convert created memories to response format
-    created_memories = []
-    for item in result["created"]:
-        try:
-            memory = service.get_memory(
-                memory_id=item["memory_id"],
-                user_id=body.user_id,
-                agent_id=body.agent_id,
-            )
-            created_memories.append(memory_dict_to_response(memory).model_dump(mode='json'))
-        except Exception as e:
-            logger.warning(f"Failed to retrieve created memory {item['memory_id']}: {e}")
-            # Include basic info even if full retrieval fails
-            created_memories.append({
-                "memory_id": item["memory_id"],
-                "content": item["content"],
-            })
+    def load_created_memories():
+        created_memories = []
+        for item in result["created"]:
+            try:
+                memory = service.get_memory(
+                    memory_id=item["memory_id"],
+                    user_id=body.user_id,
+                    agent_id=body.agent_id,
+                )
+                created_memories.append(memory_dict_to_response(memory).model_dump(mode='json'))
+            except Exception as e:
+                logger.warning(f"Failed to retrieve created memory {item['memory_id']}: {e}")
+                # Include basic info even if full retrieval fails
+                created_memories.append({
+                    "memory_id": item["memory_id"],
+                    "content": item["content"],
+                })
+        return created_memories
+    
+    created_memories = await asyncio.to_thread(load_created_memories)
     
     response_data = {
         "memories": created_memories,
@@ -175,6 +182,9 @@ async def list_memories(
     offset: int = Query(0, ge=0, description="Number of results to skip"),
     sort_by: Optional[str] = Query(None, description="Field to sort by: 'created_at', 'updated_at', 'id'"),
     order: str = Query("desc", description="Sort order: 'desc' (descending) or 'asc' (ascending)"),
+    after_id: Optional[int] = Query(
+        None, ge=0, description="Keyset cursor: return memories after this ID (use next_cursor; 0 starts)"
+    ),
     api_key: str = Depends(verify_api_key),
     service: MemoryService = Depends(get_memory_service),
 ):
@@ -193,6 +203,7 @@ async def list_memories(
         offset=offset,
         sort_by=sort_by,
         order=order,
+        after_id=after_id,
     )
     
     memory_responses = [memory_dict_to_response(m) for m in memories]
@@ -202,6 +213,7 @@ async def list_memories(
         total=total_count,  # Use actual total count
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor(memory_responses, limit, after_id),
     )
     
     return APIResponse(
@@ -366,28 +378,34 @@ async def batch_update_memories(
         for item in body.updates
     ]
     
-    result = service.batch_update_memories(
+    # Embedding and storage calls block, so run them off the event loop
+    result = await asyncio.to_thread(
+        service.batch_update_memories,
         updates=updates_data,
         user_id=body.user_id,
         agent_id=body.agent_id,
     )
     
     # Convert updated memories to response format
-    updated_memories = []
-    for item in result["updated"]:
-        try:
-            memory = service.get_memory(
-                memory_id=item["memory_id"],
-                user_id=body.user_id,
-                agent_id=body.agent_id,
-            )
-            updated_memories.append(memory_dict_to_response(memory).model_dump(mode='json'))
-        except Exception as e:
-            logger.warning(f"Failed to retrieve updated memory {item['memory_id']}: {e}")
-            # Include basic info even if full retrieval fails
-            updated_memories.append({
-                "memory_id": item["memory_id"],
-            })
+    def load_updated_memories():
+        updated_memories = []
+        for item in result["updated"]:
+            try:
+                memory = service.get_memory(
+                    memory_id=item["memory_id"],
+                    user_id=body.user_id,
+                    agent_id=body.agent_id,
+                )
+                updated_memories.append(memory_dict_to_response(memory).model_dump(mode='json'))
+            except Exception as e:
+                logger.warning(f"Failed to retrieve updated memory {item['memory_id']}: {e}")
+                # Include basic info even if full retrieval fails
+                updated_memories.append({
+                    "memory_id": item["memory_id"],
+                })
+        return updated_memories
+    
+    updated_memories = await asyncio.to_thread(load_updated_memories)
     
     response_data = {
         "memories": updated_memories,
@@ -464,7 +482,8 @@ async def bulk_delete_memories(
     service: MemoryService = Depends(get_memory_service),
 ):
     """Bulk delete memories"""
-    result = service.bulk_delete_memories(
+    result = await asyncio.to_thread(
+        service.bulk_delete_memories,
         memory_ids=body.memory_ids,
         user_id=body.user_id,
         agent_id=body.agent_id,
@@ -2,18 +2,24 @@
 System management API routes
 """
 
+import asyncio
+import os
+import threading
+from functools import lru_cache
 from fastapi import APIRouter, Depends, Request, Response, Query
 from slowapi import Limiter
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timezone
 
-from ...models.response import APIResponse, HealthResponse, StatusResponse
+from ...models.response import APIResponse, StatusResponse, format_utc_datetime, utc_now_iso
+from ...models.errors import ErrorCode, APIError
 from ...middleware.auth import verify_api_key
 from ...middleware.rate_limit import limiter, get_rate_limit_string
 from ...config import config
 from ...utils.metrics import get_metrics_collector
 from ...utils.health_check import check_all_dependencies
-from powermem import auto_config
+from ...utils.responses import ORJSONResponse, json_bytes
+from powermem import Memory, auto_config
 from powermem.version import __version__ as powermem_version
 
 # Import server start time from state module to avoid circular imports
@@ -21,6 +27,112 @@ from ...state import SERVER_START_TIME
 
 router = APIRouter(prefix="/system", tags=["system"])
 
+_memory: Optional[Memory] = None
+_memory_lock = threading.Lock()
+
+
+def _get_memory(request: Request) -> Memory:
+    """
+    Return the Memory used for admin operations.
+
+    Reuses the MemoryService singleton when the app started one, otherwise
+    builds a dedicated instance once on first use.
+    """
+    global _memory
+    memory_service = getattr(request.app.state, "memory_service", None)
+    if memory_service is not None:
+        return memory_service.memory
+    if _memory is None:
+        with _memory_lock:
+            if _memory is None:
+                _memory = Memory(config=auto_config())
+    return _memory
+
+
+@lru_cache(maxsize=1)
+def _cached_auto_config(reload_token: Optional[str] = None) -> Dict[str, Any]:
+    """Load the PowerMem config once per value of POWERMEM_CONFIG_RELOAD."""
+    return auto_config()
+
+
+@lru_cache(maxsize=1)
+def _get_provider_info(reload_token: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve (storage_type, llm_provider) from the cached PowerMem config."""
+    powermem_config = _cached_auto_config(reload_token)
+
+    storage_type = None
+    llm_provider = None
+
+    if isinstance(powermem_config, dict):
+        # Extract from dict config
+        vector_store = powermem_config.get("vector_store") or powermem_config.get("database", {})
+        storage_type = vector_store.get("provider") if isinstance(vector_store, dict) else None
+
+        llm = powermem_config.get("llm", {})
+        llm_provider = llm.get("provider") if isinstance(llm, dict) else None
+    else:
+        # Extract from config object
+        if hasattr(powermem_config, "vector_store") and powermem_config.vector_store:
+            storage_type = powermem_config.vector_store.provider
+        if hasattr(powermem_config, "llm") and powermem_config.llm:
+            llm_provider = powermem_config.llm.provider
+
+    return storage_type, llm_provider
+
+
+@lru_cache(maxsize=1)
+def _get_static_status_fields(reload_token: Optional[str] = None) -> Dict[str, Any]:
+    """Serialize the status fields that do not change while the server runs."""
+    storage_type, llm_provider = _get_provider_info(reload_token)
+    return StatusResponse(
+        status="operational",
+        version=powermem_version,
+        storage_type=storage_type,
+        llm_provider=llm_provider,
+        started_at=SERVER_START_TIME,
+    ).model_dump(mode='json', include={"version", "storage_type", "llm_provider", "started_at"})
+
+
+def _success_response(data: Any, message: str) -> ORJSONResponse:
+    """
+    Build an APIResponse-shaped response without instantiating the model.
+
+    Returning a Response also makes FastAPI skip response_model validation;
+    response_model stays on the routes for the OpenAPI schema.
+    """
+    return ORJSONResponse(
+        content={"success": True, "data": data, "message": message, "timestamp": utc_now_iso()}
+    )
+
+
+# Health body in APIResponse(HealthResponse) shape, pre-encoded around the
+# two timestamps so liveness probes skip model construction and validation
+_HEALTH_HEAD, _HEALTH_MID, _HEALTH_TAIL = json_bytes({
+    "success": True,
+    "data": {"status": "healthy", "timestamp": "\x00"},
+    "message": "Service is healthy",
+    "timestamp": "\x00",
+}).split(b'"\\u0000"')
+
+
+def _build_status_payload(
+    status: str,
+    static_fields: Dict[str, Any],
+    uptime_seconds: float,
+    dependencies: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build a StatusResponse-shaped dict without per-request model validation."""
+    return {
+        "status": status,
+        "version": static_fields["version"],
+        "storage_type": static_fields["storage_type"],
+        "llm_provider": static_fields["llm_provider"],
+        "uptime_seconds": uptime_seconds,
+        "started_at": static_fields["started_at"],
+        "dependencies": dependencies,
+        "timestamp": format_utc_datetime(datetime.now(timezone.utc)),
+    }
+
 
 @router.get(
     "/health",
@@ -30,12 +142,10 @@ router = APIRouter(prefix="/system", tags=["system"])
 )
 async def health_check():
     """Health check endpoint"""
-    health = HealthResponse(status="healthy")
-    
-    return APIResponse(
-        success=True,
-        data=health.model_dump(mode='json'),
-        message="Service is healthy",
+    timestamp = b'"' + utc_now_iso().encode() + b'"'
+    return Response(
+        content=b"".join((_HEALTH_HEAD, timestamp, _HEALTH_MID, timestamp, _HEALTH_TAIL)),
+        media_type="application/json",
     )
 
 
@@ -52,25 +162,9 @@ async def get_status(
 ):
     """Get system status"""
     try:
-        # Get PowerMem config
-        powermem_config = auto_config()
-        
-        storage_type = None
-        llm_provider = None
-        
-        if isinstance(powermem_config, dict):
-            # Extract from dict config
-            vector_store = powermem_config.get("vector_store") or powermem_config.get("database", {})
-            storage_type = vector_store.get("provider") if isinstance(vector_store, dict) else None
-            
-            llm = powermem_config.get("llm", {})
-            llm_provider = llm.get("provider") if isinstance(llm, dict) else None
-        else:
-            # Extract from config object
-            if hasattr(powermem_config, "vector_store") and powermem_config.vector_store:
-                storage_type = powermem_config.vector_store.provider
-            if hasattr(powermem_config, "llm") and powermem_config.llm:
-                llm_provider = powermem_config.llm.provider
+        # Static fields are serialized once; changing POWERMEM_CONFIG_RELOAD
+        # forces the PowerMem config to be reloaded
+        static_fields = _get_static_status_fields(os.getenv("POWERMEM_CONFIG_RELOAD"))
         
         # Calculate uptime
         now = datetime.now(timezone.utc)
@@ -95,40 +189,25 @@ async def get_status(
             for name, dep in dependencies.items()
         }
         
-        status_data = StatusResponse(
-            status=system_status,
-            version=powermem_version,
-            storage_type=storage_type,
-            llm_provider=llm_provider,
-            uptime_seconds=uptime_seconds,
-            started_at=SERVER_START_TIME,
-            dependencies=dependencies_dict,
-        )
-        
-        return APIResponse(
-            success=True,
-            data=status_data.model_dump(mode='json'),
-            message="System status retrieved successfully",
+        return _success_response(
+            _build_status_payload(system_status, static_fields, uptime_seconds, dependencies_dict),
+            "System status retrieved successfully",
         )
     except Exception as e:
         # Fallback: return basic status even if dependencies check fails
         now = datetime.now(timezone.utc)
         uptime_seconds = (now - SERVER_START_TIME).total_seconds()
         
-        status_data = StatusResponse(
-            status="degraded",
-            version=powermem_version,
-            storage_type=None,
-            llm_provider=None,
-            uptime_seconds=uptime_seconds,
-            started_at=SERVER_START_TIME,
-            dependencies={},
-        )
+        fallback_fields = {
+            "version": powermem_version,
+            "storage_type": None,
+            "llm_provider": None,
+            "started_at": format_utc_datetime(SERVER_START_TIME),
+        }
         
-        return APIResponse(
-            success=True,
-            data=status_data.model_dump(mode='json'),
-            message=f"System status retrieved with errors: {str(e)[:100]}",
+        return _success_response(
+            _build_status_payload("degraded", fallback_fields, uptime_seconds, {}),
+            f"System status retrieved with errors: {str(e)[:100]}",
         )
 
 
@@ -174,12 +253,11 @@ async def delete_all_memories(
     This endpoint uses Memory.delete_all() to match the powermem SDK API.
     If no filters are provided, all memories will be deleted.
     """
-    from powermem import Memory
-    from ...models.errors import ErrorCode, APIError
-    
     try:
-        memory = Memory(config=auto_config())
-        result = memory.delete_all(
+        memory = _get_memory(request)
+        # delete_all blocks on the storage backend; keep it off the event loop
+        result = await asyncio.to_thread(
+            memory.delete_all,
             user_id=user_id,
             agent_id=agent_id,
             run_id=run_id,
@@ -195,10 +273,9 @@ async def delete_all_memories(
         
         filter_desc = f" with filters: {filters}" if filters else ""
         
-        return APIResponse(
-            success=True,
-            data={"deleted": result, "filters": filters},
-            message=f"All memories{filter_desc} deleted successfully",
+        return _success_response(
+            {"deleted": result, "filters": filters},
+            f"All memories{filter_desc} deleted successfully",
         )
     except Exception as e:
         raise APIError(
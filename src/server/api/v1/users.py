@@ -11,7 +11,7 @@ from ...models.response import APIResponse, UserProfileResponse, MemoryListRespo
 from ...services.user_service import UserService
 from ...middleware.auth import verify_api_key
 from ...middleware.rate_limit import limiter, get_rate_limit_string
-from ...utils.converters import user_profile_to_response, memory_dict_to_response
+from ...utils.converters import user_profile_to_response, memory_dict_to_response, next_cursor
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -140,6 +140,9 @@ async def get_user_memories(
     user_id: str,
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    after_id: Optional[int] = Query(
+        None, ge=0, description="Keyset cursor: return memories after this ID (use next_cursor; 0 starts)"
+    ),
     api_key: str = Depends(verify_api_key),
     service: UserService = Depends(get_user_service),
 ):
@@ -148,6 +151,7 @@ async def get_user_memories(
         user_id=user_id,
         limit=limit,
         offset=offset,
+        after_id=after_id,
     )
     
     memory_responses = [memory_dict_to_response(m) for m in memories]
@@ -157,6 +161,7 @@ async def get_user_memories(
         total=len(memory_responses),
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor(memory_responses, limit, after_id),
     )
     
     return APIResponse(
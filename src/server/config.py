@@ -3,9 +3,9 @@ Configuration management for PowerMem API Server.
 """
 
 from __future__ import annotations
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 from powermem.settings import settings_config
@@ -69,6 +69,11 @@ class ServerSettings(BaseSettings):
     cors_enabled: bool = Field(default=True)
     cors_origins: str = Field(default="*")
 
+    # Parsed once at load time; api_keys is checked on every request
+    _api_keys_list: List[str] = PrivateAttr(default_factory=list)
+    _api_keys_set: FrozenSet[str] = PrivateAttr(default_factory=frozenset)
+    _cors_origins_list: List[str] = PrivateAttr(default_factory=list)
+
     @field_validator(
         "reload",
         "auth_enabled",
@@ -106,19 +111,32 @@ class ServerSettings(BaseSettings):
             return stripped.lower() if stripped else value
         return value
 
+    @model_validator(mode="after")
+    def _cache_split_lists(self) -> "ServerSettings":
+        self._api_keys_list = [
+            key.strip() for key in self.api_keys.split(",") if key.strip()
+        ]
+        self._api_keys_set = frozenset(self._api_keys_list)
+        if self.cors_origins == "*":
+            self._cors_origins_list = ["*"]
+        else:
+            self._cors_origins_list = [
+                origin.strip()
+                for origin in self.cors_origins.split(",")
+                if origin.strip()
+            ]
+        return self
+
     def get_api_keys_list(self) -> List[str]:
         """Get list of API keys"""
-        if not self.api_keys:
-            return []
-        return [key.strip() for key in self.api_keys.split(",") if key.strip()]
+        return self._api_keys_list
+
+    def get_api_keys_set(self) -> FrozenSet[str]:
+        """Get API keys as a frozenset for O(1) membership checks"""
+        return self._api_keys_set
 
     def get_cors_origins_list(self) -> List[str]:
         """Get list of CORS origins"""
-        if self.cors_origins == "*":
-            return ["*"]
-        return [
-            origin.strip() for origin in self.cors_origins.split(",") if origin.strip()
-        ]
-
+        return self._cors_origins_list
 
 config = ServerSettings()
@@ -5,9 +5,9 @@ Main FastAPI application for PowerMem API Server
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import Response, RedirectResponse
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
@@ -18,7 +18,9 @@ from .middleware.logging import setup_logging, LoggingMiddleware
 from .middleware.rate_limit import rate_limit_middleware
 from .middleware.error_handler import error_handler
 from .middleware.auth import verify_api_key
+from .utils.responses import ORJSONResponse, json_bytes
 
+import hashlib
 import os
 import logging
 
@@ -67,18 +69,27 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Setup CORS
 if config.cors_enabled:
+    cors_origins = config.get_cors_origins_list()
+    allow_all_origins = "*" in cors_origins
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=config.get_cors_origins_list(),
-        allow_credentials=True,
+        allow_origins=cors_origins,
+        # Credentials cannot be combined with a wildcard origin, so with them
+        # enabled Starlette has to echo each request's Origin back. Auth uses
+        # the X-API-Key header, not cookies.
+        allow_credentials=not allow_all_origins,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
+# Compress large responses such as /metrics scrapes and list endpoints
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Setup logging middleware
 app.add_middleware(LoggingMiddleware)
 
@@ -106,36 +117,56 @@ app.add_exception_handler(StarletteHTTPException, error_handler)
 app.add_exception_handler(Exception, error_handler)
 
 
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+# These bodies never change while the process runs, so encode them once
+_ROBOTS_BODY = b"User-agent: *\nDisallow: /"
+_ROOT_BODY = json_bytes({
+    "name": "PowerMem API Server",
+    "version": config.api_version,
+    "docs": "/docs",
+    "dashboard": "/dashboard/",
+    "health": "/api/v1/system/health",
+})
+_API_ROOT_BODY = json_bytes({
+    "version": config.api_version,
+    "endpoints": {
+        "v1": "/api/v1",
+        "docs": "/docs",
+        "health": "/api/v1/health",
+        "status": "/api/v1/status",
+    },
+})
+_ROBOTS_ETAG = _etag(_ROBOTS_BODY)
+_ROOT_ETAG = _etag(_ROOT_BODY)
+_API_ROOT_ETAG = _etag(_API_ROOT_BODY)
+
+
+def _static_response(request: Request, body: bytes, etag: str, media_type: str) -> Response:
+    """Return a prebuilt body, or 304 when the client already has it."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type=media_type, headers={"ETag": etag})
+
+
 @app.get("/robots.txt", include_in_schema=False)
-async def robots_txt():
+async def robots_txt(request: Request):
     """Disallow all crawlers"""
-    return Response(content="User-agent: *\nDisallow: /", media_type="text/plain")
+    return _static_response(request, _ROBOTS_BODY, _ROBOTS_ETAG, "text/plain")
 
 
 @app.get("/", tags=["root"])
-async def root():
+async def root(request: Request):
     """Root endpoint"""
-    return {
-        "name": "PowerMem API Server",
-        "version": config.api_version,
-        "docs": "/docs",
-        "dashboard": "/dashboard/",
-        "health": "/api/v1/system/health",
-    }
+    return _static_response(request, _ROOT_BODY, _ROOT_ETAG, "application/json")
 
 
 @app.get("/api", tags=["root"])
-async def api_root():
+async def api_root(request: Request):
     """API root endpoint"""
-    return {
-        "version": config.api_version,
-        "endpoints": {
-            "v1": "/api/v1",
-            "docs": "/docs",
-            "health": "/api/v1/health",
-            "status": "/api/v1/status",
-        },
-    }
+    return _static_response(request, _API_ROOT_BODY, _API_ROOT_ETAG, "application/json")
 
 
 if __name__ == "__main__":
@@ -56,8 +56,7 @@ def verify_api_key(api_key: Optional[str] = Security(get_api_key)) -> str:
             }
         )
     
-    valid_keys = config.get_api_keys_list()
-    if api_key not in valid_keys:
+    if api_key not in config.get_api_keys_set():
         raise HTTPException(
             status_code=401,
             detail={
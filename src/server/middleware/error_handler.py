@@ -3,27 +3,32 @@ Error handling middleware for PowerMem API
 """
 
 import logging
-from typing import Union
+from typing import Any, Dict, Union
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from ..models.errors import ErrorCode, APIError
-from ..models.response import ErrorResponse
+from ..models.response import utc_now_iso
 from ..utils.metrics import get_metrics_collector
-from datetime import datetime, timezone
-
-try:
-    from powermem.utils.utils import get_current_datetime
-except ImportError:
-    # Fallback if powermem utils not available
-    def get_current_datetime():
-        return datetime.now(timezone.utc)
+from ..utils.responses import ORJSONResponse
 
 logger = logging.getLogger("server")
 
+# Error bodies for the common fixed-message cases
+_INTERNAL_ERROR = {
+    "code": ErrorCode.INTERNAL_ERROR.value,
+    "message": "Internal server error",
+    "details": {},
+}
+
+
+def _error_payload(error: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an ErrorResponse-shaped body without instantiating the model."""
+    return {"success": False, "error": error, "timestamp": utc_now_iso()}
 
-async def error_handler(request: Request, exc: Exception) -> JSONResponse:
+
+async def error_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Global error handler for FastAPI application.
     
@@ -32,7 +37,7 @@ async def error_handler(request: Request, exc: Exception) -> JSONResponse:
         exc: Exception that was raised
         
     Returns:
-        JSONResponse with error details
+        ORJSONResponse with error details
     """
     # Record error metrics
     metrics_collector = get_metrics_collector()
@@ -43,13 +48,9 @@ async def error_handler(request: Request, exc: Exception) -> JSONResponse:
         error_type = exc.code.value
         metrics_collector.record_error(error_type, endpoint)
         
-        error_response = ErrorResponse(
-            error=exc.to_dict(),
-            timestamp=get_current_datetime(),
-        )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
-            content=error_response.model_dump(mode='json'),
+            content=_error_payload(exc.to_dict()),
         )
     
     # Handle HTTPException
@@ -64,51 +65,35 @@ async def error_handler(request: Request, exc: Exception) -> JSONResponse:
         
         metrics_collector.record_error(error_code, endpoint)
         
-        error_response = ErrorResponse(
-            error={
+        return ORJSONResponse(
+            status_code=exc.status_code,
+            content=_error_payload({
                 "code": error_code,
                 "message": error_message,
                 "details": {},
-            },
-            timestamp=get_current_datetime(),
-        )
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=error_response.model_dump(mode='json'),
+            }),
         )
     
     # Handle validation errors
     if isinstance(exc, RequestValidationError):
         metrics_collector.record_error("VALIDATION_ERROR", endpoint)
         
-        error_response = ErrorResponse(
-            error={
+        return ORJSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=_error_payload({
                 "code": ErrorCode.INVALID_REQUEST.value,
                 "message": "Request validation failed",
                 "details": {
-                    "errors": exc.errors(),
+                    "errors": jsonable_encoder(exc.errors()),
                 },
-            },
-            timestamp=get_current_datetime(),
-        )
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content=error_response.model_dump(mode='json'),
+            }),
         )
     
     # Handle unexpected errors
     logger.exception(f"Unhandled error: {exc}")
     metrics_collector.record_error(ErrorCode.INTERNAL_ERROR.value, endpoint)
     
-    error_response = ErrorResponse(
-        error={
-            "code": ErrorCode.INTERNAL_ERROR.value,
-            "message": "Internal server error",
-            "details": {},
-        },
-        timestamp=datetime.utcnow(),
-    )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump(mode='json'),
+        content=_error_payload(_INTERNAL_ERROR),
     )
@@ -2,6 +2,7 @@
 Response models for PowerMem API
 """
 
+import time
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field, field_serializer, computed_field
@@ -14,6 +15,35 @@ except ImportError:
         return datetime.now(timezone.utc)
 
 
+def format_utc_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Format a datetime as an ISO 8601 string with Z suffix (UTC), like the model serializers"""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat() + "Z"
+
+
+_iso_second_cache = (None, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string with Z suffix.
+
+    The date/time prefix is formatted at most once per second; only the
+    microseconds are formatted per call.
+    """
+    global _iso_second_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _iso_second_cache
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _iso_second_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}Z"
+
+
 class APIResponse(BaseModel):
     """Standard API response wrapper"""
     
@@ -81,6 +111,14 @@ class MemoryListResponse(BaseModel):
     total: int = Field(0, description="Total number of memories")
     limit: int = Field(0, description="Limit applied")
     offset: int = Field(0, description="Offset applied")
+    next_cursor: Optional[int] = Field(
+        None, description="Pass as after_id to fetch the next page (keyset pagination only)"
+    )
+    
+    @field_serializer('next_cursor')
+    def serialize_next_cursor(self, value: Optional[int], _info) -> Optional[str]:
+        """Serialize as string, like memory_id, to prevent JavaScript precision loss."""
+        return None if value is None else str(value)
 
 
 class SearchResult(BaseModel):
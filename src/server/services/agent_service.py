@@ -55,26 +55,16 @@ class AgentService:
                     status_code=400,
                 )
             
-            # AgentMemory.get_all() doesn't support offset, so we need to handle it manually
-            all_memories = self.agent_memory.get_all(
+            return self.agent_memory.get_all(
                 agent_id=agent_id,
-                limit=limit + offset,  # Get more results to account for offset
+                limit=limit,
+                offset=offset,
             )
             
-            # Apply offset manually
-            if offset > 0 and len(all_memories) > offset:
-                memories = all_memories[offset:offset + limit]
-            elif offset > 0:
-                memories = []
-            else:
-                memories = all_memories[:limit]
-            
-            return memories
-            
         except APIError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get agent memories {agent_id}: {e}", exc_info=True)
+            logger.error("Failed to get agent memories %s: %s", agent_id, e, exc_info=True)
             raise APIError(
                 code=ErrorCode.INTERNAL_ERROR,
                 message=f"Failed to get agent memories: {str(e)}",
@@ -146,10 +136,10 @@ class AgentService:
             if isinstance(result, dict):
                 if "id" in result and "memory_id" not in result:
                     result["memory_id"] = result["id"]
-                logger.info(f"Agent memory created: {result.get('memory_id')} for agent {agent_id}")
+                logger.info("Agent memory created: %s for agent %s", result.get('memory_id'), agent_id)
                 return result
             else:
-                logger.error(f"Failed to create memory for agent {agent_id}: unexpected result type={type(result)}")
+                logger.error("Failed to create memory for agent %s: unexpected result type=%s", agent_id, type(result))
                 raise APIError(
                     code=ErrorCode.MEMORY_CREATE_FAILED,
                     message="No memory was created. Unexpected result format.",
@@ -159,7 +149,7 @@ class AgentService:
         except APIError:
             raise
         except Exception as e:
-            logger.error(f"Failed to create agent memory: {e}", exc_info=True)
+            logger.error("Failed to create agent memory: %s", e, exc_info=True)
             raise APIError(
                 code=ErrorCode.MEMORY_CREATE_FAILED,
                 message=f"Failed to create agent memory: {str(e)}",
@@ -199,106 +189,63 @@ class AgentService:
             
             # Get memories to share
             if memory_ids:
-                # Get specific memories by ID
-                memories = []
-                all_memories = self.agent_memory.get_all(agent_id=agent_id)
-                logger.info(f"Found {len(all_memories)} total memories for agent {agent_id}, filtering by {len(memory_ids)} specific IDs: {memory_ids}")
-                
-                # Convert memory_ids to set, handling both int and str types
-                memory_id_set = set(memory_ids)
-                # Also create a set with string versions for type compatibility
-                memory_id_set_str = {str(mid) for mid in memory_ids}
-                
-                # Debug: log first memory's ID to understand the format
-                if all_memories:
-                    first_mem_id = all_memories[0].get("id") or all_memories[0].get("memory_id")
-                    logger.debug(f"Sample memory ID from get_all: {first_mem_id} (type: {type(first_mem_id).__name__}), requested IDs: {memory_ids} (types: {[type(mid).__name__ for mid in memory_ids]})")
-                
-                for memory in all_memories:
-                    mem_id = memory.get("id") or memory.get("memory_id")
-                    # Check both original type and string type for compatibility
-                    if mem_id in memory_id_set or str(mem_id) in memory_id_set_str:
-                        memories.append(memory)
-                        logger.debug(f"Matched memory ID {mem_id} (type: {type(mem_id).__name__})")
-                    else:
-                        logger.debug(f"Memory ID {mem_id} (type: {type(mem_id).__name__}) not in requested IDs {memory_ids}. memory_id_set={memory_id_set}, memory_id_set_str={memory_id_set_str}")
-                
-                logger.info(f"After filtering, found {len(memories)} matching memories")
+                # Get specific memories by ID (int and str IDs both match)
+                memories = self.agent_memory.get_by_ids(agent_id, memory_ids)
+                logger.info("Found %d of %d requested memories for agent %s", len(memories), len(memory_ids), agent_id)
             else:
                 memories = self.agent_memory.get_all(agent_id=agent_id)
-                logger.info(f"Found {len(memories)} memories for agent {agent_id} to share")
+                logger.info("Found %d memories for agent %s to share", len(memories), agent_id)
             
             if not memories:
-                logger.warning(f"No memories found for agent {agent_id}. Cannot share memories.")
+                logger.warning("No memories found for agent %s. Cannot share memories.", agent_id)
                 return {
                     "shared_count": 0,
                     "source_agent_id": agent_id,
                     "target_agent_id": target_agent_id,
                 }
             
-            # Use AgentMemory's share_memory method for proper sharing
-            shared_count = 0
+            # Index memories by ID; memories without an ID cannot be shared
+            memories_by_id: Dict[str, Dict[str, Any]] = {}
             for memory in memories:
+                mem_id = memory.get("id") or memory.get("memory_id")
+                if not mem_id:
+                    logger.warning("Memory missing ID, skipping: %s", memory)
+                    continue
+                memories_by_id[str(mem_id)] = memory
+            
+            # Use AgentMemory's share_memories method when the mode supports it,
+            # sharing the whole batch in one call
+            shared_count = 0
+            to_copy = list(memories_by_id)
+            current_mode = self.agent_memory.get_mode() if hasattr(self.agent_memory, 'get_mode') else None
+            if hasattr(self.agent_memory, 'share_memories') and current_mode in ['multi_agent', 'hybrid']:
+                try:
+                    share_result = self.agent_memory.share_memories(
+                        memory_ids=to_copy,
+                        from_agent=agent_id,
+                        to_agents=[target_agent_id],
+                    )
+                    shared_count = share_result["shared_count"]
+                    to_copy = share_result["failed"]
+                    if to_copy:
+                        logger.info("share_memories could not share %d memories, falling back to copy", len(to_copy))
+                except (RuntimeError, ValueError, PermissionError) as e:
+                    # share_memories not supported or failed, fallback to copy
+                    logger.info("share_memories not supported or failed: %s. Using fallback copy method.", e)
+            
+            # Fallback: copy remaining memories to target agent
+            for mem_id in to_copy:
                 try:
-                    mem_id = memory.get("id") or memory.get("memory_id")
-                    if not mem_id:
-                        logger.warning(f"Memory missing ID, skipping: {memory}")
-                        continue
-                    
-                    # Try to use the share_memory method if available and supported
-                    use_share_method = False
-                    if hasattr(self.agent_memory, 'share_memory'):
-                        # Check if the mode supports share_memory
-                        current_mode = self.agent_memory.get_mode() if hasattr(self.agent_memory, 'get_mode') else None
-                        if current_mode in ['multi_agent', 'hybrid']:
-                            use_share_method = True
-                    
-                    if use_share_method:
-                        try:
-                            share_result = self.agent_memory.share_memory(
-                                memory_id=str(mem_id),
-                                from_agent=agent_id,
-                                to_agents=[target_agent_id],
-                            )
-                            if share_result.get("success", False):
-                                shared_count += 1
-                                logger.debug(f"Successfully shared memory {mem_id} using share_memory method")
-                            else:
-                                logger.warning(f"share_memory returned unsuccessful result for memory {mem_id}, falling back to copy")
-                                # Fallback to copy
-                                try:
-                                    self._copy_memory_to_agent(memory, target_agent_id)
-                                    shared_count += 1
-                                except ValueError as e:
-                                    logger.warning(f"Skipping memory {mem_id} due to empty content: {e}")
-                                except Exception as e:
-                                    logger.warning(f"Failed to copy memory {mem_id} to agent {target_agent_id}: {e}")
-                        except (RuntimeError, ValueError, PermissionError) as e:
-                            # share_memory not supported or failed, fallback to copy
-                            logger.info(f"share_memory not supported or failed for memory {mem_id}: {e}. Using fallback copy method.")
-                            try:
-                                self._copy_memory_to_agent(memory, target_agent_id)
-                                shared_count += 1
-                            except ValueError as ve:
-                                logger.warning(f"Skipping memory {mem_id} due to empty content: {ve}")
-                            except Exception as copy_e:
-                                logger.warning(f"Failed to copy memory {mem_id} to agent {target_agent_id}: {copy_e}")
-                    else:
-                        # Fallback: copy memory to target agent
-                        logger.debug(f"Using fallback copy method for memory {mem_id}")
-                        try:
-                            self._copy_memory_to_agent(memory, target_agent_id)
-                            shared_count += 1
-                        except ValueError as e:
-                            # Skip memories with empty content, but don't fail the entire operation
-                            logger.warning(f"Skipping memory {mem_id} due to empty content: {e}")
-                        except Exception as e:
-                            # Log other errors but continue with other memories
-                            logger.warning(f"Failed to copy memory {mem_id} to agent {target_agent_id}: {e}")
+                    self._copy_memory_to_agent(memories_by_id[mem_id], target_agent_id)
+                    shared_count += 1
+                except ValueError as e:
+                    # Skip memories with empty content, but don't fail the entire operation
+                    logger.warning("Skipping memory %s due to empty content: %s", mem_id, e)
                 except Exception as e:
-                    logger.warning(f"Failed to share memory {memory.get('id') or memory.get('memory_id')}: {e}", exc_info=True)
+                    # Log other errors but continue with other memories
+                    logger.warning("Failed to copy memory %s to agent %s: %s", mem_id, target_agent_id, e)
             
-            logger.info(f"Shared {shared_count} memories from {agent_id} to {target_agent_id}")
+            logger.info("Shared %d memories from %s to %s", shared_count, agent_id, target_agent_id)
             
             return {
                 "shared_count": shared_count,
@@ -309,7 +256,7 @@ class AgentService:
         except APIError:
             raise
         except Exception as e:
-            logger.error(f"Failed to share memories: {e}", exc_info=True)
+            logger.error("Failed to share memories: %s", e, exc_info=True)
             raise APIError(
                 code=ErrorCode.AGENT_MEMORY_SHARE_FAILED,
                 message=f"Failed to share memories: {str(e)}",
@@ -336,7 +283,8 @@ class AgentService:
         memory_id = memory.get("id") or memory.get("memory_id")
         
         # Debug: log memory structure to understand the issue
-        logger.debug(f"Copying memory {memory_id} to agent {target_agent_id}. Memory keys: {list(memory.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Copying memory %s to agent %s. Memory keys: %s", memory_id, target_agent_id, list(memory.keys()))
         
         # AgentMemory.get_all() returns memories with 'content' field (from get_memories())
         # The agent layer standardizes to 'content' field, but keep 'memory' as fallback
@@ -391,9 +339,9 @@ class AgentService:
                 metadata=memory.get("metadata", {}),
                 scope=scope,
             )
-            logger.debug(f"Successfully copied memory {memory.get('id') or memory.get('memory_id')} to agent {target_agent_id}")
+            logger.debug("Successfully copied memory %s to agent %s", memory.get('id') or memory.get('memory_id'), target_agent_id)
         except Exception as e:
-            logger.error(f"Failed to copy memory {memory.get('id') or memory.get('memory_id')} to agent {target_agent_id}: {e}")
+            logger.error("Failed to copy memory %s to agent %s: %s", memory.get('id') or memory.get('memory_id'), target_agent_id, e)
             raise
     
     def get_shared_memories(
@@ -2,7 +2,10 @@
 Memory service for PowerMem API
 """
 
+import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from powermem import Memory, auto_config
@@ -12,6 +15,61 @@ from ..utils.metrics import get_metrics_collector
 
 logger = logging.getLogger("server")
 
+# Upper bound on concurrent storage calls per batch request; further capped by
+# the store's own max_concurrency
+_BATCH_MAX_WORKERS = 8
+
+# Batch items longer than this fail fast instead of reaching the embedder,
+# whose input limits are far below it
+_MAX_CONTENT_LENGTH = 100_000
+
+_shared_memories: Dict[str, Memory] = {}
+_shared_memories_lock = threading.Lock()
+
+
+def get_shared_memory(config: Dict[str, Any]) -> Memory:
+    """
+    Return a Memory shared by every service built with an equal config.
+    
+    Building a Memory loads the embedding model and opens storage pools, so
+    MemoryService and SearchService reuse one instance. Configs that are not
+    JSON-serializable cannot be compared and get a fresh instance.
+    """
+    try:
+        config_key = json.dumps(config, sort_keys=True)
+    except (TypeError, ValueError):
+        return Memory(config=config)
+    
+    memory = _shared_memories.get(config_key)
+    if memory is None:
+        with _shared_memories_lock:
+            memory = _shared_memories.get(config_key)
+            if memory is None:
+                memory = Memory(config=config)
+                _shared_memories[config_key] = memory
+    return memory
+
+
+def _preview(content: Any, limit: int = 120) -> Any:
+    """Shorten long content echoed back in batch failure entries."""
+    if not isinstance(content, str) or len(content) <= limit:
+        return content
+    return f"{content[:limit]}...({len(content)} chars)"
+
+
+def _extract_memory_id(result: Dict[str, Any]) -> Optional[int]:
+    """
+    Get the ID of the first memory in an add() result.
+    
+    Result format: {"results": [{"id": memory_id, ...}], ...}; flat results with
+    "memory_id" or "id" are accepted too.
+    """
+    if results := result.get("results"):
+        return results[0].get("id")
+    if "memory_id" in result:
+        return result["memory_id"]
+    return result.get("id")
+
 
 class MemoryService:
     """Service for memory management operations"""
@@ -26,7 +84,7 @@ class MemoryService:
         if config is None:
             config = auto_config()
         
-        self.memory = Memory(config=config)
+        self.memory = get_shared_memory(config)
         logger.info("MemoryService initialized")
     
     def create_memory(
@@ -84,7 +142,7 @@ class MemoryService:
                 logger.info("No memories were created (likely duplicates detected or no facts extracted)")
                 return []
             
-            logger.info(f"Created {len(all_results)} memory/memories")
+            logger.info("Created %d memory/memories", len(all_results))
             
             # Normalize all results to include memory_id and other fields at top level
             # Fetch full memory info from database to get timestamps (consistent with batch_create_memories)
@@ -225,6 +283,7 @@ class MemoryService:
         offset: int = 0,
         sort_by: Optional[str] = None,
         order: str = "desc",
+        after_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         List memories with pagination and sorting.
@@ -236,6 +295,8 @@ class MemoryService:
             offset: Number of results to skip
             sort_by: Optional field to sort by: 'created_at', 'updated_at', 'id'
             order: Sort order: 'desc' (descending) or 'asc' (ascending)
+            after_id: Keyset cursor; return memories with greater IDs in ascending
+                ID order, ignoring offset and sorting
             
         Returns:
             List of memories
@@ -248,6 +309,7 @@ class MemoryService:
                 offset=offset,
                 sort_by=sort_by,
                 order=order,
+                after_id=after_id,
             )
             
             # Extract results from the dictionary response
@@ -324,6 +386,16 @@ class MemoryService:
             APIError: If update fails
         """
         try:
+            # At least one of content or metadata must be provided
+            if content is None and metadata is None:
+                raise ValueError("At least one of content or metadata must be provided")
+            
+            # Metadata-only updates merge in storage; no pre-read or re-embedding
+            if content is None:
+                result = self._update_metadata_only(memory_id, metadata, user_id, agent_id)
+                logger.info("Memory updated: %s", memory_id)
+                return result
+            
             # First check if memory exists
             existing = self.get_memory(memory_id, user_id, agent_id)
             if existing is None:
@@ -333,19 +405,16 @@ class MemoryService:
                     status_code=404,
                 )
             
-            # At least one of content or metadata must be provided
-            if content is None and metadata is None:
-                raise ValueError("At least one of content or metadata must be provided")
+            # Nothing would change, so skip the re-embedding and write
+            if self._is_noop_update(existing, content, metadata):
+                logger.debug("Memory unchanged, skipping update: %s", memory_id)
+                return existing
             
             # Use existing content if new content not provided
             final_content = content if content is not None else existing.get("content", "")
             
             # Merge metadata if both existing and new metadata exist
-            final_metadata = metadata
-            if metadata is not None and existing.get("metadata"):
-                final_metadata = {**existing.get("metadata", {}), **metadata}
-            elif existing.get("metadata"):
-                final_metadata = existing.get("metadata")
+            final_metadata = self._merge_metadata(existing, metadata)
             
             result = self.memory.update(
                 memory_id=memory_id,
@@ -366,7 +435,7 @@ class MemoryService:
                 result["id"] = memory_id
                 result["memory_id"] = memory_id
             
-            logger.info(f"Memory updated: {memory_id}")
+            logger.info("Memory updated: %s", memory_id)
             return result
             
         except APIError:
@@ -379,6 +448,60 @@ class MemoryService:
                 status_code=500,
             )
 
+    @staticmethod
+    def _is_noop_update(
+        existing: Dict[str, Any],
+        content: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> bool:
+        """Whether applying content/metadata to the existing memory would change nothing."""
+        if content is not None and content != existing.get("content"):
+            return False
+        if not metadata:
+            return True
+        existing_meta = existing.get("metadata") or {}
+        return all(k in existing_meta and existing_meta[k] == v for k, v in metadata.items())
+    
+    @staticmethod
+    def _merge_metadata(
+        existing: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """Overlay new metadata on the existing memory's, copying only when both are non-empty."""
+        existing_meta = existing.get("metadata") or {}
+        if not metadata:
+            return existing_meta or metadata
+        if not existing_meta:
+            return metadata
+        return existing_meta | metadata
+    
+    def _update_metadata_only(
+        self,
+        memory_id: int,
+        metadata: Dict[str, Any],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Merge metadata into a memory, raising MEMORY_NOT_FOUND if it is missing."""
+        result = self.memory.update_metadata(
+            memory_id=memory_id,
+            metadata=metadata,
+            user_id=user_id,
+            agent_id=agent_id,
+        )
+        if result is None:
+            raise APIError(
+                code=ErrorCode.MEMORY_NOT_FOUND,
+                message=f"Memory {memory_id} not found",
+                status_code=404,
+            )
+        
+        # Ensure result contains id field (storage.update_memory returns payload without id)
+        if "id" not in result:
+            result["id"] = memory_id
+            result["memory_id"] = memory_id
+        return result
+
     def get_statistics(
         self,
         user_id: Optional[str] = None,
@@ -429,10 +552,18 @@ class MemoryService:
         Raises:
             APIError: If deletion fails
         """
+        # First check if memory exists
+        self.get_memory(memory_id, user_id, agent_id)
+        return self._delete_existing_memory(memory_id, user_id, agent_id)
+    
+    def _delete_existing_memory(
+        self,
+        memory_id: int,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> bool:
+        """Delete a memory whose existence has already been checked."""
         try:
-            # First check if memory exists
-            self.get_memory(memory_id, user_id, agent_id)
-            
             success = self.memory.delete(
                 memory_id=memory_id,
                 user_id=user_id,
@@ -446,7 +577,7 @@ class MemoryService:
                     status_code=500,
                 )
             
-            logger.info(f"Memory deleted: {memory_id}")
+            logger.info("Memory deleted: %s", memory_id)
             return True
             
         except APIError:
@@ -459,6 +590,43 @@ class MemoryService:
                 status_code=500,
             )
     
+    def _get_existing_memories(
+        self,
+        memory_ids: List[int],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Fetch the memories a batch operation will touch in one query.
+        
+        Returns a dict keyed by str(memory_id), or None if the bulk lookup
+        failed and callers should check each memory individually.
+        """
+        try:
+            return self.memory.get_many(memory_ids, user_id=user_id, agent_id=agent_id)
+        except Exception as e:
+            logger.warning(f"Bulk memory lookup failed, checking memories individually: {e}")
+            return None
+    
+    def _lookup_existing_memory(
+        self,
+        existing_map: Optional[Dict[str, Dict[str, Any]]],
+        memory_id: int,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return a prefetched memory, raising the same 404 as get_memory on a miss."""
+        if existing_map is None:
+            return self.get_memory(memory_id, user_id, agent_id)
+        existing = existing_map.get(str(memory_id))
+        if existing is None:
+            raise APIError(
+                code=ErrorCode.MEMORY_NOT_FOUND,
+                message=f"Memory {memory_id} not found",
+                status_code=404,
+            )
+        return existing
+    
     def bulk_delete_memories(
         self,
         memory_ids: List[int],
@@ -476,24 +644,74 @@ class MemoryService:
         Returns:
             Dictionary with deletion results
         """
-        deleted = []
-        failed = []
+        # Repeated IDs (e.g. from client retries) are deleted once
+        unique_ids = list(dict.fromkeys(memory_ids))
         
-        for memory_id in memory_ids:
-            try:
-                self.delete_memory(memory_id, user_id, agent_id)
-                deleted.append(memory_id)
-            except APIError as e:
-                failed.append({"memory_id": memory_id, "error": e.message})
+        # One access check and one delete statement for the whole batch
+        try:
+            deleted_ids = {str(memory_id) for memory_id in self.memory.delete_many(unique_ids, user_id, agent_id)}
+            errors = [
+                None if str(memory_id) in deleted_ids else f"Memory {memory_id} not found"
+                for memory_id in unique_ids
+            ]
+        except Exception as e:
+            logger.warning("Bulk delete failed, deleting memories individually: %s", e)
+            errors = self._delete_individually(unique_ids, user_id, agent_id)
+        
+        deleted = [memory_id for memory_id, error in zip(unique_ids, errors) if error is None]
+        failed = [
+            {"memory_id": memory_id, "error": error}
+            for memory_id, error in zip(unique_ids, errors)
+            if error is not None
+        ]
         
         return {
             "deleted": deleted,
             "failed": failed,
             "total": len(memory_ids),
+            "unique_total": len(unique_ids),
             "deleted_count": len(deleted),
             "failed_count": len(failed),
         }
     
+    def _delete_individually(
+        self,
+        memory_ids: List[int],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> List[Optional[str]]:
+        """Delete memories one by one, returning an error message (or None) per ID."""
+        # Check existence for the whole batch with one query
+        existing_map = self._get_existing_memories(memory_ids, user_id, agent_id)
+        
+        errors: List[Optional[str]] = [None] * len(memory_ids)
+        to_delete = []
+        for idx, memory_id in enumerate(memory_ids):
+            if existing_map is not None and str(memory_id) not in existing_map:
+                errors[idx] = f"Memory {memory_id} not found"
+                continue
+            to_delete.append(idx)
+        
+        delete_one = self.delete_memory if existing_map is None else self._delete_existing_memory
+        
+        def run_delete(idx: int) -> None:
+            try:
+                delete_one(memory_ids[idx], user_id, agent_id)
+            except APIError as e:
+                errors[idx] = e.message
+        
+        # Deletes are independent and I/O-bound, so overlap them as far as the
+        # store's connection pool allows
+        max_workers = min(_BATCH_MAX_WORKERS, max(1, getattr(self.memory.storage, "max_concurrency", 1)), len(to_delete))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(run_delete, to_delete))
+        else:
+            for idx in to_delete:
+                run_delete(idx)
+        
+        return errors
+    
     def batch_create_memories(
         self,
         memories: List[Dict[str, Any]],
@@ -523,40 +741,48 @@ class MemoryService:
         created = []
         failed = []
         
+        # Validate up front; valid items are added with a single add_batch call
+        # so simple-mode batches share one embedding request
+        batch_items = []
+        batch_indexes = []
         for idx, memory_item in enumerate(memories):
+            content = memory_item.get("content")
+            if not content or not isinstance(content, str):
+                logger.error("Failed to create memory at index %s: Memory content is required", idx)
+                failed.append({
+                    "index": idx,
+                    "content": _preview(memory_item.get("content", "N/A")),
+                    "error": "Memory content is required",
+                })
+                continue
+            if len(content) > _MAX_CONTENT_LENGTH:
+                logger.error("Failed to create memory at index %s: Memory content is too large", idx)
+                failed.append({
+                    "index": idx,
+                    "content": _preview(content),
+                    "error": f"Memory content exceeds {_MAX_CONTENT_LENGTH} characters",
+                })
+                continue
+            # add_batch reads the item-specific content/metadata/filters/scope/
+            # memory_type keys itself, so the item is passed through as is
+            batch_items.append(memory_item)
+            batch_indexes.append(idx)
+        
+        results = self.memory.add_batch(
+            batch_items,
+            user_id=user_id,
+            agent_id=agent_id,
+            run_id=run_id,
+            infer=infer,
+        ) if batch_items else []
+        
+        for idx, memory_item, result in zip(batch_indexes, batch_items, results):
+            content = memory_item["content"]
             try:
-                content = memory_item.get("content")
-                if not content:
-                    raise ValueError("Memory content is required")
-                
-                # Use item-specific metadata/filters if provided, otherwise use common ones
-                metadata = memory_item.get("metadata")
-                filters = memory_item.get("filters")
-                scope = memory_item.get("scope")
-                memory_type = memory_item.get("memory_type")
-                
-                result = self.memory.add(
-                    messages=content,
-                    user_id=user_id,
-                    agent_id=agent_id,
-                    run_id=run_id,
-                    metadata=metadata,
-                    filters=filters,
-                    scope=scope,
-                    memory_type=memory_type,
-                    infer=infer,
-                )
-                
-                # Extract memory_id from result
-                # Result format: {"results": [{"id": memory_id, ...}], ...}
-                memory_id = None
-                if "results" in result and len(result["results"]) > 0:
-                    memory_id = result["results"][0].get("id")
-                elif "memory_id" in result:
-                    memory_id = result["memory_id"]
-                elif "id" in result:
-                    memory_id = result["id"]
+                if "error" in result:
+                    raise ValueError(result["error"])
                 
+                memory_id = _extract_memory_id(result)
                 if memory_id is None:
                     raise ValueError("Failed to extract memory_id from result")
                 
@@ -567,13 +793,15 @@ class MemoryService:
                 })
                 
             except Exception as e:
-                logger.error(f"Failed to create memory at index {idx}: {e}", exc_info=True)
+                logger.error("Failed to create memory at index %s: %s", idx, e)
                 failed.append({
                     "index": idx,
-                    "content": memory_item.get("content", "N/A"),
+                    "content": _preview(content),
                     "error": str(e),
                 })
         
+        failed.sort(key=lambda item: item["index"])
+        
         return {
             "created": created,
             "failed": failed,
@@ -605,6 +833,14 @@ class MemoryService:
         updated = []
         failed = []
         
+        # Fetch every memory whose content is being updated with one query
+        # instead of one per item; metadata-only updates need no pre-read
+        memory_ids = [
+            item.get("memory_id") for item in updates
+            if item.get("memory_id") is not None and item.get("content") is not None
+        ]
+        existing_map = self._get_existing_memories(memory_ids, user_id, agent_id)
+        
         for idx, update_item in enumerate(updates):
             try:
                 memory_id = update_item.get("memory_id")
@@ -618,15 +854,26 @@ class MemoryService:
                 if content is None and metadata is None:
                     raise ValueError("At least one of content or metadata must be provided")
                 
+                if content is None:
+                    self._update_metadata_only(memory_id, metadata, user_id, agent_id)
+                    updated.append({
+                        "index": idx,
+                        "memory_id": memory_id,
+                    })
+                    continue
+                
                 # Get existing memory to merge metadata if needed
-                existing = self.get_memory(memory_id, user_id, agent_id)
+                existing = self._lookup_existing_memory(existing_map, memory_id, user_id, agent_id)
+                
+                if self._is_noop_update(existing, content, metadata):
+                    updated.append({
+                        "index": idx,
+                        "memory_id": memory_id,
+                    })
+                    continue
                 
                 # Merge metadata if both existing and new metadata exist
-                final_metadata = metadata
-                if metadata is not None and existing.get("metadata"):
-                    final_metadata = {**existing.get("metadata", {}), **metadata}
-                elif existing.get("metadata"):
-                    final_metadata = existing.get("metadata")
+                final_metadata = self._merge_metadata(existing, metadata)
                 
                 # Use existing content if new content not provided
                 final_content = content if content is not None else existing.get("content", "")
@@ -645,14 +892,14 @@ class MemoryService:
                 })
                 
             except APIError as e:
-                logger.error(f"Failed to update memory at index {idx}: {e}", exc_info=True)
+                logger.error("Failed to update memory at index %s: %s", idx, e)
                 failed.append({
                     "index": idx,
                     "memory_id": update_item.get("memory_id"),
                     "error": e.message,
                 })
             except Exception as e:
-                logger.error(f"Failed to update memory at index {idx}: {e}", exc_info=True)
+                logger.error("Failed to update memory at index %s: %s", idx, e)
                 failed.append({
                     "index": idx,
                     "memory_id": update_item.get("memory_id"),
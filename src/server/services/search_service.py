@@ -4,9 +4,10 @@ Search service for PowerMem API
 
 import logging
 from typing import Any, Dict, List, Optional
-from powermem import Memory, auto_config
+from powermem import auto_config
 from ..models.errors import ErrorCode, APIError
 from ..utils.metrics import get_metrics_collector
+from .memory_service import get_shared_memory
 
 logger = logging.getLogger("server")
 
@@ -24,7 +25,7 @@ class SearchService:
         if config is None:
             config = auto_config()
         
-        self.memory = Memory(config=config)
+        self.memory = get_shared_memory(config)
         logger.info("SearchService initialized")
     
     def search_memories(
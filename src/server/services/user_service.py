@@ -2,13 +2,23 @@
 User service for PowerMem API
 """
 
+import copy
+import itertools
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from powermem import UserMemory, auto_config
 from ..models.errors import ErrorCode, APIError
 
 logger = logging.getLogger("server")
 
+# Profiles are read on most chat turns but rewritten rarely, so reads are
+# cached per process. The TTL bounds staleness after writes made by other
+# workers, which cannot invalidate this process's cache.
+_PROFILE_CACHE_TTL = 60.0
+_PROFILE_CACHE_MAX_SIZE = 10_000
+
 
 class UserService:
     """Service for user profile operations"""
@@ -24,8 +34,43 @@ class UserService:
             config = auto_config()
         
         self.user_memory = UserMemory(config=config)
+        self._profile_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._profile_cache_lock = threading.Lock()
+        # Bumped by every write to a user's profile; see _get_cached_profile
+        self._profile_generations: Dict[str, int] = {}
+        self._profile_generation_counter = itertools.count(1)
         logger.info("UserService initialized")
     
+    def _get_cached_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the user's profile, reading the profile store at most once per TTL."""
+        now = time.monotonic()
+        entry = self._profile_cache.get(user_id)
+        if entry is not None and entry[0] > now:
+            return copy.deepcopy(entry[1])
+        
+        # A write that lands while the store is being read bumps the generation,
+        # so the (possibly old) profile read here is not cached over it
+        generation = self._profile_generations.get(user_id)
+        profile = self.user_memory.profile(user_id)
+        # Missing profiles are not cached so a new profile shows up immediately
+        if profile:
+            with self._profile_cache_lock:
+                if self._profile_generations.get(user_id) == generation:
+                    if len(self._profile_cache) >= _PROFILE_CACHE_MAX_SIZE:
+                        self._profile_cache.pop(next(iter(self._profile_cache)), None)
+                    self._profile_cache[user_id] = (now + _PROFILE_CACHE_TTL, copy.deepcopy(profile))
+        return profile
+    
+    def _invalidate_profile(self, user_id: str) -> None:
+        """Drop the cached profile after it has been written or deleted."""
+        with self._profile_cache_lock:
+            self._profile_cache.pop(user_id, None)
+            # Re-insert so the oldest generations are the ones evicted
+            self._profile_generations.pop(user_id, None)
+            if len(self._profile_generations) >= _PROFILE_CACHE_MAX_SIZE:
+                self._profile_generations.pop(next(iter(self._profile_generations)), None)
+            self._profile_generations[user_id] = next(self._profile_generation_counter)
+    
     def get_user_profile(self, user_id: str) -> Dict[str, Any]:
         """
         Get user profile.
@@ -47,7 +92,7 @@ class UserService:
                     status_code=400,
                 )
             
-            profile = self.user_memory.profile(user_id)
+            profile = self._get_cached_profile(user_id)
             
             if not profile:
                 raise APIError(
@@ -140,6 +185,7 @@ class UserService:
                 exclude_roles=exclude_roles,
                 native_language=native_language,
             )
+            self._invalidate_profile(user_id)
             
             logger.info(f"User profile added: {user_id}")
             return result
@@ -212,6 +258,7 @@ class UserService:
         user_id: str,
         limit: int = 100,
         offset: int = 0,
+        after_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get all memories for a user.
@@ -220,6 +267,8 @@ class UserService:
             user_id: User ID
             limit: Maximum number of results
             offset: Number of results to skip
+            after_id: Keyset cursor; return memories with greater IDs in ascending
+                ID order, ignoring offset
             
         Returns:
             List of memories
@@ -236,6 +285,7 @@ class UserService:
                 user_id=user_id,
                 limit=limit,
                 offset=offset,
+                after_id=after_id,
             )
             
             # get_all returns a dict with "results" key, extract the list
@@ -279,14 +329,9 @@ class UserService:
                     status_code=400,
                 )
             
-            # Get count of memories before deletion
-            result = self.user_memory.get_all(user_id=user_id)
-            if isinstance(result, dict):
-                total = len(result.get("results", []))
-            elif isinstance(result, list):
-                total = len(result)
-            else:
-                total = 0
+            # Count memories before deletion with a COUNT query rather than
+            # fetching them (get_all also capped the count at its page size)
+            total = self.user_memory.memory.count_all(user_id=user_id)
             
             # Use UserMemory.delete_all() to delete all memories for the user
             # This is the public interface method, not the internal memory.delete_all()
@@ -348,6 +393,7 @@ class UserService:
             # Use UserMemory.delete_profile() to delete the profile
             # This is the public interface method
             success = self.user_memory.delete_profile(user_id=user_id)
+            self._invalidate_profile(user_id)
             
             if not success:
                 raise APIError(
@@ -57,6 +57,27 @@ def memory_dict_to_response(memory_dict: Dict[str, Any]) -> MemoryResponse:
     return memory_to_response(memory_dict)
 
 
+def next_cursor(
+    memories: List[MemoryResponse],
+    limit: int,
+    after_id: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Get the keyset cursor for the page after ``memories``.
+    
+    Args:
+        memories: Page of memories, in ascending ID order
+        limit: Page size that was requested
+        after_id: Cursor the page was fetched with; None for offset pagination
+        
+    Returns:
+        Last memory ID if more pages may follow, otherwise None
+    """
+    if after_id is None or len(memories) < limit:
+        return None
+    return memories[-1].memory_id
+
+
 def search_result_to_response(result: Dict[str, Any]) -> SearchResult:
     """
     Convert search result dictionary to SearchResult model.
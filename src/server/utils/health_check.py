@@ -4,7 +4,7 @@ Health check utilities for system dependencies
 
 import time
 from typing import Dict
-from datetime import datetime
+from datetime import datetime, timezone
 
 from ..models.response import DependencyStatus
 
@@ -34,7 +34,7 @@ async def check_database() -> DependencyStatus:
             name="database",
             status="healthy",
             latency_ms=round(latency_ms, 2),
-            last_checked=datetime.utcnow(),
+            last_checked=datetime.now(timezone.utc),
         )
     except Exception as e:
         latency_ms = (time.time() - start_time) * 1000
@@ -48,7 +48,7 @@ async def check_database() -> DependencyStatus:
             status="unavailable",
             latency_ms=round(latency_ms, 2),
             error_message=error_msg,
-            last_checked=datetime.utcnow(),
+            last_checked=datetime.now(timezone.utc),
         )
 
 
@@ -80,7 +80,7 @@ async def check_llm() -> DependencyStatus:
                 name="llm",
                 status="unavailable",
                 error_message="LLM provider not configured",
-                last_checked=datetime.utcnow(),
+                last_checked=datetime.now(timezone.utc),
             )
         
         # For now, just check if LLM is configured
@@ -91,7 +91,7 @@ async def check_llm() -> DependencyStatus:
             name="llm",
             status="healthy",
             latency_ms=round(latency_ms, 2),
-            last_checked=datetime.utcnow(),
+            last_checked=datetime.now(timezone.utc),
         )
     except Exception as e:
         latency_ms = (time.time() - start_time) * 1000
@@ -105,7 +105,7 @@ async def check_llm() -> DependencyStatus:
             status="unavailable",
             latency_ms=round(latency_ms, 2),
             error_message=error_msg,
-            last_checked=datetime.utcnow(),
+            last_checked=datetime.now(timezone.utc),
         )
 
 
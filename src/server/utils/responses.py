@@ -0,0 +1,35 @@
+"""
+Response classes for PowerMem API
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_bytes(content: Any) -> bytes:
+    """Encode content the same way ORJSONResponse renders it."""
+    if orjson is None:
+        return JSONResponse(content).body
+    return orjson.dumps(
+        content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson when it is installed.
+
+    Falls back to the standard JSONResponse encoder otherwise, so orjson
+    stays an optional dependency.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return json_bytes(content)
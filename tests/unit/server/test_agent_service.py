@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock, patch
+
+from powermem.agent.agent import AgentMemory
+
+
+def _agent_memory(share_memory):
+    """AgentMemory in multi-agent mode over a manager whose share_memory is given."""
+    agent_memory = object.__new__(AgentMemory)
+    agent_memory.mode = "multi_agent"
+    agent_memory._initialized = True
+    agent_memory._agent_manager = MagicMock()
+    agent_memory._agent_manager.share_memory.side_effect = share_memory
+    return agent_memory
+
+
+def _share_memory(memory_id, from_agent, to_agents, permissions=None):
+    if memory_id == "2":
+        raise KeyError("scope")
+    if memory_id == "3":
+        return None
+    if memory_id == "4":
+        return {"success": False}
+    return {"success": True}
+
+
+def test_share_memories_isolates_failing_items():
+    agent_memory = _agent_memory(_share_memory)
+
+    result = agent_memory.share_memories(["1", "2", "3", "4", "5"], "agent-a", ["agent-b"])
+
+    assert result == {
+        "success": False,
+        "shared_count": 2,
+        "shared": ["1", "5"],
+        "failed": ["2", "3", "4"],
+    }
+    assert agent_memory._agent_manager.share_memory.call_count == 5
+
+
+def test_service_copies_memories_that_could_not_be_shared():
+    from server.services.agent_service import AgentService
+
+    agent_memory = _agent_memory(_share_memory)
+    agent_memory.get_mode = MagicMock(return_value="multi_agent")
+    agent_memory.get_by_ids = MagicMock(return_value=[
+        {"id": memory_id, "content": f"fact {memory_id}"} for memory_id in ("1", "2", "3")
+    ])
+    service = object.__new__(AgentService)
+    service.agent_memory = agent_memory
+
+    with patch.object(AgentService, "_copy_memory_to_agent") as copy_memory:
+        result = service.share_memories("agent-a", "agent-b", memory_ids=["1", "2", "3"])
+
+    assert result["shared_count"] == 3
+    assert [c.args[0]["id"] for c in copy_memory.call_args_list] == ["2", "3"]
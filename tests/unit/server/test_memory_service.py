@@ -0,0 +1,254 @@
+from unittest.mock import patch
+
+import pytest
+
+from powermem import Memory
+from powermem.storage.sqlite.sqlite_vector_store import SQLiteVectorStore
+
+
+@pytest.fixture
+def service():
+    """MemoryService over an in-process SQLite store and a fixed-vector embedder."""
+    with patch("powermem.core.memory.VectorStoreFactory") as mock_vector_factory, \
+         patch("powermem.core.memory.LLMFactory"), \
+         patch("powermem.core.memory.EmbedderFactory") as mock_embedder_factory:
+        mock_vector_factory.create.return_value = SQLiteVectorStore(":memory:")
+        mock_embedder = mock_embedder_factory.create.return_value
+        mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder.embed_batch.side_effect = lambda texts, **kwargs: [[0.1, 0.2, 0.3]] * len(texts)
+        memory = Memory()
+
+    from server.services.memory_service import MemoryService
+
+    with patch("server.services.memory_service.get_shared_memory", return_value=memory):
+        yield MemoryService(config={})
+
+
+def _add(service, content, user_id="alice", metadata=None):
+    result = service.memory.add(content, user_id=user_id, metadata=metadata, infer=False)
+    return result["results"][0]["id"]
+
+
+def test_bulk_delete_mixed_ids(service):
+    own = [_add(service, f"alice fact {i}") for i in range(2)]
+    bob = _add(service, "bob fact", user_id="bob")
+    missing = 424242
+
+    result = service.bulk_delete_memories([own[1], missing, bob, own[0]], user_id="alice")
+
+    assert result["deleted"] == [own[1], own[0]]
+    assert result["failed"] == [
+        {"memory_id": missing, "error": f"Memory {missing} not found"},
+        {"memory_id": bob, "error": f"Memory {bob} not found"},
+    ]
+    assert (result["total"], result["unique_total"]) == (4, 4)
+    assert (result["deleted_count"], result["failed_count"]) == (2, 2)
+    assert service.memory.get(bob, user_id="bob") is not None
+
+
+def test_bulk_delete_duplicate_ids(service):
+    memory_id = _add(service, "repeated fact")
+    missing = 424242
+
+    result = service.bulk_delete_memories([memory_id, missing, memory_id, missing], user_id="alice")
+
+    assert result["deleted"] == [memory_id]
+    assert [item["memory_id"] for item in result["failed"]] == [missing]
+    assert result["total"] == 4
+    assert result["unique_total"] == 2
+    assert result["deleted_count"] + result["failed_count"] == result["unique_total"]
+
+
+def test_bulk_delete_falls_back_when_delete_many_raises(service):
+    own = _add(service, "alice fact")
+    bob = _add(service, "bob fact", user_id="bob")
+
+    with patch.object(service.memory, "delete_many", side_effect=RuntimeError("bulk delete failed")), \
+         patch.object(service.memory, "get_many", wraps=service.memory.get_many) as get_many, \
+         patch.object(service.memory, "delete", wraps=service.memory.delete) as delete:
+        result = service.bulk_delete_memories([own, bob, own], user_id="alice")
+
+    assert result["deleted"] == [own]
+    assert result["failed"] == [{"memory_id": bob, "error": f"Memory {bob} not found"}]
+    assert result["unique_total"] == 2
+    # One prefetch for the batch, then a delete only for the accessible memory
+    get_many.assert_called_once_with([own, bob], user_id="alice", agent_id=None)
+    delete.assert_called_once_with(memory_id=own, user_id="alice", agent_id=None)
+    assert service.memory.get(own, user_id="alice") is None
+
+
+def test_bulk_delete_fallback_without_prefetch(service):
+    own = _add(service, "alice fact")
+    bob = _add(service, "bob fact", user_id="bob")
+
+    with patch.object(service.memory, "delete_many", side_effect=RuntimeError("bulk delete failed")), \
+         patch.object(service.memory, "get_many", side_effect=RuntimeError("bulk lookup failed")):
+        result = service.bulk_delete_memories([own, bob], user_id="alice")
+
+    assert result["deleted"] == [own]
+    assert [item["memory_id"] for item in result["failed"]] == [bob]
+    assert service.memory.get(bob, user_id="bob") is not None
+
+
+def _list_pages(service, limit, **kwargs):
+    """Page through list_memories the way the API does, returning each page's IDs and next_cursor."""
+    from server.utils.converters import memory_dict_to_response, next_cursor
+
+    pages = []
+    after_id = 0
+    while after_id is not None:
+        responses = [
+            memory_dict_to_response(m)
+            for m in service.list_memories(limit=limit, after_id=after_id, **kwargs)
+        ]
+        after_id = next_cursor(responses, limit, after_id)
+        pages.append(([r.memory_id for r in responses], after_id))
+    return pages
+
+
+def test_list_memories_keyset_pages(service):
+    alice_ids = []
+    for i in range(5):
+        alice_ids.append(_add(service, f"alice fact {i}"))
+        _add(service, f"bob fact {i}", user_id="bob")
+
+    pages = _list_pages(service, 2, user_id="alice")
+
+    assert [ids for ids, _ in pages] == [alice_ids[:2], alice_ids[2:4], alice_ids[4:]]
+    assert [cursor for _, cursor in pages] == [alice_ids[1], alice_ids[3], None]
+
+
+def test_list_memories_full_last_page(service):
+    ids = [_add(service, f"fact {i}") for i in range(4)]
+
+    pages = _list_pages(service, 2, user_id="alice")
+
+    assert pages == [(ids[:2], ids[1]), (ids[2:], ids[3]), ([], None)]
+
+
+def test_next_cursor_only_for_keyset_pages():
+    from server.models.response import MemoryResponse
+    from server.utils.converters import next_cursor
+
+    page = [MemoryResponse(memory_id=memory_id, content="fact") for memory_id in (5, 9)]
+
+    assert next_cursor(page, 2, after_id=0) == 9
+    assert next_cursor(page, 3, after_id=0) is None
+    assert next_cursor(page, 2, after_id=None) is None
+
+
+def test_next_cursor_serialized_as_string():
+    from server.models.response import MemoryListResponse
+
+    cursor = 766582377714548736
+
+    assert MemoryListResponse(next_cursor=cursor).model_dump(mode="json")["next_cursor"] == str(cursor)
+    assert MemoryListResponse().model_dump(mode="json")["next_cursor"] is None
+
+
+def test_batch_update_prefetch_checks_access(service):
+    own = _add(service, "alice fact")
+    bob = _add(service, "bob fact", user_id="bob")
+    missing = 424242
+    updates = [
+        {"memory_id": own, "content": "alice fact, revised"},
+        {"memory_id": bob, "content": "not allowed"},
+        {"memory_id": missing, "content": "nothing here"},
+    ]
+
+    with patch.object(service.memory, "get_many", wraps=service.memory.get_many) as get_many, \
+         patch.object(service, "get_memory", wraps=service.get_memory) as get_memory:
+        result = service.batch_update_memories(updates, user_id="alice")
+
+    get_many.assert_called_once_with([own, bob, missing], user_id="alice", agent_id=None)
+    get_memory.assert_not_called()
+    assert [item["memory_id"] for item in result["updated"]] == [own]
+    assert result["failed"] == [
+        {"index": 1, "memory_id": bob, "error": f"Memory {bob} not found"},
+        {"index": 2, "memory_id": missing, "error": f"Memory {missing} not found"},
+    ]
+    assert service.memory.get(own, user_id="alice")["content"] == "alice fact, revised"
+    assert service.memory.get(bob, user_id="bob")["content"] == "bob fact"
+
+
+def test_batch_update_falls_back_to_get_when_prefetch_fails(service):
+    own = _add(service, "alice fact")
+    bob = _add(service, "bob fact", user_id="bob")
+    updates = [
+        {"memory_id": own, "content": "alice fact, revised"},
+        {"memory_id": bob, "content": "not allowed"},
+    ]
+
+    with patch.object(service.memory, "get_many", side_effect=RuntimeError("bulk lookup failed")), \
+         patch.object(service, "get_memory", wraps=service.get_memory) as get_memory:
+        result = service.batch_update_memories(updates, user_id="alice")
+
+    assert [call.args[0] for call in get_memory.call_args_list] == [own, bob]
+    assert [item["memory_id"] for item in result["updated"]] == [own]
+    assert result["failed"] == [{"index": 1, "memory_id": bob, "error": f"Memory {bob} not found"}]
+
+
+def test_delete_user_memories_reports_deleted_rows(service):
+    from server.services.user_service import UserService
+
+    memory = service.memory
+    for i in range(3):
+        _add(service, f"alice fact {i}")
+    bob = _add(service, "bob fact", user_id="bob")
+
+    with patch("server.services.user_service.UserMemory") as mock_user_memory:
+        mock_user_memory.return_value.memory = memory
+        mock_user_memory.return_value.delete_all.side_effect = memory.delete_all
+        user_service = UserService(config={})
+    before = memory.count_all(user_id="alice")
+
+    result = user_service.delete_user_memories("alice")
+
+    assert result["deleted_count"] == result["total"] == before == 3
+    assert result["failed_count"] == 0
+    assert memory.count_all(user_id="alice") == 0
+    assert memory.get(bob, user_id="bob") is not None
+
+
+def test_merge_metadata():
+    from server.services.memory_service import MemoryService
+
+    merge = MemoryService._merge_metadata
+
+    assert merge({"metadata": {"a": 1, "b": 2}}, {"b": 3, "c": 4}) == {"a": 1, "b": 3, "c": 4}
+    assert merge({"metadata": {"a": 1}}, None) == {"a": 1}
+    assert merge({"metadata": None}, {"a": 1}) == {"a": 1}
+    assert merge({}, None) is None
+    existing = {"metadata": {"a": 1}}
+    merge(existing, {"a": 2})
+    assert existing == {"metadata": {"a": 1}}
+
+
+def test_metadata_only_update_skips_embedding(service):
+    memory_id = _add(service, "alice likes tea", metadata={"source": "chat", "mood": "calm"})
+    service.memory.embedding.embed.reset_mock()
+
+    with patch.object(service.memory, "update", wraps=service.memory.update) as update:
+        result = service.update_memory(memory_id, user_id="alice", metadata={"mood": "happy", "category": "preference"})
+
+    update.assert_not_called()
+    service.memory.embedding.embed.assert_not_called()
+    assert result["id"] == memory_id
+    stored = service.memory.get(memory_id, user_id="alice")
+    assert stored["content"] == "alice likes tea"
+    assert stored["metadata"]["source"] == "chat"
+    assert stored["metadata"]["mood"] == "happy"
+    assert "category" not in stored["metadata"]
+
+
+def test_metadata_only_update_other_user(service):
+    from server.models.errors import APIError, ErrorCode
+
+    bob = _add(service, "bob likes coffee", user_id="bob", metadata={"source": "chat"})
+
+    with pytest.raises(APIError) as exc_info:
+        service.update_memory(bob, user_id="alice", metadata={"source": "hijacked"})
+
+    assert exc_info.value.code == ErrorCode.MEMORY_NOT_FOUND
+    assert exc_info.value.status_code == 404
+    assert service.memory.get(bob, user_id="bob")["metadata"]["source"] == "chat"
@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def service():
+    """UserService over a mocked UserMemory."""
+    from server.services.user_service import UserService
+
+    with patch("server.services.user_service.UserMemory"):
+        yield UserService(config={})
+
+
+def test_cached_profile_is_copied(service):
+    service.user_memory.profile.return_value = {"user_id": "alice", "topics": {"food": "tea"}}
+
+    first = service.get_user_profile("alice")
+    first["topics"]["food"] = "coffee"
+    second = service.get_user_profile("alice")
+    second["topics"]["food"] = "juice"
+
+    assert service.get_user_profile("alice")["topics"] == {"food": "tea"}
+    service.user_memory.profile.assert_called_once_with("alice")
+
+
+def test_write_during_read_is_not_overwritten_by_stale_profile(service):
+    old = {"user_id": "alice", "profile_content": "likes tea"}
+    new = {"user_id": "alice", "profile_content": "likes coffee"}
+
+    def read_then_concurrent_write(user_id):
+        # Another request writes the profile after this read fetched the old one
+        service._invalidate_profile(user_id)
+        return old
+
+    service.user_memory.profile.side_effect = read_then_concurrent_write
+    assert service.get_user_profile("alice") == old
+
+    service.user_memory.profile.side_effect = None
+    service.user_memory.profile.return_value = new
+    assert service.get_user_profile("alice") == new
+    assert service.get_user_profile("alice") == new
+    assert service.user_memory.profile.call_count == 2
+
+
+def test_invalidate_only_affects_that_user(service):
+    service.user_memory.profile.side_effect = lambda user_id: {"user_id": user_id}
+    service.get_user_profile("alice")
+    service.get_user_profile("bob")
+
+    service._invalidate_profile("alice")
+    service.get_user_profile("alice")
+    service.get_user_profile("bob")
+
+    assert [c.args[0] for c in service.user_memory.profile.call_args_list] == ["alice", "bob", "alice"]
@@ -4,6 +4,9 @@ Basic tests for powermem
 This module contains basic unit tests for the memory system.
 """
 
+import json
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch, Mock
 from powermem import Memory
@@ -215,3 +218,347 @@ class TestMemory:
             assert isinstance(results, dict)
             assert "results" in results
             assert len(results["results"]) == 0
+
+
+@pytest.fixture
+def sqlite_memory():
+    """Memory backed by an in-process SQLite store and a fixed-vector embedder."""
+    from powermem.storage.sqlite.sqlite_vector_store import SQLiteVectorStore
+
+    with patch('powermem.core.memory.VectorStoreFactory') as mock_vector_factory, \
+         patch('powermem.core.memory.LLMFactory'), \
+         patch('powermem.core.memory.EmbedderFactory') as mock_embedder_factory:
+        mock_vector_factory.create.return_value = SQLiteVectorStore(":memory:")
+        mock_embedder = mock_embedder_factory.create.return_value
+        mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder.embed_batch.side_effect = lambda texts, **kwargs: [[0.1, 0.2, 0.3]] * len(texts)
+        yield Memory()
+
+
+def _add(memory, content, user_id="alice", agent_id=None, metadata=None):
+    """Store one memory in simple mode and return its ID."""
+    result = memory.add(content, user_id=user_id, agent_id=agent_id, metadata=metadata, infer=False)
+    return result["results"][0]["id"]
+
+
+class TestMemoryDeleteMany:
+    """Test cases for Memory.delete_many."""
+
+    def test_delete_many_skips_missing_and_foreign_ids(self, sqlite_memory):
+        """Only existing memories owned by the caller are deleted, in input order."""
+        own_ids = [_add(sqlite_memory, f"alice fact {i}") for i in range(3)]
+        bob_id = _add(sqlite_memory, "bob fact", user_id="bob")
+        missing_id = 12345
+
+        deleted = sqlite_memory.delete_many(
+            [own_ids[2], missing_id, bob_id, own_ids[0]], user_id="alice"
+        )
+
+        assert deleted == [own_ids[2], own_ids[0]]
+        assert sqlite_memory.get(own_ids[0], user_id="alice") is None
+        assert sqlite_memory.get(own_ids[1], user_id="alice") is not None
+        assert sqlite_memory.get(bob_id, user_id="bob") is not None
+
+    def test_delete_many_checks_agent(self, sqlite_memory):
+        """An agent_id filter keeps other agents' memories of the same user."""
+        first = _add(sqlite_memory, "first agent fact", agent_id="agent-1")
+        second = _add(sqlite_memory, "second agent fact", agent_id="agent-2")
+
+        deleted = sqlite_memory.delete_many([first, second], user_id="alice", agent_id="agent-1")
+
+        assert deleted == [first]
+        assert sqlite_memory.get(second, user_id="alice") is not None
+
+    def test_delete_many_with_duplicate_ids(self, sqlite_memory):
+        """Repeated IDs are deleted once and reported for each occurrence."""
+        memory_id = _add(sqlite_memory, "duplicated fact")
+
+        deleted = sqlite_memory.delete_many([memory_id, memory_id], user_id="alice")
+
+        assert deleted == [memory_id, memory_id]
+        assert sqlite_memory.get_all(user_id="alice")["results"] == []
+
+    def test_delete_many_empty(self, sqlite_memory):
+        """An empty ID list deletes nothing."""
+        memory_id = _add(sqlite_memory, "kept fact")
+
+        assert sqlite_memory.delete_many([], user_id="alice") == []
+        assert sqlite_memory.get(memory_id, user_id="alice") is not None
+
+
+class TestMemoryKeysetPagination:
+    """Test cases for Memory.get_all with an after_id cursor."""
+
+    def _pages(self, memory, limit, **kwargs):
+        """Follow the cursor from the start until a short page, returning the pages' IDs."""
+        pages = []
+        after_id = 0
+        while True:
+            page = [m["id"] for m in memory.get_all(limit=limit, after_id=after_id, **kwargs)["results"]]
+            pages.append(page)
+            if len(page) < limit:
+                return pages
+            after_id = page[-1]
+
+    def test_pages_cover_filtered_memories_once(self, sqlite_memory):
+        """Pages under a user filter neither overlap nor skip memories."""
+        alice_ids = []
+        for i in range(7):
+            alice_ids.append(_add(sqlite_memory, f"alice fact {i}"))
+            _add(sqlite_memory, f"bob fact {i}", user_id="bob")
+
+        pages = self._pages(sqlite_memory, 3, user_id="alice")
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [memory_id for page in pages for memory_id in page] == sorted(alice_ids)
+
+    def test_exact_multiple_ends_with_empty_page(self, sqlite_memory):
+        """When the last page is full, the following request returns nothing."""
+        ids = sorted(_add(sqlite_memory, f"fact {i}") for i in range(4))
+
+        pages = self._pages(sqlite_memory, 2, user_id="alice")
+
+        assert pages == [ids[:2], ids[2:], []]
+
+    def test_after_id_overrides_offset_and_sort(self, sqlite_memory):
+        """With a cursor, offset and sort_by are ignored and IDs ascend."""
+        ids = sorted(_add(sqlite_memory, f"fact {i}") for i in range(5))
+
+        results = sqlite_memory.get_all(
+            user_id="alice", limit=10, offset=3, sort_by="created_at", order="desc", after_id=ids[1]
+        )["results"]
+
+        assert [m["id"] for m in results] == ids[2:]
+
+    def test_offset_pagination_unchanged(self, sqlite_memory):
+        """Without a cursor, offset and sorting still apply."""
+        ids = sorted(_add(sqlite_memory, f"fact {i}") for i in range(5))
+
+        results = sqlite_memory.get_all(user_id="alice", limit=2, offset=1, sort_by="id", order="desc")["results"]
+
+        assert [m["id"] for m in results] == [ids[3], ids[2]]
+
+
+class TestMemoryGetMany:
+    """Test cases for Memory.get_many."""
+
+    def test_get_many_applies_access_checks(self, sqlite_memory):
+        """Missing IDs and memories of other users or agents are omitted."""
+        own = _add(sqlite_memory, "alice fact", agent_id="agent-1", metadata={"topic": "food"})
+        other_agent = _add(sqlite_memory, "alice other agent fact", agent_id="agent-2")
+        bob = _add(sqlite_memory, "bob fact", user_id="bob", agent_id="agent-1")
+
+        found = sqlite_memory.get_many([own, other_agent, bob, 12345], user_id="alice", agent_id="agent-1")
+
+        assert list(found) == [str(own)]
+        assert found[str(own)]["content"] == "alice fact"
+        assert found[str(own)]["metadata"] == {"topic": "food"}
+        assert set(sqlite_memory.get_many([own, other_agent, bob], user_id="alice")) == {str(own), str(other_agent)}
+        assert set(sqlite_memory.get_many([own, other_agent, bob])) == {str(own), str(other_agent), str(bob)}
+
+    def test_get_many_empty(self, sqlite_memory):
+        """An empty ID list returns an empty dict without a storage call."""
+        with patch.object(sqlite_memory.storage, 'get_memories') as get_memories:
+            assert sqlite_memory.get_many([], user_id="alice") == {}
+        get_memories.assert_not_called()
+
+
+class TestMemoryDeleteAll:
+    """Test cases for Memory.delete_all and the single-statement delete behind it."""
+
+    def test_delete_all_only_removes_scope(self, sqlite_memory):
+        """Deleting a user's memories leaves every other user's rows in place."""
+        for i in range(3):
+            _add(sqlite_memory, f"alice fact {i}")
+        bob_ids = [_add(sqlite_memory, f"bob fact {i}", user_id="bob") for i in range(2)]
+
+        assert sqlite_memory.delete_all(user_id="alice") is True
+
+        assert sqlite_memory.count_all(user_id="alice") == 0
+        assert sqlite_memory.count_all(user_id="bob") == 2
+        assert sorted(m["id"] for m in sqlite_memory.get_all(user_id="bob")["results"]) == sorted(bob_ids)
+
+    def test_delete_all_with_agent_scope(self, sqlite_memory):
+        """User and agent filters are combined, not either-or."""
+        _add(sqlite_memory, "alice agent-1 fact", agent_id="agent-1")
+        kept = _add(sqlite_memory, "alice agent-2 fact", agent_id="agent-2")
+        bob = _add(sqlite_memory, "bob agent-1 fact", user_id="bob", agent_id="agent-1")
+
+        sqlite_memory.delete_all(user_id="alice", agent_id="agent-1")
+
+        assert [m["id"] for m in sqlite_memory.get_all(user_id="alice")["results"]] == [kept]
+        assert sqlite_memory.get(bob, user_id="bob") is not None
+
+    def test_delete_by_filters_returns_row_count(self, sqlite_memory):
+        """The store reports how many rows its DELETE removed, matching count_all beforehand."""
+        for i in range(4):
+            _add(sqlite_memory, f"alice fact {i}")
+        _add(sqlite_memory, "bob fact", user_id="bob")
+        store = sqlite_memory.storage.vector_store
+        expected = sqlite_memory.count_all(user_id="alice")
+
+        assert store.delete_by_filters({"user_id": "alice"}) == expected == 4
+        assert store.count() == 1
+
+    def test_delete_by_filters_requires_filters(self, sqlite_memory):
+        """An empty filter would delete everything, so it is rejected."""
+        _add(sqlite_memory, "alice fact")
+
+        with pytest.raises(ValueError):
+            sqlite_memory.storage.vector_store.delete_by_filters({})
+        assert sqlite_memory.count_all() == 1
+
+
+def _stored_row(memory, memory_id):
+    """Return the raw vector and payload the SQLite store holds for a memory."""
+    store = memory.storage.vector_store
+    row = store.connection.execute(
+        f"SELECT vector, payload FROM {store.collection_name} WHERE id = ?", (memory_id,)
+    ).fetchone()
+    return json.loads(row[0]), json.loads(row[1])
+
+
+class TestMemoryUpdateMetadata:
+    """Test cases for Memory.update_metadata."""
+
+    def test_keeps_embedding_and_hash(self, sqlite_memory):
+        """Only metadata changes; the vector and content hash are left as stored."""
+        memory_id = _add(sqlite_memory, "alice likes tea", metadata={"source": "chat"})
+        vector, payload = _stored_row(sqlite_memory, memory_id)
+        sqlite_memory.embedding.embed.reset_mock()
+
+        result = sqlite_memory.update_metadata(memory_id, {"mood": "happy"}, user_id="alice")
+
+        assert result is not None
+        sqlite_memory.embedding.embed.assert_not_called()
+        new_vector, new_payload = _stored_row(sqlite_memory, memory_id)
+        assert new_vector == vector
+        assert new_payload["hash"] == payload["hash"]
+        assert new_payload["data"] == "alice likes tea"
+
+    def test_merges_keys(self, sqlite_memory):
+        """New keys are added and given keys overwritten; the rest are kept."""
+        memory_id = _add(sqlite_memory, "alice likes tea", metadata={"source": "chat", "mood": "calm"})
+
+        sqlite_memory.update_metadata(memory_id, {"mood": "happy", "tag": "drinks"}, user_id="alice")
+
+        metadata = sqlite_memory.get(memory_id, user_id="alice")["metadata"]
+        assert metadata["source"] == "chat"
+        assert metadata["mood"] == "happy"
+        assert metadata["tag"] == "drinks"
+
+    def test_category_moves_to_field(self, sqlite_memory):
+        """A category key is stored in its own field, not inside metadata."""
+        memory_id = _add(sqlite_memory, "alice likes tea", metadata={"source": "chat"})
+
+        sqlite_memory.update_metadata(memory_id, {"category": "preference", "tag": "drinks"}, user_id="alice")
+
+        _, payload = _stored_row(sqlite_memory, memory_id)
+        assert payload["category"] == "preference"
+        assert "category" not in payload["metadata"]
+        assert payload["metadata"]["tag"] == "drinks"
+
+    def test_other_users_memory(self, sqlite_memory):
+        """Another user's memory is neither returned nor changed."""
+        memory_id = _add(sqlite_memory, "bob likes coffee", user_id="bob", metadata={"source": "chat"})
+        _, payload = _stored_row(sqlite_memory, memory_id)
+
+        assert sqlite_memory.update_metadata(memory_id, {"source": "hijacked"}, user_id="alice") is None
+        assert sqlite_memory.update_metadata(424242, {"source": "chat"}, user_id="alice") is None
+        assert _stored_row(sqlite_memory, memory_id)[1] == payload
+
+
+class TestMemoryAddBatch:
+    """Test cases for Memory.add_batch."""
+
+    @staticmethod
+    def _contents(outcomes):
+        return [o["results"][0]["memory"] if o["results"] else None for o in outcomes]
+
+    def test_one_embed_batch_per_service(self, sqlite_memory):
+        """Items are grouped by embedding service, each group embedded with one request."""
+        main = sqlite_memory.embedding
+        other = MagicMock()
+        other.embed_batch.side_effect = lambda texts, **kwargs: [[0.9, 0.9, 0.9]] * len(texts)
+        items = [
+            {"content": "fact 0"},
+            {"content": "fact 1", "metadata": {"store": "other"}},
+            {"content": "fact 2"},
+            {"content": "fact 3", "metadata": {"store": "other"}},
+        ]
+
+        with patch.object(sqlite_memory, "_get_embedding_service",
+                          side_effect=lambda metadata: other if metadata else main):
+            outcomes = sqlite_memory.add_batch(items, user_id="alice", infer=False)
+
+        main.embed_batch.assert_called_once_with(["fact 0", "fact 2"], memory_action="add")
+        other.embed_batch.assert_called_once_with(["fact 1", "fact 3"], memory_action="add")
+        main.embed.assert_not_called()
+        other.embed.assert_not_called()
+        assert self._contents(outcomes) == ["fact 0", "fact 1", "fact 2", "fact 3"]
+
+    def test_falls_back_to_embed_per_item(self, sqlite_memory):
+        """When embed_batch fails every item is still embedded and stored."""
+        sqlite_memory.embedding.embed_batch.side_effect = RuntimeError("batch endpoint down")
+
+        outcomes = sqlite_memory.add_batch(
+            [{"content": "fact 0"}, {"content": "fact 1"}], user_id="alice", infer=False
+        )
+
+        assert [c.args[0] for c in sqlite_memory.embedding.embed.call_args_list] == ["fact 0", "fact 1"]
+        assert self._contents(outcomes) == ["fact 0", "fact 1"]
+        assert sqlite_memory.count_all(user_id="alice") == 2
+
+    def test_empty_content_reported_at_its_index(self, sqlite_memory):
+        """Empty items fail in place without being sent to the embedder."""
+        items = [{"content": "fact 0"}, {"content": ""}, {"content": "fact 2"}, {"messages": "   "}]
+
+        outcomes = sqlite_memory.add_batch(items, user_id="alice", infer=False)
+
+        sqlite_memory.embedding.embed_batch.assert_called_once_with(["fact 0", "fact 2"], memory_action="add")
+        assert self._contents(outcomes) == ["fact 0", None, "fact 2", None]
+        assert "empty content" in outcomes[1]["error"]
+        assert "empty content" in outcomes[3]["error"]
+        assert "error" not in outcomes[0]
+
+    def test_outcomes_in_input_order_when_concurrent(self, sqlite_memory):
+        """Concurrent writes finishing out of order still report in input order."""
+        items = [{"content": f"fact {i}"} for i in range(6)]
+        store_add = sqlite_memory.storage.add_memory
+
+        def slow_first(memory_data):
+            # Earlier items finish last
+            time.sleep(0.01 * (6 - int(memory_data["content"].split()[-1])))
+            return store_add(memory_data)
+
+        with patch.object(sqlite_memory, "_storage_concurrency", return_value=4), \
+             patch.object(sqlite_memory.storage, "add_memory", side_effect=slow_first):
+            outcomes = sqlite_memory.add_batch(items, user_id="alice", infer=False)
+
+        assert self._contents(outcomes) == [f"fact {i}" for i in range(6)]
+        ids = [o["results"][0]["id"] for o in outcomes]
+        assert [sqlite_memory.get(i, user_id="alice")["content"] for i in ids] == [f"fact {i}" for i in range(6)]
+
+    def test_infer_adds_sequentially(self, sqlite_memory):
+        """With infer=True each item goes through add() in order and failures stay in place."""
+        calls = []
+
+        def fake_add(messages, **kwargs):
+            calls.append(messages)
+            if messages == "bad":
+                raise RuntimeError("llm failed")
+            return {"results": [{"id": len(calls), "memory": messages, "event": "ADD"}]}
+
+        with patch.object(sqlite_memory, "add", side_effect=fake_add) as add:
+            outcomes = sqlite_memory.add_batch(
+                [{"messages": "first"}, {"content": "bad"}, {"messages": "third", "metadata": {"k": "v"}}],
+                user_id="alice",
+                infer=True,
+            )
+
+        assert calls == ["first", "bad", "third"]
+        assert all(c.kwargs["infer"] is True for c in add.call_args_list)
+        assert add.call_args_list[2].kwargs["metadata"] == {"k": "v"}
+        sqlite_memory.embedding.embed_batch.assert_not_called()
+        assert self._contents(outcomes) == ["first", None, "third"]
+        assert outcomes[1] == {"results": [], "error": "llm failed"}
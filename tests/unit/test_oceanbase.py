@@ -1,7 +1,10 @@
 import importlib
+import json
 import sys
 import unittest
 import uuid
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 # Mock pyobvector and sqlalchemy modules before importing OceanBaseVectorStore
@@ -461,5 +464,720 @@ class TestOceanBaseVectorStore(unittest.TestCase):
         pass
 
 
+
+def _is_mocked_module(name):
+    """Whether the named module is one this file replaces or builds on a replacement."""
+    return (
+        name.split(".")[0] in ("sqlalchemy", "pyobvector")
+        or name.startswith(("powermem.storage.oceanbase", "powermem.utils.oceanbase_util"))
+    )
+
+
+def _uses_mocks(module):
+    return isinstance(module, MagicMock) or any(isinstance(value, MagicMock) for value in vars(module).values())
+
+
+def _load_real_modules():
+    """Import the real OceanBase store against real SQLAlchemy, bypassing the mocks above.
+
+    Only the mock objects (and modules imported against them) are swapped out
+    and back. Real submodules loaded by earlier test modules are reused, since
+    importing SQLAlchemy or numpy a second time breaks them.
+    """
+    mocks = {
+        name: sys.modules.pop(name)
+        for name in list(sys.modules)
+        if _is_mocked_module(name) and _uses_mocks(sys.modules[name])
+    }
+    try:
+        importlib.import_module("powermem.storage.oceanbase.oceanbase")
+        importlib.import_module("sqlalchemy.dialects.sqlite")
+        real = {name: module for name, module in sys.modules.items() if _is_mocked_module(name)}
+        # A re-executed package does not pick up submodules that were already loaded
+        for name, module in real.items():
+            parent, _, child = name.rpartition(".")
+            if parent in real and not hasattr(real[parent], child):
+                setattr(real[parent], child, module)
+        return real
+    finally:
+        for name in mocks:
+            sys.modules.pop(name, None)
+        sys.modules.update(mocks)
+
+
+_REAL_MODULES = _load_real_modules()
+
+_STRING_COLUMNS = ("user_id", "agent_id", "run_id", "actor_id", "hash", "created_at", "updated_at", "category")
+
+
+class OceanBaseSQLiteTestCase(unittest.TestCase):
+    """Runs the real OceanBaseVectorStore query code against an in-memory SQLite engine."""
+
+    def setUp(self):
+        saved = {name: sys.modules.get(name) for name in _REAL_MODULES}
+        sys.modules.update(_REAL_MODULES)
+        self.addCleanup(self._restore_modules, saved)
+
+        import sqlalchemy
+        from powermem.storage.oceanbase import oceanbase, models
+
+        self.sa = sqlalchemy
+        self.oceanbase = oceanbase
+        self.models = models
+        self.engine = sqlalchemy.create_engine("sqlite://")
+        self.store = self.make_store("memories")
+
+    @staticmethod
+    def _restore_modules(saved):
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+    def make_store(self, collection_name):
+        """Create the table and a store instance that talks to it without connecting to OceanBase."""
+        sa = self.sa
+        metadata = sa.MetaData()
+        sa.Table(
+            collection_name,
+            metadata,
+            sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=False),
+            sa.Column("embedding", sa.JSON),
+            sa.Column("document", sa.Text),
+            sa.Column("metadata", sa.JSON),
+            *[sa.Column(column, sa.String(128)) for column in _STRING_COLUMNS],
+        )
+        metadata.create_all(self.engine)
+
+        store = object.__new__(self.oceanbase.OceanBaseVectorStore)
+        store.collection_name = collection_name
+        store.primary_field = "id"
+        store.vector_field = "embedding"
+        store.text_field = "document"
+        store.metadata_field = "metadata"
+        store.fulltext_field = "fulltext_content"
+        store.sparse_vector_field = "sparse_embedding"
+        store.include_sparse = False
+        store.normalize = False
+        store.model_class = self.models.create_memory_model(collection_name, 3, include_sparse=False)
+        store.obvector = MagicMock()
+        store.obvector.engine = self.engine
+        store.obvector.metadata_obj = sa.MetaData()
+        store.obvector.delete.side_effect = lambda table_name, ids: self._delete_rows(table_name, ids)
+        return store
+
+    def _delete_rows(self, table_name, ids):
+        table = self.sa.Table(table_name, self.sa.MetaData(), autoload_with=self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(self.sa.delete(table).where(table.c.id.in_(ids)))
+
+    def insert_rows(self, store, rows):
+        """Insert rows given as dicts with an id plus any column overrides."""
+        table = self.sa.Table(store.collection_name, self.sa.MetaData(), autoload_with=self.engine)
+        records = []
+        for row in rows:
+            record = {column: "" for column in _STRING_COLUMNS}
+            record.update(embedding=[0.1, 0.2, 0.3], document=f"memory {row['id']}", metadata={})
+            record.update(row)
+            records.append(record)
+        with self.engine.begin() as conn:
+            conn.execute(table.insert(), records)
+
+    def stored_ids(self, store):
+        table = self.sa.Table(store.collection_name, self.sa.MetaData(), autoload_with=self.engine)
+        with self.engine.connect() as conn:
+            return sorted(row[0] for row in conn.execute(self.sa.select(table.c.id)))
+
+    def make_adapter(self):
+        from powermem.storage.adapter import StorageAdapter
+
+        return StorageAdapter(self.store)
+
+
+class TestOceanBaseBulkDelete(OceanBaseSQLiteTestCase):
+    """Bulk delete through StorageAdapter.delete_memories and OceanBaseVectorStore.delete_many."""
+
+    def setUp(self):
+        super().setUp()
+        self.insert_rows(self.store, [
+            {"id": 1, "user_id": "alice"},
+            {"id": 2, "user_id": "alice"},
+            {"id": 3, "user_id": "bob"},
+            {"id": 4, "user_id": "alice", "agent_id": "agent-2"},
+        ])
+
+    def test_delete_many_single_statement(self):
+        """delete_many passes every ID to one obvector.delete call."""
+        self.store.delete_many([1, 3])
+
+        self.store.obvector.delete.assert_called_once_with(table_name="memories", ids=[1, 3])
+        self.assertEqual(self.stored_ids(self.store), [2, 4])
+
+    def test_delete_many_empty_is_noop(self):
+        """An empty ID list issues no statement."""
+        self.store.delete_many([])
+
+        self.store.obvector.delete.assert_not_called()
+
+    def test_delete_memories_mixed_ids(self):
+        """Missing and other users' IDs are skipped; the rest go in one delete."""
+        adapter = self.make_adapter()
+
+        deleted = adapter.delete_memories([2, 99, 3, 1], user_id="alice")
+
+        self.assertEqual(deleted, [2, 1])
+        self.store.obvector.delete.assert_called_once()
+        self.assertEqual(sorted(self.store.obvector.delete.call_args.kwargs["ids"]), [1, 2])
+        self.assertEqual(self.stored_ids(self.store), [3, 4])
+
+    def test_delete_memories_agent_filter(self):
+        """An agent_id filter keeps the user's memories from other agents."""
+        adapter = self.make_adapter()
+
+        deleted = adapter.delete_memories([1, 4], user_id="alice", agent_id="agent-2")
+
+        self.assertEqual(deleted, [4])
+        self.assertEqual(self.stored_ids(self.store), [1, 2, 3])
+
+    def test_delete_memories_duplicate_ids(self):
+        """A repeated ID is deleted once and reported for each occurrence."""
+        adapter = self.make_adapter()
+
+        deleted = adapter.delete_memories([1, 1], user_id="alice")
+
+        self.assertEqual(deleted, [1, 1])
+        self.store.obvector.delete.assert_called_once_with(table_name="memories", ids=[1])
+        self.assertEqual(self.stored_ids(self.store), [2, 3, 4])
+
+    def test_delete_memories_sub_store(self):
+        """IDs missing from the main store are deleted from the sub store that holds them."""
+        from powermem.storage.adapter import SubStoreConfig
+
+        archive = self.make_store("archive")
+        self.insert_rows(archive, [{"id": 10, "user_id": "alice"}, {"id": 11, "user_id": "bob"}])
+        adapter = self.make_adapter()
+        adapter.sub_stores["archive"] = SubStoreConfig("archive", {"category": "archive"}, archive)
+
+        deleted = adapter.delete_memories([10, 11, 2], user_id="alice")
+
+        self.assertEqual(deleted, [10, 2])
+        self.assertEqual(self.stored_ids(archive), [11])
+        self.assertEqual(self.stored_ids(self.store), [1, 3, 4])
+
+    def test_delete_memories_sub_store_lookup_error(self):
+        """A failing sub store raises before anything is deleted, instead of reporting its IDs as missing."""
+        from powermem.storage.adapter import SubStoreConfig
+
+        archive = self.make_store("archive")
+        self.insert_rows(archive, [{"id": 10, "user_id": "alice"}])
+        adapter = self.make_adapter()
+        adapter.sub_stores["archive"] = SubStoreConfig("archive", {"category": "archive"}, archive)
+
+        with patch.object(archive, "get_many", side_effect=RuntimeError("archive unavailable")), \
+             self.assertLogs("powermem.storage.adapter", "WARNING") as logs, \
+             self.assertRaises(RuntimeError):
+            adapter.delete_memories([10, 2], user_id="alice")
+
+        self.assertIn("sub store archive", logs.output[0])
+        self.assertIn("archive unavailable", logs.output[0])
+        self.assertEqual(self.stored_ids(self.store), [1, 2, 3, 4])
+        self.assertEqual(self.stored_ids(archive), [10])
+
+    def test_delete_memories_sub_store_delete_error(self):
+        """A failing sub store delete is raised so the caller can fall back, not treated as not found."""
+        from powermem.storage.adapter import SubStoreConfig
+
+        archive = self.make_store("archive")
+        self.insert_rows(archive, [{"id": 10, "user_id": "alice"}])
+        adapter = self.make_adapter()
+        adapter.sub_stores["archive"] = SubStoreConfig("archive", {"category": "archive"}, archive)
+
+        with patch.object(archive, "delete_many", side_effect=RuntimeError("archive unavailable")), \
+             self.assertLogs("powermem.storage.adapter", "WARNING"), \
+             self.assertRaises(RuntimeError):
+            adapter.delete_memories([10], user_id="alice")
+
+        self.assertEqual(self.stored_ids(archive), [10])
+
+
+
+class TestOceanBaseKeysetList(OceanBaseSQLiteTestCase):
+    """OceanBaseVectorStore.list with an after_id cursor."""
+
+    def setUp(self):
+        super().setUp()
+        self.insert_rows(self.store, [
+            {"id": i, "user_id": "alice" if i % 3 else "bob", "created_at": f"2024-01-{20 - i:02d}"}
+            for i in range(1, 13)
+        ])
+        self.alice_ids = [i for i in range(1, 13) if i % 3]
+
+    def list_ids(self, **kwargs):
+        return [result.id for result in self.store.list(**kwargs)[0]]
+
+    def test_pages_under_filter(self):
+        """Following the cursor returns every matching row once, in ID order."""
+        pages = []
+        after_id = 0
+        while True:
+            page = self.list_ids(filters={"user_id": "alice"}, limit=3, after_id=after_id)
+            pages.append(page)
+            if len(page) < 3:
+                break
+            after_id = page[-1]
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 2])
+        self.assertEqual([memory_id for page in pages for memory_id in page], self.alice_ids)
+
+    def test_after_id_overrides_offset_and_order(self):
+        """offset and order_by are ignored once a cursor is given."""
+        ids = self.list_ids(
+            filters={"user_id": "alice"}, limit=3, offset=2, order_by="created_at", order="desc", after_id=4
+        )
+
+        self.assertEqual(ids, [5, 7, 8])
+
+    def test_without_after_id(self):
+        """Offset pagination and sorting still apply without a cursor."""
+        ids = self.list_ids(filters={"user_id": "alice"}, limit=3, offset=1, order_by="created_at", order="asc")
+
+        self.assertEqual(ids, [10, 8, 7])
+
+    def test_last_page_empty(self):
+        """A cursor at the last row returns an empty page."""
+        self.assertEqual(self.list_ids(filters={"user_id": "alice"}, limit=3, after_id=self.alice_ids[-1]), [])
+
+
+
+class TestOceanBaseGetMany(OceanBaseSQLiteTestCase):
+    """OceanBaseVectorStore.get_many and StorageAdapter.get_memories."""
+
+    def setUp(self):
+        super().setUp()
+        self.insert_rows(self.store, [
+            {"id": 1, "user_id": "alice", "agent_id": "agent-1", "metadata": {"topic": "food"}},
+            {"id": 2, "user_id": "alice", "agent_id": "agent-2"},
+            {"id": 3, "user_id": "bob", "agent_id": "agent-1"},
+        ])
+
+    def test_get_many_omits_missing(self):
+        """Existing rows come back with the same payload as get(); missing IDs are dropped."""
+        results = {result.id: result for result in self.store.get_many([3, 99, 1])}
+
+        self.assertEqual(sorted(results), [1, 3])
+        self.assertEqual(results[1].payload["data"], "memory 1")
+        self.assertEqual(results[1].payload["metadata"], {"topic": "food"})
+        self.assertEqual(results[1].payload, self.store.get(1).payload)
+
+    def test_get_many_empty(self):
+        """No IDs, no query."""
+        self.assertEqual(self.store.get_many([]), [])
+
+    def test_get_memories_access_checks(self):
+        """User and agent filters drop other owners' memories."""
+        adapter = self.make_adapter()
+
+        self.assertEqual(set(adapter.get_memories([1, 2, 3, 99], user_id="alice")), {"1", "2"})
+        self.assertEqual(set(adapter.get_memories([1, 2, 3], user_id="alice", agent_id="agent-1")), {"1"})
+        self.assertEqual(set(adapter.get_memories([1, 2, 3], agent_id="agent-1")), {"1", "3"})
+        self.assertEqual(adapter.get_memories([1], user_id="alice")["1"], adapter.get_memory(1, user_id="alice"))
+
+    def test_get_memories_sub_store(self):
+        """IDs missing from the main store are looked up in sub stores, with the same access checks."""
+        from powermem.storage.adapter import SubStoreConfig
+
+        archive = self.make_store("archive")
+        self.insert_rows(archive, [{"id": 10, "user_id": "alice"}, {"id": 11, "user_id": "bob"}])
+        adapter = self.make_adapter()
+        adapter.sub_stores["archive"] = SubStoreConfig("archive", {"category": "archive"}, archive)
+
+        found = adapter.get_memories([10, 11, 1, 99], user_id="alice")
+
+        self.assertEqual(set(found), {"10", "1"})
+        self.assertEqual(found["10"]["content"], "memory 10")
+
+    def test_get_memories_sub_store_one_query_per_store(self):
+        """Missing IDs are fetched with one get_many per sub store, not one get per ID."""
+        from powermem.storage.adapter import SubStoreConfig
+
+        archive = self.make_store("archive")
+        recent = self.make_store("recent")
+        self.insert_rows(archive, [{"id": 10, "user_id": "alice"}, {"id": 11, "user_id": "alice"}])
+        self.insert_rows(recent, [{"id": 20, "user_id": "alice"}])
+        adapter = self.make_adapter()
+        adapter.sub_stores["archive"] = SubStoreConfig("archive", {"category": "archive"}, archive)
+        adapter.sub_stores["recent"] = SubStoreConfig("recent", {"category": "recent"}, recent)
+
+        with patch.object(self.store, "get_many", wraps=self.store.get_many) as main_get_many, \
+             patch.object(archive, "get_many", wraps=archive.get_many) as archive_get_many, \
+             patch.object(recent, "get_many", wraps=recent.get_many) as recent_get_many, \
+             patch.object(self.store, "get") as main_get, \
+             patch.object(archive, "get") as archive_get:
+            found = adapter.get_memories([1, 10, 20, 11, 99], user_id="alice")
+
+        self.assertEqual(set(found), {"1", "10", "11", "20"})
+        main_get_many.assert_called_once_with([1, 10, 20, 11, 99])
+        archive_get_many.assert_called_once_with([10, 20, 11, 99])
+        recent_get_many.assert_called_once_with([20, 99])
+        main_get.assert_not_called()
+        archive_get.assert_not_called()
+
+    def test_get_memories_stops_when_all_found(self):
+        """Sub stores are not queried once the main store held every ID."""
+        from powermem.storage.adapter import SubStoreConfig
+
+        archive = self.make_store("archive")
+        adapter = self.make_adapter()
+        adapter.sub_stores["archive"] = SubStoreConfig("archive", {"category": "archive"}, archive)
+
+        with patch.object(archive, "get_many") as archive_get_many:
+            self.assertEqual(set(adapter.get_memories([1, 2], user_id="alice")), {"1", "2"})
+
+        archive_get_many.assert_not_called()
+
+
+
+class TestOceanBaseDeleteByFilters(OceanBaseSQLiteTestCase):
+    """OceanBaseVectorStore.delete_by_filters and the clear_memories path that uses it."""
+
+    def setUp(self):
+        super().setUp()
+        self.insert_rows(self.store, [
+            {"id": 1, "user_id": "alice", "agent_id": "agent-1", "metadata": {"topic": "food"}},
+            {"id": 2, "user_id": "alice", "agent_id": "agent-2", "metadata": {"topic": "travel"}},
+            {"id": 3, "user_id": "alice", "agent_id": "agent-1"},
+            {"id": 4, "user_id": "bob", "agent_id": "agent-1", "metadata": {"topic": "food"}},
+            {"id": 5, "user_id": "alice-2"},
+        ])
+
+    def test_deletes_only_matching_user(self):
+        """Only the target user's rows go, and the count matches count() beforehand."""
+        expected = self.store.count({"user_id": "alice"})
+
+        deleted = self.store.delete_by_filters({"user_id": "alice"})
+
+        self.assertEqual(deleted, expected)
+        self.assertEqual(deleted, 3)
+        self.assertEqual(self.stored_ids(self.store), [4, 5])
+
+    def test_combined_filters(self):
+        """Several filters are ANDed together."""
+        self.assertEqual(self.store.delete_by_filters({"user_id": "alice", "agent_id": "agent-1"}), 2)
+        self.assertEqual(self.stored_ids(self.store), [2, 4, 5])
+
+    def test_metadata_filter(self):
+        """Keys that are not columns match inside the metadata JSON."""
+        self.assertEqual(self.store.delete_by_filters({"user_id": "alice", "topic": "food"}), 1)
+        self.assertEqual(self.stored_ids(self.store), [2, 3, 4, 5])
+
+    def test_no_match(self):
+        """A filter that matches nothing deletes nothing."""
+        self.assertEqual(self.store.delete_by_filters({"user_id": "carol"}), 0)
+        self.assertEqual(self.stored_ids(self.store), [1, 2, 3, 4, 5])
+
+    def test_requires_filters(self):
+        """An empty filter is rejected instead of emptying the table."""
+        for filters in (None, {}):
+            with self.assertRaises(ValueError):
+                self.store.delete_by_filters(filters)
+        self.assertEqual(self.stored_ids(self.store), [1, 2, 3, 4, 5])
+
+    def test_clear_memories_uses_scope(self):
+        """StorageAdapter.clear_memories deletes the scoped rows with one statement."""
+        adapter = self.make_adapter()
+        before = adapter.count_all_memories(user_id="alice", agent_id="agent-1")
+
+        with patch.object(self.store, "delete_by_filters", wraps=self.store.delete_by_filters) as delete_by_filters:
+            self.assertTrue(adapter.clear_memories(user_id="alice", agent_id="agent-1"))
+
+        delete_by_filters.assert_called_once_with({"user_id": "alice", "agent_id": "agent-1"})
+        self.store.obvector.delete.assert_not_called()
+        self.assertEqual(before, 2)
+        self.assertEqual(adapter.count_all_memories(user_id="alice"), 1)
+        self.assertEqual(self.stored_ids(self.store), [2, 4, 5])
+
+
+
+class _FilterModel:
+    """Stand-in ORM model exposing only the column names the filter helpers read."""
+    __table__ = SimpleNamespace(c=dict.fromkeys(("id", "user_id", "agent_id", "category", "created_at")))
+
+
+class TestOceanBaseFilterConversion(unittest.TestCase):
+    """check_filters_all_in_columns and convert_filters_to_native_format."""
+
+    def setUp(self):
+        self.util = _REAL_MODULES["powermem.utils.oceanbase_util"].OceanBaseUtil
+
+    def convert(self, filters, model=_FilterModel):
+        return self.util.convert_filters_to_native_format(filters, model)
+
+    def test_operator_handlers(self):
+        """Every operator key maps to its native SEARCH clause."""
+        cases = [
+            ({"eq": "alice"}, {"term": {"user_id": "alice"}}),
+            ({"ne": "alice"}, {"bool": {"must_not": [{"term": {"user_id": "alice"}}]}}),
+            ({"in": ["a", "b"]},
+             {"bool": {"should": [{"term": {"user_id": "a"}}, {"term": {"user_id": "b"}}]}}),
+            ({"nin": ["a", "b"]},
+             {"bool": {"must_not": [
+                 {"bool": {"should": [{"term": {"user_id": "a"}}, {"term": {"user_id": "b"}}]}}
+             ]}}),
+            ({"like": "%ali_ce%"}, {"match": {"user_id": {"query": "ali ce"}}}),
+            ({"ilike": "%Alice%"}, {"match": {"user_id": {"query": "Alice"}}}),
+        ]
+        for value, expected in cases:
+            with self.subTest(op=next(iter(value))):
+                self.assertEqual(self.convert({"user_id": value}), [expected])
+
+    def test_range_and_plain_values(self):
+        """Range keys combine into one range clause; lists and scalars become term queries."""
+        self.assertEqual(
+            self.convert({"created_at": {"gte": "2024-01-01", "lt": "2025-01-01"}}),
+            [{"range": {"created_at": {"gte": "2024-01-01", "lt": "2025-01-01"}}}],
+        )
+        self.assertEqual(
+            self.convert({"created_at": {"gt": 1, "lte": 9}}),
+            [{"range": {"created_at": {"gt": 1, "lte": 9}}}],
+        )
+        self.assertEqual(
+            self.convert({"user_id": ["a", "b"], "category": "food"}),
+            [
+                {"bool": {"should": [{"term": {"user_id": "a"}}, {"term": {"user_id": "b"}}]}},
+                {"term": {"category": "food"}},
+            ],
+        )
+
+    def test_operators_without_a_clause_are_dropped(self):
+        """Empty lists, wildcard-only patterns and None values add no clause."""
+        for value in ({"in": []}, {"nin": []}, {"in": "a"}, {"like": "%%"}, None):
+            with self.subTest(value=value):
+                self.assertEqual(self.convert({"user_id": value}), [])
+
+    def test_first_operator_in_handler_order_wins(self):
+        """With several operators, the handler table's order decides, not the dict's."""
+        self.assertEqual(
+            self.convert({"user_id": {"like": "%x%", "ne": "bob", "eq": "alice"}}),
+            [{"term": {"user_id": "alice"}}],
+        )
+        self.assertEqual(
+            self.convert({"user_id": {"ilike": "%x%", "nin": ["bob"]}}),
+            [{"bool": {"must_not": [{"bool": {"should": [{"term": {"user_id": "bob"}}]}}]}}],
+        )
+
+    def test_nested_and_or(self):
+        """AND becomes bool.filter and OR becomes bool.should, keeping child order."""
+        filters = {"AND": [
+            {"user_id": "alice"},
+            {"OR": [{"agent_id": "a1"}, {"AND": [{"agent_id": "a2"}, {"category": {"ne": "x"}}]}]},
+            {"created_at": {"gte": 1}},
+        ]}
+
+        self.assertEqual(self.convert(filters), [{"bool": {"filter": [
+            {"term": {"user_id": "alice"}},
+            {"bool": {"should": [
+                {"term": {"agent_id": "a1"}},
+                {"bool": {"filter": [
+                    {"term": {"agent_id": "a2"}},
+                    {"bool": {"must_not": [{"term": {"category": "x"}}]}},
+                ]}},
+            ]}},
+            {"range": {"created_at": {"gte": 1}}},
+        ]}}])
+
+    def test_unknown_columns_are_skipped(self):
+        """Non-column keys are dropped, and groups left empty are dropped with them."""
+        filters = {"AND": [
+            {"user_id": "alice"},
+            {"OR": [{"topic": "food"}, {"mood": {"eq": "happy"}}]},
+            {"topic": "travel"},
+        ]}
+
+        self.assertEqual(self.convert(filters), [{"bool": {"filter": [{"term": {"user_id": "alice"}}]}}])
+        self.assertEqual(self.convert({"topic": "food"}), [])
+        self.assertEqual(self.convert({"user_id": "alice"}, model=object), [])
+        self.assertEqual(self.convert(None), [])
+
+    def test_check_filters_all_in_columns(self):
+        """Native search is allowed only when every key at every depth is a column."""
+        check = self.util.check_filters_all_in_columns
+        nested = {"AND": [{"user_id": "alice"}, {"OR": [{"agent_id": "a1"}, {"category": {"in": ["x"]}}]}]}
+
+        self.assertTrue(check(None, _FilterModel))
+        self.assertTrue(check({}, _FilterModel))
+        self.assertTrue(check(nested, _FilterModel))
+        nested["AND"][1]["OR"].append({"AND": [{"topic": "food"}]})
+        self.assertFalse(check(nested, _FilterModel))
+        self.assertFalse(check({"user_id": "alice", "topic": "food"}, _FilterModel))
+        self.assertFalse(check({"user_id": "alice"}, object))
+
+    def test_deep_nesting_does_not_recurse(self):
+        """Both walkers use an explicit stack, so nesting past the recursion limit works."""
+        depth = sys.getrecursionlimit() + 100
+        filters = {"user_id": "alice"}
+        for _ in range(depth):
+            filters = {"AND": [filters]}
+
+        self.assertTrue(self.util.check_filters_all_in_columns(filters, _FilterModel))
+        result = self.convert(filters)
+        for _ in range(depth):
+            (result,) = result
+            result = result["bool"]["filter"]
+        self.assertEqual(result, [{"term": {"user_id": "alice"}}])
+
+
+
+# Shape of a DBMS_HYBRID_SEARCH.SEARCH result: the row's columns plus _score,
+# with legacy string metadata, missing optional columns and a row without a key
+_HYBRID_SEARCH_RESULT = json.dumps([
+    {
+        "id": 766582377714548736,
+        "document": "alice likes green tea",
+        "_score": 0.0327868852,
+        "user_id": "alice",
+        "agent_id": "agent-1",
+        "run_id": "",
+        "actor_id": "",
+        "hash": "5d41402abc4b2a76b9719d911017c592",
+        "created_at": "2025-06-01T10:00:00",
+        "updated_at": "2025-06-02T11:30:00",
+        "category": "preference",
+        "metadata": {"source": "chat", "tags": ["drinks"]},
+        "fulltext_content": "alice likes green tea",
+    },
+    {
+        "id": 766582377714548737,
+        "document": "alice lives in Hangzhou",
+        "_score": 0.0161290323,
+        "user_id": "alice",
+        "metadata": "{\"legacy\": true}",
+    },
+    {"document": "row without a primary key", "_score": 0.01},
+])
+
+_EXPECTED_HITS = [
+    {
+        "vector_id": 766582377714548736,
+        "text_content": "alice likes green tea",
+        "score": 0.0327868852,
+        "user_id": "alice",
+        "agent_id": "agent-1",
+        "run_id": "",
+        "actor_id": "",
+        "hash": "5d41402abc4b2a76b9719d911017c592",
+        "created_at": "2025-06-01T10:00:00",
+        "updated_at": "2025-06-02T11:30:00",
+        "category": "preference",
+        "metadata_json": {"source": "chat", "tags": ["drinks"]},
+    },
+    {
+        "vector_id": 766582377714548737,
+        "text_content": "alice lives in Hangzhou",
+        "score": 0.0161290323,
+        "user_id": "alice",
+        "agent_id": "",
+        "run_id": "",
+        "actor_id": "",
+        "hash": "",
+        "created_at": "",
+        "updated_at": "",
+        "category": "",
+        "metadata_json": '{"legacy": true}',
+    },
+]
+
+
+class TestOceanBaseHybridHits(OceanBaseSQLiteTestCase):
+    """HybridHit and the msgspec decoder behind parse_native_hybrid_results."""
+
+    def setUp(self):
+        super().setUp()
+        from powermem.utils import oceanbase_util
+
+        self.oceanbase_util = oceanbase_util
+        self.parse = oceanbase_util.OceanBaseUtil.parse_native_hybrid_results
+
+    def decode_paths(self):
+        """The msgspec module to patch in for each decode path: installed, then absent."""
+        return (("msgspec", self.oceanbase_util.msgspec), ("json", None))
+
+    def decode_path(self, path, decoder):
+        """Run the block as a subtest with msgspec patched to the given module (or None)."""
+        stack = ExitStack()
+        stack.enter_context(self.subTest(path=path))
+        stack.enter_context(patch.object(self.oceanbase_util, "msgspec", decoder))
+        return stack
+
+    def test_parsed_hits(self):
+        """Attribute access, dict-style access and _asdict() agree on both paths."""
+        self.assertIsNotNone(self.oceanbase_util.msgspec)
+        for path, decoder in self.decode_paths():
+            with self.decode_path(path, decoder):
+                hits = self.parse(_HYBRID_SEARCH_RESULT.encode())
+
+                hit_type = decoder.Struct if decoder else self.oceanbase_util.HybridHit
+                self.assertTrue(all(isinstance(hit, hit_type) for hit in hits))
+                self.assertEqual([hit._asdict() for hit in hits], _EXPECTED_HITS)
+                first = hits[0]
+                self.assertEqual(first.vector_id, 766582377714548736)
+                self.assertEqual(first.score, 0.0327868852)
+                self.assertEqual(first.metadata_json["tags"], ["drinks"])
+                # Dict-style access uses the old dict keys: _score is read into "score"
+                self.assertEqual(first["score"], first.score)
+                self.assertEqual(first["text_content"], "alice likes green tea")
+                with self.assertRaises(KeyError):
+                    first["_score"]
+                with self.assertRaises(KeyError):
+                    first["document"]
+
+    def test_custom_field_names(self):
+        """Primary, text and metadata fields are read from the configured column names."""
+        result = json.dumps([
+            {"memory_id": 7, "content": "renamed", "_score": 0.5, "meta": {"k": "v"}, "id": 99},
+        ])
+        for path, decoder in self.decode_paths():
+            with self.decode_path(path, decoder):
+                (hit,) = self.parse(result, primary_field="memory_id", text_field="content", metadata_field="meta")
+                self.assertEqual((hit.vector_id, hit.text_content, hit.score), (7, "renamed", 0.5))
+                self.assertEqual(hit["metadata_json"], {"k": "v"})
+
+    def test_empty_and_malformed_results(self):
+        """Empty, non-list and invalid payloads all parse to no hits."""
+        for path, decoder in self.decode_paths():
+            with self.decode_path(path, decoder):
+                for result in ("", b"", "[]", '{"error": "index not found"}', "not json"):
+                    self.assertEqual(self.parse(result), [])
+
+    def test_native_hybrid_search_output(self):
+        """The store turns each hit into OutputData, on either decode path."""
+        engine = MagicMock()
+        self.store.obvector.engine = engine
+        conn = engine.connect.return_value.__enter__.return_value
+
+        for path, decoder in self.decode_paths():
+            with self.decode_path(path, decoder):
+                with patch.object(self.oceanbase_util.OceanBaseUtil, "safe_fetchone",
+                                  return_value=(_HYBRID_SEARCH_RESULT,)):
+                    results = self.store._native_hybrid_search(
+                        "green tea", [[0.1, 0.2, 0.3]], limit=5, filters={"user_id": "alice"}
+                    )
+
+                sql, params = conn.execute.call_args.args
+                self.assertIn("DBMS_HYBRID_SEARCH.SEARCH", str(sql))
+                body = json.loads(params["body_str"])
+                self.assertEqual(body["query"]["bool"]["filter"], [{"term": {"user_id": "alice"}}])
+
+                self.assertEqual([r.id for r in results], [766582377714548736, 766582377714548737])
+                self.assertEqual([r.score for r in results], [0.0327868852, 0.0161290323])
+                first, second = (r.payload for r in results)
+                self.assertEqual(first["data"], "alice likes green tea")
+                self.assertEqual(first["category"], "preference")
+                self.assertEqual(first["metadata"], {"source": "chat", "tags": ["drinks"]})
+                # Legacy string metadata is parsed; missing columns default to ""
+                self.assertEqual(second["metadata"], {"legacy": True})
+                self.assertEqual(second["agent_id"], "")
+
+
 if __name__ == '__main__':
     unittest.main()
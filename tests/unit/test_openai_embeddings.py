@@ -0,0 +1,46 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from powermem.integrations.embeddings.config.base import BaseEmbedderConfig
+from powermem.integrations.embeddings.openai import OpenAIEmbedding
+
+
+@pytest.fixture
+def mock_openai_client():
+    with patch("powermem.integrations.embeddings.openai.OpenAI") as mock_openai:
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        yield mock_client
+
+
+def _embedding_data(*items):
+    return Mock(data=[Mock(index=index, embedding=vector) for index, vector in items])
+
+
+def test_embed_batch_single_request(mock_openai_client):
+    config = BaseEmbedderConfig(api_key="test_key", embedding_dims=3)
+    embedder = OpenAIEmbedding(config)
+    # The API may return items out of order; results follow the input order
+    mock_openai_client.embeddings.create.return_value = _embedding_data(
+        (1, [0.4, 0.5, 0.6]), (0, [0.1, 0.2, 0.3])
+    )
+
+    result = embedder.embed_batch(["Hello\nworld", "Second"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world", "Second"], model="text-embedding-3-small", dimensions=3
+    )
+    assert result == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+
+
+def test_embed_batch_splits_large_inputs(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(api_key="test_key"))
+    mock_openai_client.embeddings.create.side_effect = lambda input, **kwargs: _embedding_data(
+        *((i, [float(i)]) for i in range(len(input)))
+    )
+
+    result = embedder.embed_batch(["text"] * 2050)
+
+    assert mock_openai_client.embeddings.create.call_count == 2
+    assert len(result) == 2050
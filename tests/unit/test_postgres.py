@@ -1,5 +1,7 @@
 import importlib
 import sys
+import threading
+import time
 import unittest
 import uuid
 from unittest.mock import MagicMock, patch
@@ -2264,6 +2266,210 @@ class TestPGVector(unittest.TestCase):
             # Verify pool.closeall() was called
             mock_pool.closeall.assert_called()
 
+    def _create_pgvector(self, mock_get_cursor):
+        """Build a store whose _get_cursor yields self.mock_cursor."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.return_value = [("test_collection",)]
+        pgvector = PGVectorStore(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False,
+            minconn=1,
+            maxconn=4
+        )
+        self.mock_cursor.reset_mock()
+        return pgvector
+
+    @patch('powermem.storage.pgvector.pgvector.PSYCOPG_VERSION', 3)
+    @patch('powermem.storage.pgvector.pgvector.ConnectionPool')
+    @patch.object(PGVectorStore, '_get_cursor')
+    def test_existing_collection_gets_payload_indexes(self, mock_get_cursor, mock_connection_pool):
+        """Test that starting on an existing table creates the payload indexes without recreating it."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.return_value = [("test_collection",)]
+
+        with patch.object(PGVectorStore, 'create_col') as mock_create_col:
+            PGVectorStore(
+                dbname="test_db",
+                collection_name="test_collection",
+                embedding_model_dims=3,
+                user="test_user",
+                password="test_pass",
+                host="localhost",
+                port=5432,
+                diskann=False,
+                hnsw=False,
+            )
+
+        mock_create_col.assert_not_called()
+        statements = [" ".join(c.args[0].split()) for c in self.mock_cursor.execute.call_args_list]
+        index_statements = [sql for sql in statements if sql.startswith("CREATE INDEX")]
+        self.assertEqual(index_statements, [
+            "CREATE INDEX IF NOT EXISTS test_collection_user_id_idx ON test_collection ((payload->>'user_id'))",
+            "CREATE INDEX IF NOT EXISTS test_collection_agent_id_idx ON test_collection ((payload->>'agent_id'))",
+            "CREATE INDEX IF NOT EXISTS test_collection_run_id_idx ON test_collection ((payload->>'run_id'))",
+            "CREATE INDEX IF NOT EXISTS test_collection_user_id_agent_id_idx "
+            "ON test_collection ((payload->>'user_id'), (payload->>'agent_id'))",
+        ])
+        self.assertFalse(any("CREATE TABLE" in sql for sql in statements))
+        mock_get_cursor.assert_called_with(commit=True)
+
+    @patch('powermem.storage.pgvector.pgvector.PSYCOPG_VERSION', 3)
+    @patch('powermem.storage.pgvector.pgvector.ConnectionPool')
+    @patch.object(PGVectorStore, '_get_cursor')
+    def test_delete_many_single_statement(self, mock_get_cursor, mock_connection_pool):
+        """Test that delete_many removes every ID with one committed statement."""
+        pgvector = self._create_pgvector(mock_get_cursor)
+        mock_get_cursor.reset_mock()
+
+        pgvector.delete_many((1, 2, 3))
+
+        mock_get_cursor.assert_called_once_with(commit=True)
+        self.mock_cursor.execute.assert_called_once_with(
+            "DELETE FROM test_collection WHERE id = ANY(%s)", ([1, 2, 3],)
+        )
+
+    @patch('powermem.storage.pgvector.pgvector.PSYCOPG_VERSION', 3)
+    @patch('powermem.storage.pgvector.pgvector.ConnectionPool')
+    @patch.object(PGVectorStore, '_get_cursor')
+    def test_delete_many_empty(self, mock_get_cursor, mock_connection_pool):
+        """Test that delete_many with no IDs does not touch the database."""
+        pgvector = self._create_pgvector(mock_get_cursor)
+        mock_get_cursor.reset_mock()
+
+        pgvector.delete_many([])
+
+        mock_get_cursor.assert_not_called()
+        self.mock_cursor.execute.assert_not_called()
+
+    @patch('powermem.storage.pgvector.pgvector.PSYCOPG_VERSION', 3)
+    @patch('powermem.storage.pgvector.pgvector.ConnectionPool')
+    @patch.object(PGVectorStore, '_get_cursor')
+    def test_list_with_after_id(self, mock_get_cursor, mock_connection_pool):
+        """Test that a keyset cursor seeks by id and replaces offset and sorting."""
+        pgvector = self._create_pgvector(mock_get_cursor)
+        self.mock_cursor.fetchall.return_value = [(11, [0.1, 0.2, 0.3], {"user_id": "alice"})]
+
+        results = pgvector.list(
+            filters={"user_id": "alice"}, limit=2, offset=40, order_by="created_at", after_id=10
+        )
+
+        query, params = self.mock_cursor.execute.call_args.args
+        self.assertIn("WHERE payload->>'user_id' = %s AND id > %s", query)
+        self.assertIn("ORDER BY id ASC", query)
+        self.assertNotIn("OFFSET", query)
+        self.assertNotIn("created_at", query)
+        self.assertEqual(params, ("alice", 10, 2))
+        self.assertEqual([r.id for r in results], [11])
+
+    @patch('powermem.storage.pgvector.pgvector.PSYCOPG_VERSION', 3)
+    @patch('powermem.storage.pgvector.pgvector.ConnectionPool')
+    @patch.object(PGVectorStore, '_get_cursor')
+    def test_list_without_after_id_keeps_offset(self, mock_get_cursor, mock_connection_pool):
+        """Test that offset pagination and sorting are unchanged without a cursor."""
+        pgvector = self._create_pgvector(mock_get_cursor)
+        self.mock_cursor.fetchall.return_value = []
+
+        pgvector.list(filters={"user_id": "alice"}, limit=2, offset=40, order_by="created_at", order="asc")
+
+        query, params = self.mock_cursor.execute.call_args.args
+        self.assertNotIn("id >", query)
+        self.assertIn("ORDER BY payload->>'created_at' ASC", query)
+        self.assertIn("OFFSET %s", query)
+        self.assertEqual(params, ("alice", 2, 40))
+
+    @patch('powermem.storage.pgvector.pgvector.PSYCOPG_VERSION', 3)
+    @patch('powermem.storage.pgvector.pgvector.ConnectionPool')
+    @patch.object(PGVectorStore, '_get_cursor')
+    def test_get_many_falls_back_to_get(self, mock_get_cursor, mock_connection_pool):
+        """Test that the default get_many calls get() per ID and drops missing ones."""
+        pgvector = self._create_pgvector(mock_get_cursor)
+        self.mock_cursor.fetchone.side_effect = [
+            (1, [0.1, 0.2, 0.3], {"user_id": "alice"}),
+            None,
+            (3, [0.1, 0.2, 0.3], {"user_id": "bob"}),
+        ]
+
+        results = pgvector.get_many([1, 2, 3])
+
+        self.assertEqual([r.id for r in results], [1, 3])
+        self.assertEqual(results[1].payload, {"user_id": "bob"})
+        self.assertEqual(self.mock_cursor.execute.call_count, 3)
+
+    @patch('powermem.storage.pgvector.pgvector.PSYCOPG_VERSION', 2)
+    def test_add_batch_stays_within_psycopg2_pool(self):
+        """Test that add_batch never checks out more connections than a non-blocking pool holds."""
+        from powermem import Memory
+
+        class ExhaustiblePool:
+            """Mimics ThreadedConnectionPool, which raises instead of waiting when exhausted."""
+
+            def __init__(self, maxconn):
+                self.maxconn = maxconn
+                self.in_use = 0
+                self.peak = 0
+                self._lock = threading.Lock()
+
+            def getconn(self):
+                with self._lock:
+                    if self.in_use >= self.maxconn:
+                        raise RuntimeError("connection pool exhausted")
+                    self.in_use += 1
+                    self.peak = max(self.peak, self.in_use)
+                conn = MagicMock()
+                conn.cursor.return_value.fetchall.return_value = [("test_collection",)]
+                return conn
+
+            def putconn(self, conn):
+                with self._lock:
+                    self.in_use -= 1
+
+            def closeall(self):
+                pass
+
+        def slow_execute_values(cur, query, data):
+            time.sleep(0.01)
+
+        pool = ExhaustiblePool(maxconn=2)
+        pgvector = PGVectorStore(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False,
+            connection_pool=pool,
+        )
+        self.assertEqual(pgvector.max_concurrency, 2)
+
+        items = [{"content": f"fact {i}"} for i in range(6)]
+        with patch('powermem.core.memory.VectorStoreFactory') as mock_vector_factory, \
+             patch('powermem.core.memory.LLMFactory'), \
+             patch('powermem.core.memory.EmbedderFactory') as mock_embedder_factory, \
+             patch('powermem.storage.pgvector.pgvector.execute_values', slow_execute_values, create=True):
+            mock_vector_factory.create.return_value = pgvector
+            mock_embedder_factory.create.return_value.embed_batch.side_effect = lambda texts, **kwargs: [[0.1, 0.2, 0.3]] * len(texts)
+            memory = Memory()
+            outcomes = memory.add_batch(items, user_id="test_user", infer=False)
+
+        self.assertEqual(len(outcomes), len(items))
+        for outcome in outcomes:
+            self.assertNotIn("error", outcome)
+            self.assertEqual(len(outcome["results"]), 1)
+        self.assertLessEqual(pool.peak, pool.maxconn)
+        self.assertEqual(pool.in_use, 0)
+
     def tearDown(self):
         """Clean up after each test."""
         pass